@@ -2,29 +2,88 @@
 Flask web application for Mountain Gorilla Command Center.
 """
 
-from flask import Flask, render_template, jsonify, request, session
+from flask import (
+    Flask, Response, abort, g, render_template, jsonify, request, send_file, session, stream_with_context, url_for
+)
+from werkzeug.security import safe_join
 from mountain_gorilla.bots import (
     MemoriBot, FinanBot, TradeBot, TaskBot, CoachBot
 )
+from mountain_gorilla.bots.storage import BotStorage
 from mountain_gorilla.ai_module import AIModule
+from mountain_gorilla.aggregates import aggregates
+from mountain_gorilla.streaming import EventStreamer, FeedFollower, FleetBridge, MarketFeed, STREAM_TOPICS
+from mountain_gorilla.json_provider import FastJSONProvider
+from mountain_gorilla.assets import DIST_DIR, MAX_AGE, build_assets, encoded_variant, load_manifest
+from mountain_gorilla.metrics import (
+    default_registry as metrics_registry, http_requests, http_latency, http_in_flight, fleet_bots
+)
+from mountain_gorilla.ingest import (
+    BulkError, ingest, iter_body, validate_memory, validate_transaction, validate_task
+)
 from rich.console import Console
 from rich.text import Text
+import os
 import json
+import time
+import gzip
+import base64
+import hashlib
+import mimetypes
+from functools import wraps
+from urllib.parse import urlencode
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 app.secret_key = 'your-secret-key-here'  # Change this in production
 
+# Request metrics, served at /metrics. Registered first so every request is
+# timed, even one whose later before_request hooks fail
+@app.before_request
+def start_request_metrics():
+    g.request_started = time.perf_counter()
+    http_in_flight.inc()
+
+@app.after_request
+def record_request_metrics(response):
+    route = request.url_rule.rule if request.url_rule else 'unmatched'  # bounded label values
+    http_requests.inc(method=request.method, route=route, status=response.status_code)
+    http_latency.observe(time.perf_counter() - g.request_started, method=request.method, route=route)
+    return response
+
+@app.teardown_request
+def finish_request_metrics(exc):
+    # Streamed responses tear down when the stream closes, so open SSE clients count as in flight
+    http_in_flight.dec()  # the registry's flusher thread writes the snapshot shortly after
+
+# Bot state lives in one SQLite file shared by every worker process
+storage = BotStorage(os.environ.get('MGCC_BOT_DB', 'bot_state.db'))
+
 # Initialize bots
 bots = {
-    "MemoriBot": MemoriBot(),
-    "FinanBot": FinanBot(),
-    "TradeBot": TradeBot(),
-    "TaskBot": TaskBot(),
-    "CoachBot": CoachBot()
+    "MemoriBot": MemoriBot(storage=storage),
+    "FinanBot": FinanBot(storage=storage),
+    "TradeBot": TradeBot(storage=storage),
+    "TaskBot": TaskBot(storage=storage),
+    "CoachBot": CoachBot(storage=storage)
 }
 
 # Initialize AI module
-ai_module = AIModule()
+ai_module = AIModule(storage=storage)
+
+# Server-side event stream and the simulated market feed behind it. Under
+# gunicorn one feed process simulates the market and workers follow the
+# state it persists (see gunicorn.conf.py); run alone, the app simulates it.
+event_streamer = EventStreamer()
+market_feed = FeedFollower() if os.environ.get('MGCC_MARKET_FEED') == 'external' else MarketFeed()
+# Bots run in other processes; their persisted statuses and logs become bot.* events here
+fleet_bridge = FleetBridge(aggregates.fleet)
+
+@app.before_request
+def start_feeds():
+    # Runs in each worker (nothing is preloaded); summaries need prices before any stream opens
+    market_feed.start()
+    fleet_bridge.start()
 
 # Register existing bots with AI module
 for name, bot in bots.items():
@@ -34,12 +93,159 @@ for name, bot in bots.items():
         personality=f"Level {bot.level} {name}"
     )
 
+# Encoded responses keyed by URL, reused while the bots they read are unchanged
+MAX_CACHED_RESPONSES = 256
+CACHED_HEADERS = ('Content-Type', 'Link', 'X-Next-Cursor')
+# Cached bodies at least this large also keep a gzipped copy
+GZIP_MIN_BYTES = 1024
+_response_cache = {}
+
+def wants_ndjson():
+    """Whether the client asked for NDJSON (``format=ndjson`` or by Accept)"""
+    return request.args.get('format') == 'ndjson' or request.accept_mimetypes.best == 'application/x-ndjson'
+
+def versioned(owners=None, ndjson=False):
+    """Cache a view's encoded body per URL, keyed by bot state versions.
+
+    ``owners(**view_args)`` names the bots the response depends on (all bots
+    by default). Storage bumps a bot's version on every mutation, in any
+    worker, so a changed version is the only invalidation needed. Responses
+    carry a strong ETag (a hash of the body, so identical in every worker),
+    and a matching If-None-Match is answered with 304 before any work.
+    Large bodies are gzipped once when cached and sent to clients that
+    accept gzip, under their own ETag.
+
+    ``ndjson=True`` marks views that also stream NDJSON when asked to
+    (``wants_ndjson``). Those streams bypass the cache, which only ever
+    holds the JSON body, and both forms carry ``Vary: Accept``.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(**view_args):
+            if ndjson and wants_ndjson():
+                response = app.make_response(view(**view_args))
+                response.vary.add('Accept')
+                return response
+            names = owners(**view_args) if owners else bots
+            versions = storage.versions()
+            version = tuple(versions.get(name, 0) for name in names)
+            key = request.full_path
+            entry = _response_cache.get(key)
+            if entry is None or entry[0] != version:
+                response = app.make_response(view(**view_args))
+                if response.status_code != 200 or response.is_streamed:
+                    return response
+                body = response.get_data()
+                headers = [(k, v) for k, v in response.headers if k in CACHED_HEADERS]
+                compressed = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_BYTES else None
+                entry = (version, hashlib.blake2b(body, digest_size=16).hexdigest(), body, headers, compressed)
+                if len(_response_cache) >= MAX_CACHED_RESPONSES:
+                    _response_cache.clear()
+                _response_cache[key] = entry
+
+            gzipped = entry[4] is not None and request.accept_encodings['gzip'] > 0
+            etag = entry[1] + '-gz' if gzipped else entry[1]
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+            else:
+                response = Response(entry[4] if gzipped else entry[2], headers=entry[3])
+                if gzipped:
+                    response.content_encoding = 'gzip'
+            response.set_etag(etag)
+            if entry[4] is not None:
+                response.vary.add('Accept-Encoding')
+            if ndjson:
+                response.vary.add('Accept')
+            response.headers['Cache-Control'] = 'no-cache'  # always revalidate, usually for a 304
+            return response
+        return wrapper
+    return decorator
+
+# Page sizes for list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(order, item_id):
+    return base64.urlsafe_b64encode(f"{order}:{item_id}".encode()).decode().rstrip('=')
+
+def decode_cursor(cursor, order):
+    """Item id from an opaque cursor; ValueError if malformed or from another sort order"""
+    try:
+        cursor_order, _, item_id = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode().partition(':')
+        item_id = int(item_id)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+    if cursor_order != order:
+        raise ValueError("Cursor does not match sort order")
+    return item_id
+
+def list_items_response(bot, kind, **filters):
+    """One page of a bot's items, filtered and sorted in storage.
+
+    ``limit`` (default 50, max 1000), ``cursor`` and ``order`` (asc/desc by
+    creation) come from the query string. The body stays a JSON array; the
+    next page is linked via the ``Link`` and ``X-Next-Cursor`` headers.
+    ``format=ndjson`` (or ``Accept: application/x-ndjson``) streams every
+    matching item instead, one JSON object per line.
+    """
+    order = request.args.get('order', 'asc')
+    if order not in ('asc', 'desc'):
+        return jsonify({"error": "order must be asc or desc"}), 400
+    filters = {key: value for key, value in filters.items() if value}
+
+    if wants_ndjson():
+        items = bot.iter_items(kind, descending=order == 'desc', **filters)
+        return Response(stream_with_context(app.json.dumps(item) + '\n' for item in items),
+                        mimetype='application/x-ndjson')
+
+    try:
+        limit = min(max(int(request.args.get('limit', DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        cursor = request.args.get('cursor')
+        after = decode_cursor(cursor, order) if cursor else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    items, next_after = bot.page_items(kind, limit, after, order == 'desc', **filters)
+    response = jsonify(items)
+    if next_after is not None:
+        next_cursor = encode_cursor(order, next_after)
+        args = [(k, v) for k, v in request.args.items(multi=True) if k != 'cursor'] + [('cursor', next_cursor)]
+        response.headers['Link'] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
+
+# Fingerprinted CSS/JS; normally prebuilt at deploy (python -m mountain_gorilla.assets)
+try:
+    asset_manifest = build_assets()
+except OSError:  # read-only install: use the deploy-time build as is
+    asset_manifest = load_manifest() or {}
+
+@app.context_processor
+def asset_helpers():
+    return {'asset_url': lambda name: url_for('asset', filename=asset_manifest.get(name, name))}
+
+@app.route('/assets/<path:filename>')
+def asset(filename):
+    """Serve a fingerprinted asset, precompressed when the client accepts it."""
+    path = safe_join(str(DIST_DIR), filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    path, encoding = encoded_variant(path, request.accept_encodings)
+    response = send_file(path, mimetype=mimetypes.guess_type(filename)[0], max_age=MAX_AGE)
+    if encoding:
+        response.content_encoding = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.immutable = True
+    return response
+
 @app.route('/')
+@versioned()
 def index():
-    """Render the main dashboard."""
+    """Render the dashboard shell; assets load separately and stay cached."""
     return render_template('index.html', bots=bots)
 
 @app.route('/api/bots')
+@versioned()
 def list_bots():
     """Get list of all bots and their stats."""
     return jsonify({
@@ -51,19 +257,100 @@ def list_bots():
         for name, bot in bots.items()
     })
 
-@app.route('/api/bots/<bot_name>')
-def get_bot(bot_name):
-    """Get specific bot details."""
-    if bot_name not in bots:
-        return jsonify({"error": "Bot not found"}), 404
-    bot = bots[bot_name]
-    return jsonify({
+def collect_fleet_metrics():
+    fleet_bots.clear()
+    for status, count in aggregates.bot_counts().items():
+        fleet_bots.set(count, status=status)
+
+metrics_registry.add_collector(collect_fleet_metrics)
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics for every worker (request counts, latencies, fleet, storage)."""
+    metrics_registry.flush()
+    return Response(metrics_registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/api/summary')
+def get_summary():
+    """Get fleet and market aggregates (bot counts, portfolio, prices, gas)."""
+    return jsonify(aggregates.summary())
+
+# Sections of /api/dashboard: name -> (storage owners it reads, or None if uncached; builder)
+DASHBOARD_PAGE_SIZE = 20
+DASHBOARD_SECTIONS = {
+    "bots": (list(bots), lambda: {name: bot_details(bot) for name, bot in bots.items()}),
+    "memories": (["MemoriBot"], lambda: bots["MemoriBot"].page_items("memory", DASHBOARD_PAGE_SIZE, descending=True)[0]),
+    "balance": (["FinanBot"], lambda: bots["FinanBot"].get_balance()),
+    "tasks": (["TaskBot"], lambda: bots["TaskBot"].page_items("task", DASHBOARD_PAGE_SIZE, descending=True)[0]),
+    "goals": (["CoachBot"], lambda: bots["CoachBot"].page_items("goal", DASHBOARD_PAGE_SIZE, descending=True)[0]),
+    "collaborations": ([AIModule.STORAGE_OWNER], lambda: ai_module.page_items(
+        "collaboration", DASHBOARD_PAGE_SIZE, descending=True)[0]),
+    "summary": (None, aggregates.summary),  # cached by the aggregates themselves
+    "quote": (None, lambda: {"quote": bots["CoachBot"].get_motivational_quote()}),
+}
+_dashboard_cache = {}
+
+def dashboard_section(name):
+    """A dashboard section, rebuilt only when a bot it reads has changed"""
+    owners, build = DASHBOARD_SECTIONS[name]
+    if owners is None:
+        return build()
+    versions = storage.versions()
+    version = tuple(versions.get(owner, 0) for owner in owners)
+    entry = _dashboard_cache.get(name)
+    if entry is None or entry[0] != version:
+        entry = _dashboard_cache[name] = (version, build())
+    return entry[1]
+
+@app.route('/api/dashboard')
+def get_dashboard():
+    """Get everything the web dashboard shows in one response.
+
+    ``fields`` (comma-separated or repeated) selects sections; all by
+    default. Lists hold the newest 20 items; the per-bot endpoints page
+    through the rest.
+    """
+    fields = [f for value in request.args.getlist('fields') for f in value.split(',') if f] or list(DASHBOARD_SECTIONS)
+    unknown = [f for f in fields if f not in DASHBOARD_SECTIONS]
+    if unknown:
+        return jsonify({"error": f"Unknown fields: {', '.join(unknown)}",
+                        "fields": list(DASHBOARD_SECTIONS)}), 400
+    return jsonify({name: dashboard_section(name) for name in dict.fromkeys(fields)})
+
+@app.route('/api/stream')
+def stream_events():
+    """Stream price, gas, bot status and log events as Server-Sent Events.
+
+    Events arrive batched as JSON arrays in ``batch`` frames. Reconnecting
+    clients resume from the ``Last-Event-ID`` header (or ``last_event_id``);
+    an id this worker cannot resume from gets a ``reset`` frame instead.
+    """
+    topics = [t for t in request.args.get('topics', '').split(',') if t] or STREAM_TOPICS
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or None
+
+    frames = event_streamer.stream(topics, last_event_id)
+    return Response(
+        stream_with_context(frames),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+def bot_details(bot):
+    return {
         "name": bot.name,
         "level": bot.level,
         "abilities": bot.abilities,
         "ascii_art": bot.get_ascii_art(),
         "stats": bot.get_stats()
-    })
+    }
+
+@app.route('/api/bots/<bot_name>')
+@versioned(lambda bot_name: [bot_name])
+def get_bot(bot_name):
+    """Get specific bot details."""
+    if bot_name not in bots:
+        return jsonify({"error": "Bot not found"}), 404
+    return jsonify(bot_details(bots[bot_name]))
 
 @app.route('/api/bots/<bot_name>/train', methods=['POST'])
 def train_bot(bot_name):
@@ -77,13 +364,25 @@ def train_bot(bot_name):
         "new_level": bot.level
     })
 
+def bulk_response(validate, apply):
+    """Ingest a JSON array or NDJSON (``application/x-ndjson``) request body.
+
+    The body is parsed incrementally and validated in one pass; valid items
+    are then written in one storage transaction. The response lists a
+    result (id or error) per item, in request order.
+    """
+    try:
+        result = ingest(iter_body(request.stream, request.mimetype), validate, apply)
+    except BulkError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(result)
+
 # MemoriBot endpoints
 @app.route('/api/bots/MemoriBot/memories', methods=['GET'])
+@versioned(lambda: ["MemoriBot"], ndjson=True)
 def get_memories():
-    """Get all memories from MemoriBot."""
-    bot = bots["MemoriBot"]
-    tags = request.args.getlist('tags')
-    return jsonify(bot.retrieve_memories(tags))
+    """Get memories from MemoriBot, a page at a time, optionally filtered by tags."""
+    return list_items_response(bots["MemoriBot"], "memory", tags=request.args.getlist('tags'))
 
 @app.route('/api/bots/MemoriBot/memories', methods=['POST'])
 def store_memory():
@@ -96,8 +395,14 @@ def store_memory():
     )
     return jsonify({"status": "success"})
 
+@app.route('/api/bots/MemoriBot/memories/bulk', methods=['POST'])
+def store_memories():
+    """Store many memories in MemoriBot at once."""
+    return bulk_response(validate_memory, bots["MemoriBot"].store_memories)
+
 # FinanBot endpoints
 @app.route('/api/bots/FinanBot/balance', methods=['GET'])
+@versioned(lambda: ["FinanBot"])
 def get_balance():
     """Get current balance from FinanBot."""
     bot = bots["FinanBot"]
@@ -117,13 +422,18 @@ def record_transaction():
     )
     return jsonify({"status": "success"})
 
+@app.route('/api/bots/FinanBot/transactions/bulk', methods=['POST'])
+def record_transactions():
+    """Record many transactions in FinanBot at once."""
+    return bulk_response(validate_transaction, bots["FinanBot"].record_transactions)
+
 # TaskBot endpoints
 @app.route('/api/bots/TaskBot/tasks', methods=['GET'])
+@versioned(lambda: ["TaskBot"], ndjson=True)
 def get_tasks():
-    """Get all tasks from TaskBot."""
-    bot = bots["TaskBot"]
-    status = request.args.get('status')
-    return jsonify(bot.get_tasks(status))
+    """Get tasks from TaskBot, a page at a time, optionally filtered by status and priority."""
+    return list_items_response(bots["TaskBot"], "task", status=request.args.get('status'),
+                               priority=request.args.get('priority'))
 
 @app.route('/api/bots/TaskBot/tasks', methods=['POST'])
 def add_task():
@@ -138,13 +448,17 @@ def add_task():
     )
     return jsonify({"status": "success"})
 
+@app.route('/api/bots/TaskBot/tasks/bulk', methods=['POST'])
+def add_tasks():
+    """Add many tasks to TaskBot at once."""
+    return bulk_response(validate_task, bots["TaskBot"].add_tasks)
+
 # CoachBot endpoints
 @app.route('/api/bots/CoachBot/goals', methods=['GET'])
+@versioned(lambda: ["CoachBot"], ndjson=True)
 def get_goals():
-    """Get all goals from CoachBot."""
-    bot = bots["CoachBot"]
-    status = request.args.get('status')
-    return jsonify(bot.get_goals(status))
+    """Get goals from CoachBot, a page at a time, optionally filtered by status."""
+    return list_items_response(bots["CoachBot"], "goal", status=request.args.get('status'))
 
 @app.route('/api/bots/CoachBot/quote', methods=['GET'])
 def get_quote():
@@ -165,6 +479,12 @@ def create_collaboration():
     collaboration = ai_module.create_collaboration(task, required_capabilities)
     return jsonify(collaboration)
 
+@app.route('/api/ai/collaborations', methods=['GET'])
+@versioned(lambda: [AIModule.STORAGE_OWNER], ndjson=True)
+def list_collaborations():
+    """Get collaborations, a page at a time, optionally filtered by status."""
+    return list_items_response(ai_module, "collaboration", status=request.args.get('status'))
+
 @app.route('/api/ai/collaborations/<int:collaboration_id>', methods=['GET'])
 def get_collaboration_status(collaboration_id):
     """Get the status of a collaboration."""
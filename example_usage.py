@@ -5,7 +5,7 @@ Demonstrates the new Silverback-style bot deployment and security features.
 """
 
 import time
-from mountain_gorilla.bot_manager import bot_manager
+from mountain_gorilla.bot_manager import get_bot_manager
 from mountain_gorilla.security import vault_manager, transaction_signer, backup_manager, audit_manager
 from mountain_gorilla.dashboard import create_simple_dashboard
 from rich.console import Console
@@ -16,6 +16,7 @@ def demo_bot_deployment():
     """Demonstrate bot deployment and management"""
     console.print("\n[bold cyan]🤖 Bot Deployment Demo[/bold cyan]")
     console.print("=" * 50)
+    bot_manager = get_bot_manager()
     
     # Deploy a DCA bot
     console.print("[blue]Deploying ETH DCA bot...[/blue]")
@@ -146,4 +147,5 @@ def main():
         console.print("  pip install -r requirements.txt")
 
 if __name__ == "__main__":
+    get_bot_manager().install_shutdown_hooks()
     main() 
\ No newline at end of file
@@ -19,6 +19,7 @@ from rich.style import Style
 from rich.live import Live
 from rich.table import Table
 from mountain_gorilla.cli import mgcc_cli
+from mountain_gorilla.bot_manager import get_bot_manager
 from mountain_gorilla.dashboard import create_simple_dashboard, TerminalDashboard
 
 console = Console()
@@ -234,4 +235,5 @@ def main_menu():
         console.print()
 
 if __name__ == "__main__":
+    get_bot_manager().install_shutdown_hooks()
     main_menu()
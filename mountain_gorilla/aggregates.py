@@ -0,0 +1,105 @@
+"""
+Aggregate Metrics for Mountain Gorilla
+One shared, constant-time summary of the fleet and market state for quick
+summaries, the web API and the dashboard header.
+"""
+
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+from mountain_gorilla.bot_manager import PersistedFleet
+from mountain_gorilla.events import EventBus, event_bus as default_event_bus, PRICE, GAS, PORTFOLIO
+
+class AggregateMetrics:
+    """Latest prices, portfolio totals, gas and bot counts.
+
+    Market figures are folded in from PRICE, GAS and PORTFOLIO events, which
+    are drained lazily on read. Only the newest of each matters, so every
+    topic has its own one-slot queue and a burst on one topic never evicts
+    another's latest event. Bot counts come straight from the fleet
+    snapshot's per-status tallies; by default that is the fleet persisted by
+    the bot processes, not a BotManager in this one. ``summary`` is rebuilt
+    only when either side changed.
+    """
+
+    def __init__(self, fleet=None, event_bus: EventBus = None):
+        self._fleet = fleet
+        self.event_bus = event_bus or default_event_bus
+        self.prices: Dict[str, float] = {}
+        self.total_value: Optional[float] = None
+        self.unrealized_pnl: Optional[float] = None
+        self.daily_pnl: Optional[float] = None
+        self.gas_gwei: Optional[float] = None
+        self.gas_status: Optional[str] = None
+        self.updated_at: Optional[float] = None
+        self.version = 0  # bumped whenever a market figure changes
+        self._subscriptions = [self.event_bus.subscribe(topic, maxsize=1) for topic in (PRICE, GAS, PORTFOLIO)]
+        self._lock = threading.Lock()
+        self._summary: Optional[Dict[str, Any]] = None
+        self._summary_key = None
+
+    @property
+    def fleet(self):
+        # Resolved on first use so importing this module touches no database
+        if self._fleet is None:
+            self._fleet = PersistedFleet()
+        return self._fleet
+
+    def _apply_pending(self):
+        if not any(subscription.pending() for subscription in self._subscriptions):
+            return
+        with self._lock:
+            events = [event for subscription in self._subscriptions for event in subscription.drain()]
+            for event in sorted(events, key=lambda event: event.seq):
+                data = event.data
+                if event.topic == PRICE:
+                    self.prices = data["prices"]
+                elif event.topic == GAS:
+                    self.gas_gwei = data["gwei"]
+                    self.gas_status = data["status"]
+                else:
+                    self.total_value = data["total_value"]
+                    self.unrealized_pnl = data["unrealized_pnl"]
+                    self.daily_pnl = data["daily_pnl"]
+                self.updated_at = event.timestamp
+                self.version += 1
+
+    def bot_counts(self) -> Dict[str, int]:
+        """Bots per status, e.g. {"running": 3, "stopped": 1}"""
+        return dict(self.fleet.snapshot().counts)
+
+    @property
+    def running_bots(self) -> int:
+        return self.fleet.snapshot().counts.get("running", 0)
+
+    def price(self, token: str) -> Optional[float]:
+        self._apply_pending()
+        return self.prices.get(token)
+
+    def summary(self) -> Dict[str, Any]:
+        """Current aggregates as a JSON-ready dict; treat it as read-only"""
+        self._apply_pending()
+        snapshot = self.fleet.snapshot()
+        key = (self.version, snapshot.version)
+        if key != self._summary_key:
+            self._summary = {
+                "bots": {
+                    "total": len(snapshot.statuses),
+                    "running": snapshot.counts.get("running", 0),
+                    "by_status": dict(snapshot.counts),
+                },
+                "portfolio": {
+                    "total_value": self.total_value,
+                    "unrealized_pnl": self.unrealized_pnl,
+                    "daily_pnl": self.daily_pnl,
+                },
+                "prices": dict(self.prices),
+                "gas": {"gwei": self.gas_gwei, "status": self.gas_status},
+                "updated_at": datetime.fromtimestamp(self.updated_at).isoformat() if self.updated_at else None,
+                "version": f"{key[0]}.{key[1]}",
+            }
+            self._summary_key = key
+        return self._summary
+
+# Global aggregate metrics instance
+aggregates = AggregateMetrics()
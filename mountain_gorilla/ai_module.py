@@ -2,16 +2,44 @@
 AI Module for bot collaboration and task management.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import json
 from datetime import datetime
+from mountain_gorilla.bots.storage import BotStorage
 
 class AIModule:
-    def __init__(self):
-        self.conversation_history = []
+    # Owner name for collaborations and messages in bot storage
+    STORAGE_OWNER = "AIModule"
+
+    def __init__(self, storage: BotStorage = None):
+        # Collaborations and messages are shared across worker processes via storage;
+        # registrations are rebuilt identically by every process at startup
+        self.storage = storage or BotStorage()
         self.task_queue = []
         self.bot_capabilities = {}
-        self.active_collaborations = []
+
+    @property
+    def active_collaborations(self) -> List[Dict[str, Any]]:
+        return self.storage.list_items(self.STORAGE_OWNER, "collaboration")
+
+    @property
+    def conversation_history(self) -> List[Dict[str, Any]]:
+        return self.storage.list_items(self.STORAGE_OWNER, "message")
+
+    def _collaboration(self, collaboration_id: int) -> Dict[str, Any]:
+        return self.storage.get_item(self.STORAGE_OWNER, "collaboration", collaboration_id)
+
+    def _messages(self, collaboration_id: int) -> List[Dict[str, Any]]:
+        return self.storage.list_items(self.STORAGE_OWNER, "message", tags=[f"collaboration:{collaboration_id}"])
+
+    def page_items(self, kind: str, limit: int = 50, after: int = None,
+                   descending: bool = False, **filters) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Return one page of ``kind`` items (collaborations or messages) and the id to continue after."""
+        return self.storage.page_items(self.STORAGE_OWNER, kind, limit, after, descending, **filters)
+
+    def iter_items(self, kind: str, descending: bool = False, **filters) -> Iterator[Dict[str, Any]]:
+        """Iterate over all ``kind`` items without loading them at once."""
+        return self.storage.iter_items(self.STORAGE_OWNER, kind, descending=descending, **filters)
 
     def register_bot(self, bot_name: str, capabilities: List[str], personality: str):
         """Register a bot with its capabilities and personality."""
@@ -32,7 +60,6 @@ class AIModule:
             return {'success': False, 'message': 'No suitable bots available'}
 
         collaboration = {
-            'id': len(self.active_collaborations) + 1,
             'task': task,
             'bots': available_bots,
             'status': 'active',
@@ -40,7 +67,9 @@ class AIModule:
             'progress': 0
         }
         
-        self.active_collaborations.append(collaboration)
+        collaboration['id'] = self.storage.add_item(
+            self.STORAGE_OWNER, "collaboration", collaboration, status=collaboration['status']
+        )
         return collaboration
 
     def process_bot_message(self, bot_name: str, message: str, collaboration_id: int = None) -> Dict[str, Any]:
@@ -55,28 +84,32 @@ class AIModule:
             'collaboration_id': collaboration_id
         }
         
-        self.conversation_history.append(message_entry)
-        
-        # If this is part of a collaboration, update progress
-        if collaboration_id:
-            collaboration = next((c for c in self.active_collaborations if c['id'] == collaboration_id), None)
-            if collaboration:
-                collaboration['progress'] += 1
-                if collaboration['progress'] >= len(collaboration['bots']) * 2:  # Each bot contributes twice
-                    collaboration['status'] = 'completed'
+        with self.storage.transaction():
+            tags = [f"collaboration:{collaboration_id}"] if collaboration_id else []
+            self.storage.add_item(self.STORAGE_OWNER, "message", message_entry, tags=tags)
+
+            # If this is part of a collaboration, update progress
+            if collaboration_id:
+                collaboration = self._collaboration(collaboration_id)
+                if collaboration:
+                    collaboration['progress'] += 1
+                    if collaboration['progress'] >= len(collaboration['bots']) * 2:  # Each bot contributes twice
+                        collaboration['status'] = 'completed'
+                    self.storage.update_item(self.STORAGE_OWNER, collaboration_id, collaboration,
+                                             status=collaboration['status'])
 
         return {'success': True, 'message': 'Message processed'}
 
     def get_collaboration_status(self, collaboration_id: int) -> Dict[str, Any]:
         """Get the current status of a collaboration."""
-        collaboration = next((c for c in self.active_collaborations if c['id'] == collaboration_id), None)
+        collaboration = self._collaboration(collaboration_id)
         if not collaboration:
             return {'success': False, 'message': 'Collaboration not found'}
 
         return {
             'success': True,
             'collaboration': collaboration,
-            'conversation': [msg for msg in self.conversation_history if msg['collaboration_id'] == collaboration_id]
+            'conversation': self._messages(collaboration_id)
         }
 
     def get_bot_suggestions(self, task: str) -> List[str]:
@@ -114,11 +147,11 @@ class AIModule:
 
     def get_ai_insights(self, collaboration_id: int) -> Dict[str, Any]:
         """Generate AI-powered insights about a collaboration's performance."""
-        collaboration = next((c for c in self.active_collaborations if c['id'] == collaboration_id), None)
+        collaboration = self._collaboration(collaboration_id)
         if not collaboration:
             return {'success': False, 'message': 'Collaboration not found'}
 
-        messages = [msg for msg in self.conversation_history if msg['collaboration_id'] == collaboration_id]
+        messages = self._messages(collaboration_id)
         
         insights = {
             'collaboration_id': collaboration_id,
@@ -0,0 +1,96 @@
+"""
+Static Asset Pipeline for Mountain Gorilla
+Fingerprints the web dashboard's CSS and JavaScript and precompresses them
+(gzip, plus brotli when installed) so they can be served with far-future
+cache headers. Run ``python -m mountain_gorilla.assets`` at deploy time.
+"""
+
+import os
+import sys
+import json
+import gzip
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are built
+    brotli = None
+
+# Sources live in static/, builds go to static/dist/
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+DIST_DIR = STATIC_DIR / "dist"
+MANIFEST = "manifest.json"
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+COMPRESSIBLE = (".css", ".js", ".svg", ".json", ".txt", ".html")
+# Smaller files are not worth a compressed variant
+MIN_COMPRESS_BYTES = 512
+# One year; fingerprinted names never change content
+MAX_AGE = 365 * 24 * 3600
+
+def fingerprint(name: str, content: bytes) -> str:
+    """``css/app.css`` -> ``css/app.<hash>.css``"""
+    digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{digest}{ext}"
+
+def _write(path: Path, data: bytes):
+    """Write atomically, so concurrent builds in several workers are safe"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+def _variants(content: bytes) -> Dict[str, bytes]:
+    variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(content, quality=11)
+    return variants
+
+def build_assets(source_dir: Path = STATIC_DIR, out_dir: Path = DIST_DIR) -> Dict[str, str]:
+    """Fingerprint every file under ``source_dir`` into ``out_dir``.
+
+    Each compressible file also gets ``.gz`` (and ``.br``) siblings, kept
+    only when smaller than the original. Returns and writes the manifest
+    mapping source names to fingerprinted names. Up-to-date outputs are
+    left alone, so this is cheap to call on every start; older builds are
+    kept for pages still cached with their URLs.
+    """
+    source_dir, out_dir = Path(source_dir), Path(out_dir)
+    manifest = {}
+    for path in sorted(source_dir.rglob("*")):
+        if not path.is_file() or out_dir in path.parents or path.name.startswith("."):
+            continue
+        name = path.relative_to(source_dir).as_posix()
+        content = path.read_bytes()
+        manifest[name] = fingerprint(name, content)
+        target = out_dir / manifest[name]
+        if target.exists():
+            continue
+        if path.suffix in COMPRESSIBLE and len(content) >= MIN_COMPRESS_BYTES:
+            for suffix, data in _variants(content).items():
+                if len(data) < len(content):
+                    _write(target.with_name(target.name + suffix), data)
+        _write(target, content)  # last, so its presence means the variants exist
+    _write(out_dir / MANIFEST, json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return manifest
+
+def load_manifest(out_dir: Path = DIST_DIR) -> Optional[Dict[str, str]]:
+    try:
+        return json.loads((Path(out_dir) / MANIFEST).read_text())
+    except (OSError, ValueError):
+        return None
+
+def encoded_variant(path: str, accept_encodings) -> tuple:
+    """Best precompressed file for a request: ``(path, content_encoding or None)``"""
+    for encoding, suffix in ENCODINGS:
+        if accept_encodings[encoding] > 0 and os.path.isfile(path + suffix):
+            return path + suffix, encoding
+    return path, None
+
+if __name__ == "__main__":
+    built = build_assets()
+    encodings = "gzip, brotli" if brotli is not None else "gzip (brotli not installed)"
+    print(f"Built {len(built)} assets into {DIST_DIR} with {encodings}", file=sys.stderr)
@@ -3,13 +3,17 @@ Silverback-style Bot Deployment Layer for Mountain Gorilla
 Manages bot lifecycle, deployment, monitoring, and configuration.
 """
 
+import os
 import json
 import time
+import atexit
+import signal
 import threading
 import sqlite3
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
+from dataclasses import dataclass, asdict, field, replace
 from pathlib import Path
 import click
 from rich.console import Console
@@ -20,9 +24,26 @@ from rich.layout import Layout
 from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.align import Align
+from mountain_gorilla.events import EventBus, event_bus as default_event_bus, BOT_STATUS, BOT_TRADE, BOT_LOG
+from mountain_gorilla.dca import DCAEngine, DCAAllocation
+from mountain_gorilla.bots.storage import run_blocking
+from mountain_gorilla.gas import gas_analytics
 
 console = Console()
 
+# Pending log rows are written in one transaction once this many accumulate
+LOG_BATCH_SIZE = 64
+# ...or once they are this many seconds old, whichever comes first
+FLUSH_INTERVAL = 1.0
+# Upper bound on how long shutdown() waits for in-flight strategy runs
+SHUTDOWN_TIMEOUT = 10.0
+# Fleet database read by processes that only report on the fleet (the web API)
+FLEET_DB_PATH = os.environ.get("MGCC_FLEET_DB", "bots.db")
+# PersistedFleet re-reads the database at most this often
+FLEET_REFRESH_INTERVAL = 1.0
+# Most log rows PersistedFleet.new_logs returns per database in one call
+LOG_TAIL_BATCH = 500
+
 @dataclass
 class BotConfig:
     """Configuration for a trading bot"""
@@ -44,37 +65,184 @@ class BotConfig:
         if self.created_at is None:
             self.created_at = datetime.now().isoformat()
 
-@dataclass
+@dataclass(frozen=True)
 class BotStatus:
-    """Current status of a bot"""
+    """Current status of a bot (immutable; publish a new record to change it)"""
     name: str
     status: str  # running, paused, stopped, error
     last_execution: str
     total_trades: int = 0
     pnl: float = 0.0
-    current_position: Dict[str, float] = None
+    current_position: Dict[str, float] = field(default_factory=dict)
     error_message: str = None
+
+@dataclass(frozen=True)
+class FleetSnapshot:
+    """Consistent point-in-time view of every bot status"""
+    version: int
+    statuses: Mapping[str, BotStatus]
+    counts: Mapping[str, int] = field(default_factory=lambda: MappingProxyType({}))  # bots per status
     
-    def __post_init__(self):
-        if self.current_position is None:
-            self.current_position = {}
+    @classmethod
+    def build(cls, version: int, statuses: Mapping[str, BotStatus]) -> "FleetSnapshot":
+        """Snapshot with per-status counts tallied from scratch"""
+        counts: Dict[str, int] = {}
+        for status in statuses.values():
+            counts[status.status] = counts.get(status.status, 0) + 1
+        return cls(version, MappingProxyType(dict(statuses)), MappingProxyType(counts))
+
+def _recount(counts: Mapping[str, int], removed: Optional[str], added: Optional[str]) -> Mapping[str, int]:
+    """Per-status counts after one bot moves from ``removed`` to ``added``"""
+    if removed == added:
+        return counts
+    counts = dict(counts)
+    if removed is not None:
+        counts[removed] -= 1
+        if not counts[removed]:
+            del counts[removed]
+    if added is not None:
+        counts[added] = counts.get(added, 0) + 1
+    return MappingProxyType(counts)
+
+def build_bot_table(bots: Mapping[str, BotConfig], statuses: Mapping[str, BotStatus]) -> Table:
+    """Build the fleet overview table shown by ``list_bots``"""
+    table = Table(title="🦍 Mountain Gorilla Bots")
+    table.add_column("Name", style="cyan", no_wrap=True)
+    table.add_column("Strategy", style="magenta")
+    table.add_column("Status", style="green")
+    table.add_column("Risk Level", style="yellow")
+    table.add_column("Last Execution", style="blue")
+    table.add_column("Total Trades", style="white")
+    table.add_column("PnL", style="red")
+    
+    for name, config in bots.items():
+        status = statuses.get(name, BotStatus(name, "unknown", ""))
+        status_color = {
+            "running": "green",
+            "paused": "yellow", 
+            "stopped": "red",
+            "error": "red"
+        }.get(status.status, "white")
+        
+        table.add_row(
+            name,
+            config.strategy,
+            f"[{status_color}]{status.status}[/{status_color}]",
+            config.risk_level,
+            status.last_execution[:19] if status.last_execution else "Never",
+            str(status.total_trades),
+            f"${status.pnl:.2f}"
+        )
+    
+    return table
+
+def build_log_table(name: str, logs: List[Dict[str, Any]]) -> Table:
+    """Build the log table shown by ``show_bot_logs``"""
+    table = Table(title=f"📋 Logs for {name}")
+    table.add_column("Timestamp", style="cyan")
+    table.add_column("Action", style="magenta")
+    table.add_column("Details", style="white")
+    
+    for log in logs:
+        table.add_row(
+            log["timestamp"][:19],
+            log["action"],
+            log["details"] or ""
+        )
+    
+    return table
 
 class BotManager:
     """Manages bot deployment, lifecycle, and monitoring"""
     
-    def __init__(self, db_path: str = "bots.db"):
+    def __init__(self, db_path: str = "bots.db", event_bus: EventBus = None):
         self.db_path = db_path
+        self.event_bus = event_bus or default_event_bus
         self.bots: Dict[str, BotConfig] = {}
-        self.statuses: Dict[str, BotStatus] = {}
+        self._snapshot = FleetSnapshot(version=0, statuses=MappingProxyType({}))
+        self._status_lock = threading.Lock()  # serializes writers only
+        self._dirty_statuses = set()
         self.running_bots: Dict[str, threading.Thread] = {}
+        self._stop_events: Dict[str, threading.Event] = {}
+        self._pending_logs: List[tuple] = []
+        self._write_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._inflight = 0
+        self._inflight_cond = threading.Condition()
+        self._shutting_down = threading.Event()
+        self._closed = False
+        self._hooks_installed = False
+        # Buys from every DCA bot are bucketed and executed together
+        self.dca_engine = DCAEngine(on_fill=self._apply_dca_fill, event_bus=self.event_bus)
         self._init_database()
         self._load_bots()
     
+    @property
+    def statuses(self) -> Mapping[str, BotStatus]:
+        """Read-only mapping of the latest published bot statuses"""
+        return self._snapshot.statuses
+    
+    def snapshot(self) -> FleetSnapshot:
+        """Return the current fleet snapshot without taking any lock.
+        
+        Snapshots are never mutated after publication, so callers can iterate
+        them freely while bot threads keep publishing new ones.
+        """
+        return self._snapshot
+    
+    def _publish_status(self, status: BotStatus) -> BotStatus:
+        """Copy-on-write publish of a bot status record"""
+        with self._status_lock:
+            self._swap_in(status)
+        self._ensure_flusher()
+        self.event_bus.publish(BOT_STATUS, bot=status.name, status=status)
+        return status
+    
+    def _update_status(self, name: str, trades_delta: int = 0, **changes) -> BotStatus:
+        """Publish a new status record for a bot derived from the current one"""
+        with self._status_lock:
+            current = self._snapshot.statuses[name]
+            if trades_delta:
+                changes["total_trades"] = current.total_trades + trades_delta
+            status = replace(current, **changes)
+            self._swap_in(status)
+        self._ensure_flusher()
+        self.event_bus.publish(BOT_STATUS, bot=name, status=status)
+        return status
+    
+    def _swap_in(self, status: BotStatus):
+        """Install a new snapshot containing ``status`` (caller holds the writer lock)"""
+        statuses = dict(self._snapshot.statuses)
+        previous = statuses.get(status.name)
+        statuses[status.name] = status
+        self._dirty_statuses.add(status.name)
+        self._snapshot = FleetSnapshot(
+            version=self._snapshot.version + 1,
+            statuses=MappingProxyType(statuses),
+            counts=_recount(self._snapshot.counts, previous and previous.status, status.status)
+        )
+    
+    def _remove_status(self, name: str):
+        """Publish a snapshot without ``name``"""
+        with self._status_lock:
+            statuses = dict(self._snapshot.statuses)
+            previous = statuses.pop(name, None)
+            self._dirty_statuses.discard(name)
+            self._snapshot = FleetSnapshot(
+                version=self._snapshot.version + 1,
+                statuses=MappingProxyType(statuses),
+                counts=_recount(self._snapshot.counts, previous and previous.status, None)
+            )
+    
     def _init_database(self):
         """Initialize SQLite database for bot storage"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
+        # WAL lets readers proceed while the batched writer commits
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Bot configurations table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS bots (
@@ -96,6 +264,19 @@ class BotManager:
             )
         ''')
         
+        # Last persisted status per bot, written alongside its logs
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bot_status (
+                name TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                last_execution TEXT,
+                total_trades INTEGER NOT NULL DEFAULT 0,
+                pnl REAL NOT NULL DEFAULT 0.0,
+                error_message TEXT,
+                FOREIGN KEY (name) REFERENCES bots (name)
+            )
+        ''')
+        
         # Market data table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS market_data (
@@ -113,18 +294,27 @@ class BotManager:
         """Load existing bots from database"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        cursor.execute("SELECT name, config FROM bots")
+        cursor.execute('''
+            SELECT b.name, b.config, s.last_execution, s.total_trades, s.pnl
+            FROM bots b LEFT JOIN bot_status s ON s.name = b.name
+        ''')
         
-        for name, config_json in cursor.fetchall():
+        statuses = dict(self._snapshot.statuses)
+        for name, config_json, last_execution, total_trades, pnl in cursor.fetchall():
             config_data = json.loads(config_json)
             self.bots[name] = BotConfig(**config_data)
-            self.statuses[name] = BotStatus(
+            # Threads never survive a restart, so every bot comes back stopped
+            statuses[name] = BotStatus(
                 name=name,
                 status="stopped",
-                last_execution=datetime.now().isoformat()
+                last_execution=last_execution or datetime.now().isoformat(),
+                total_trades=total_trades or 0,
+                pnl=pnl or 0.0
             )
         
         conn.close()
+        with self._status_lock:
+            self._snapshot = FleetSnapshot.build(self._snapshot.version + 1, statuses)
     
     def deploy_bot(self, name: str, strategy: str, **kwargs) -> bool:
         """Deploy a new bot with specified strategy"""
@@ -134,11 +324,11 @@ class BotManager:
         
         config = BotConfig(name=name, strategy=strategy, **kwargs)
         self.bots[name] = config
-        self.statuses[name] = BotStatus(
+        self._publish_status(BotStatus(
             name=name,
             status="stopped",
             last_execution=datetime.now().isoformat()
-        )
+        ))
         
         # Save to database
         conn = sqlite3.connect(self.db_path)
@@ -160,6 +350,10 @@ class BotManager:
             console.print(f"[red]Bot '{name}' not found![/red]")
             return False
         
+        if self._shutting_down.is_set():
+            console.print(f"[red]Bot manager is shutting down, not starting '{name}'![/red]")
+            return False
+        
         if name in self.running_bots and self.running_bots[name].is_alive():
             console.print(f"[yellow]Bot '{name}' is already running![/yellow]")
             return False
@@ -170,6 +364,8 @@ class BotManager:
             return False
         
         # Start bot thread
+        self._update_status(name, status="running")
+        self._stop_events[name] = threading.Event()
         bot_thread = threading.Thread(
             target=self._run_bot,
             args=(name,),
@@ -177,7 +373,6 @@ class BotManager:
         )
         bot_thread.start()
         self.running_bots[name] = bot_thread
-        self.statuses[name].status = "running"
         
         self._log_action(name, "started", "Bot execution started")
         console.print(f"[green]Bot '{name}' started successfully![/green]")
@@ -190,10 +385,10 @@ class BotManager:
             return False
         
         if name in self.running_bots:
-            # In a real implementation, you'd have a stop flag
+            self._stop_events[name].set()
             self.running_bots.pop(name, None)
         
-        self.statuses[name].status = "stopped"
+        self._update_status(name, status="stopped")
         self._log_action(name, "stopped", "Bot execution stopped")
         console.print(f"[yellow]Bot '{name}' stopped![/yellow]")
         return True
@@ -204,7 +399,7 @@ class BotManager:
             console.print(f"[red]Bot '{name}' not found![/red]")
             return False
         
-        self.statuses[name].status = "paused"
+        self._update_status(name, status="paused")
         self._log_action(name, "paused", "Bot execution paused")
         console.print(f"[yellow]Bot '{name}' paused![/yellow]")
         return True
@@ -216,7 +411,7 @@ class BotManager:
             return False
         
         if self.statuses[name].status == "paused":
-            self.statuses[name].status = "running"
+            self._update_status(name, status="running")
             self._log_action(name, "resumed", "Bot execution resumed")
             console.print(f"[green]Bot '{name}' resumed![/green]")
             return True
@@ -230,38 +425,77 @@ class BotManager:
             console.print("[yellow]No bots deployed yet![/yellow]")
             return
         
-        table = Table(title="🦍 Mountain Gorilla Bots")
-        table.add_column("Name", style="cyan", no_wrap=True)
-        table.add_column("Strategy", style="magenta")
-        table.add_column("Status", style="green")
-        table.add_column("Risk Level", style="yellow")
-        table.add_column("Last Execution", style="blue")
-        table.add_column("Total Trades", style="white")
-        table.add_column("PnL", style="red")
-        
-        for name, config in self.bots.items():
-            status = self.statuses.get(name, BotStatus(name, "unknown", ""))
-            status_color = {
-                "running": "green",
-                "paused": "yellow", 
-                "stopped": "red",
-                "error": "red"
-            }.get(status.status, "white")
-            
-            table.add_row(
-                name,
-                config.strategy,
-                f"[{status_color}]{status.status}[/{status_color}]",
-                config.risk_level,
-                status.last_execution[:19] if status.last_execution else "Never",
-                str(status.total_trades),
-                f"${status.pnl:.2f}"
-            )
+        console.print(build_bot_table(dict(self.bots), self.snapshot().statuses))
+    
+    def release_bot(self, name: str, timeout: float = SHUTDOWN_TIMEOUT) -> Optional[Dict[str, Any]]:
+        """Stop a bot and hand it off, removing it from this manager.
+        
+        Returns the bot's config, last status and whether it was running, in
+        the form accepted by ``adopt_bot``. Execution logs stay behind. A bot
+        whose run does not finish within ``timeout`` stays here, stopped,
+        and None is returned.
+        """
+        if name not in self.bots:
+            return None
+        
+        was_running = self.statuses[name].status == "running"
+        thread = self.running_bots.pop(name, None)
+        if thread is not None:
+            self._stop_events[name].set()
+            self._update_status(name, status="stopped")
+            thread.join(timeout)
+            if thread.is_alive():
+                self.running_bots[name] = thread
+                console.print(f"[red]Bot '{name}' is still finishing a run; not released[/red]")
+                return None
+        cancelled = self.dca_engine.cancel(name)
+        if cancelled:
+            self._log_action(name, "dca_cancelled", f"Cancelled {cancelled} ETH of unfilled DCA buys")
+        
+        self._log_action(name, "released", "Handed off to another manager")
+        self.flush()
+        config = self.bots.pop(name)
+        status = self.statuses[name]
+        self._remove_status(name)
+        self._stop_events.pop(name, None)
         
-        console.print(table)
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("DELETE FROM bots WHERE name = ?", (name,))
+            conn.execute("DELETE FROM bot_status WHERE name = ?", (name,))
+        conn.close()
+        
+        return {"config": asdict(config), "status": asdict(status), "running": was_running}
+    
+    def adopt_bot(self, record: Dict[str, Any]) -> bool:
+        """Take over a bot handed off by ``release_bot``"""
+        config = BotConfig(**record["config"])
+        if config.name in self.bots:
+            return False
+        
+        status = BotStatus(**dict(record["status"], status="stopped"))
+        # Persist first: if this fails nothing was adopted and the caller can hand the bot back
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO bots (name, config, created_at) VALUES (?, ?, ?)",
+                    (config.name, json.dumps(asdict(config)), config.created_at)
+                )
+        finally:
+            conn.close()
+        self.bots[config.name] = config
+        self._publish_status(status)
+        self._log_action(config.name, "adopted", "Taken over from another manager")
+        
+        # Adopted even if it fails to restart; start_bot reports why
+        if record.get("running"):
+            self.start_bot(config.name)
+        return True
     
     def get_bot_logs(self, name: str, limit: int = 50) -> List[Dict]:
         """Get execution logs for a specific bot"""
+        self.flush()
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute(
@@ -291,17 +525,7 @@ class BotManager:
             console.print(f"[yellow]No logs found for bot '{name}'[/yellow]")
             return
         
-        table = Table(title=f"📋 Logs for {name}")
-        table.add_column("Timestamp", style="cyan")
-        table.add_column("Action", style="magenta")
-        table.add_column("Details", style="white")
-        
-        for log in logs:
-            table.add_row(
-                log["timestamp"][:19],
-                log["action"],
-                log["details"] or ""
-            )
+        table = build_log_table(name, logs)
         
         console.print(table)
     
@@ -355,7 +579,7 @@ class BotManager:
             "market_conditions": {
                 "volatility": "medium",
                 "trend": "bullish",
-                "gas_fees": "low"
+                "gas_fees": gas_analytics.status()
             }
         }
         
@@ -388,9 +612,13 @@ class BotManager:
     def _run_bot(self, name: str):
         """Internal method to run bot logic"""
         config = self.bots[name]
-        status = self.statuses[name]
+        stop_event = self._stop_events[name]
         
-        while status.status == "running":
+        while self.statuses[name].status == "running" and not stop_event.is_set():
+            with self._inflight_cond:
+                if self._shutting_down.is_set():
+                    break
+                self._inflight += 1
             try:
                 # Simulate bot execution
                 if config.strategy == "eth-dca":
@@ -400,43 +628,319 @@ class BotManager:
                 else:
                     self._execute_generic_strategy(name, config)
                 
-                status.last_execution = datetime.now().isoformat()
-                time.sleep(60)  # Check every minute
+                self._update_status(name, last_execution=datetime.now().isoformat())
                 
             except Exception as e:
-                status.status = "error"
-                status.error_message = str(e)
+                self._update_status(name, status="error", error_message=str(e))
                 self._log_action(name, "error", str(e))
                 break
+            finally:
+                with self._inflight_cond:
+                    self._inflight -= 1
+                    self._inflight_cond.notify_all()
+            
+            stop_event.wait(60)  # Check every minute, wake early on stop
     
     def _execute_dca_strategy(self, name: str, config: BotConfig):
-        """Execute Dollar Cost Averaging strategy"""
-        # Simulate DCA execution
+        """Schedule this tick's buy with the shared DCA engine"""
         amount = config.max_position_size * 0.1  # 10% of max position
-        self._log_action(name, "dca_execution", f"Bought {amount} ETH at market price")
-        self.statuses[name].total_trades += 1
+        bucket = self.dca_engine.submit(name, "ETH", amount)
+        if not self._shutting_down.is_set():
+            self.dca_engine.start()  # shutdown stops it, then flushes this bucket itself
+        self._log_action(name, "dca_scheduled", f"Queued {amount} ETH buy for bucket {bucket}")
+    
+    def _apply_dca_fill(self, allocation: DCAAllocation):
+        """Book a bot's share of an aggregate DCA fill"""
+        if allocation.bot not in self.statuses:
+            return
+        
+        position = dict(self.statuses[allocation.bot].current_position)
+        position[allocation.token] = position.get(allocation.token, 0.0) + float(allocation.amount)
+        self._update_status(allocation.bot, current_position=position)
+        self._record_trade(
+            allocation.bot,
+            "dca_execution",
+            f"Bought {allocation.amount} {allocation.token} at {allocation.price} "
+            f"(gas share {allocation.fee} ETH)",
+            token=allocation.token,
+            side="buy",
+            amount=allocation.amount,
+            price=allocation.price,
+            fee=allocation.fee
+        )
     
     def _execute_momentum_strategy(self, name: str, config: BotConfig):
         """Execute momentum trading strategy"""
         # Simulate momentum analysis and execution
-        self._log_action(name, "momentum_analysis", "Analyzing price momentum")
-        self.statuses[name].total_trades += 1
+        self._record_trade(name, "momentum_analysis", "Analyzing price momentum")
     
     def _execute_generic_strategy(self, name: str, config: BotConfig):
         """Execute generic strategy"""
-        self._log_action(name, "strategy_execution", f"Executing {config.strategy}")
-        self.statuses[name].total_trades += 1
+        self._record_trade(name, "strategy_execution", f"Executing {config.strategy}")
+    
+    def _record_trade(self, name: str, action: str, details: str, **trade):
+        """Log a trade, bump the bot's trade count and publish a trade event"""
+        self._log_action(name, action, details)
+        self._update_status(name, trades_delta=1)
+        self.event_bus.publish(BOT_TRADE, bot=name, action=action, details=details, **trade)
     
     def _log_action(self, bot_name: str, action: str, details: str = None):
-        """Log bot action to database"""
+        """Queue a bot action for the next batched database write"""
+        timestamp = datetime.now().isoformat()
+        with self._write_lock:
+            self._pending_logs.append((bot_name, timestamp, action, details))
+            should_flush = len(self._pending_logs) >= LOG_BATCH_SIZE
+        self.event_bus.publish(BOT_LOG, bot=bot_name, timestamp=timestamp, action=action, details=details)
+        self._ensure_flusher()
+        if should_flush:
+            self._flush_requested.set()
+    
+    def _ensure_flusher(self):
+        """Start the background writer on the first pending change"""
+        if self._flusher is not None or self._closed:
+            return
+        with self._write_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name="bot-log-flusher", daemon=True)
+                self._flusher.start()
+    
+    def _flush_loop(self):
+        """Write pending changes every FLUSH_INTERVAL, or sooner when a batch fills up"""
+        while not self._shutting_down.is_set():
+            self._flush_requested.wait(FLUSH_INTERVAL)
+            self._flush_requested.clear()
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                console.print(f"[red]Failed to write bot logs (will retry): {e}[/red]")
+    
+    def flush(self) -> None:
+        """Write pending logs and changed statuses in a single transaction"""
+        with self._write_lock:
+            with self._status_lock:
+                dirty, self._dirty_statuses = self._dirty_statuses, set()
+                statuses = self._snapshot.statuses
+            logs, self._pending_logs = self._pending_logs, []
+            if not logs and not dirty:
+                return
+            
+            rows = [
+                (s.name, s.status, s.last_execution, s.total_trades, s.pnl, s.error_message)
+                for s in (statuses[name] for name in dirty if name in statuses)
+            ]
+            conn = sqlite3.connect(self.db_path)
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO bot_logs (bot_name, timestamp, action, details) VALUES (?, ?, ?, ?)",
+                        logs
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO bot_status "
+                        "(name, status, last_execution, total_trades, pnl, error_message) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+            except sqlite3.Error:
+                # Keep the batch so a later flush can retry it
+                self._pending_logs[:0] = logs
+                with self._status_lock:
+                    self._dirty_statuses |= dirty
+                raise
+            finally:
+                conn.close()
+    
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> bool:
+        """Drain the fleet, flush pending writes and checkpoint the database.
+        
+        New runs stop being scheduled immediately; in-flight runs get until
+        ``timeout`` seconds to finish. Returns True if they all drained in time.
+        Safe to call more than once.
+        """
+        with self._inflight_cond:
+            if self._closed:
+                return True
+            self._closed = True
+            self._shutting_down.set()
+        
+        deadline = time.monotonic() + timeout
+        self._flush_requested.set()  # wake the writer so it sees the shutdown
+        for event in self._stop_events.values():
+            event.set()
+        
+        drained = True
+        with self._inflight_cond:
+            while self._inflight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    drained = False
+                    break
+                self._inflight_cond.wait(remaining)
+        
+        for thread in list(self.running_bots.values()):
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self.running_bots.clear()
+        
+        # Drained runs can no longer submit, so stop the flusher and execute
+        # whatever they left in open buckets
+        self.dca_engine.stop(max(0.0, deadline - time.monotonic()))
+        try:
+            self.dca_engine.flush()
+        except Exception as e:
+            for name, amount in self.dca_engine.pending_by_bot().items():
+                self._log_action(name, "dca_unfilled", f"Shutdown left {amount} ETH of DCA buys unfilled: {e}")
+            console.print(f"[red]Failed to execute pending DCA buys at shutdown: {e}[/red]")
+        
+        for name, status in self.statuses.items():
+            if status.status in ("running", "paused"):
+                self._update_status(name, status="stopped")
+                self._log_action(name, "shutdown", "Stopped by fleet shutdown")
+        
+        self.flush()
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO bot_logs (bot_name, timestamp, action, details) VALUES (?, ?, ?, ?)",
-            (bot_name, datetime.now().isoformat(), action, details)
-        )
-        conn.commit()
-        conn.close()
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+        return drained
+    
+    def install_shutdown_hooks(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """Run shutdown() at interpreter exit, which SIGTERM triggers (once per manager)"""
+        if self._hooks_installed:
+            return
+        self._hooks_installed = True
+        atexit.register(self.shutdown, timeout)
+        
+        # Signal handlers can only be installed from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return
+        
+        previous = signal.getsignal(signal.SIGTERM)
+        
+        def _handle_sigterm(signum, frame):
+            # Shutting down here could deadlock on a lock the interrupted main
+            # thread holds; exiting unwinds it first and the atexit hook drains
+            if callable(previous):
+                previous(signum, frame)
+            raise SystemExit(128 + signum)
+        
+        signal.signal(signal.SIGTERM, _handle_sigterm)
+
+class PersistedFleet:
+    """Read-only fleet view over the statuses bot processes persist.
+
+    Processes that report on the fleet without running it (the web API)
+    use this instead of a BotManager of their own, whose bots would never
+    run. It reads ``db_path`` and any shard databases next to it (see
+    ``sharding.shard_db_path``), never creates them, and re-reads at most
+    every FLEET_REFRESH_INTERVAL seconds; ``snapshot`` has the same shape
+    as ``BotManager.snapshot`` and its version only moves when a status did.
+    ``new_logs`` tails the execution logs the bot processes write. Both
+    query SQLite through ``run_blocking`` so a gevent worker keeps serving.
+    """
+    
+    def __init__(self, db_path: str = FLEET_DB_PATH, refresh_interval: float = FLEET_REFRESH_INTERVAL):
+        self.db_path = db_path
+        self.refresh_interval = refresh_interval
+        self._snapshot = FleetSnapshot(version=0, statuses=MappingProxyType({}))
+        self._read_at: Optional[float] = None
+        self._log_ids: Dict[str, int] = {}  # last bot_logs id seen per database
+        self._lock = threading.Lock()
+    
+    def _paths(self) -> List[Path]:
+        path = Path(self.db_path)
+        shards = sorted(path.parent.glob(f"{path.stem}.shard*{path.suffix or '.db'}"))
+        return [p for p in [path, *shards] if p.exists()]
+    
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection:
+        return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    
+    def _read(self) -> Dict[str, BotStatus]:
+        statuses = {}
+        for path in self._paths():
+            try:
+                conn = self._connect(path)
+                try:
+                    rows = conn.execute('''
+                        SELECT b.name, COALESCE(s.status, 'stopped'), s.last_execution,
+                               s.total_trades, s.pnl, s.error_message
+                        FROM bots b LEFT JOIN bot_status s ON s.name = b.name
+                    ''').fetchall()
+                finally:
+                    conn.close()
+            except sqlite3.Error:
+                continue  # not initialized yet, or mid-rebuild; the next read catches up
+            for name, status, last_execution, total_trades, pnl, error_message in rows:
+                statuses[name] = BotStatus(
+                    name=name,
+                    status=status,
+                    last_execution=last_execution or "",
+                    total_trades=total_trades or 0,
+                    pnl=pnl or 0.0,
+                    error_message=error_message
+                )
+        return statuses
+    
+    def snapshot(self) -> FleetSnapshot:
+        now = time.monotonic()
+        if self._read_at is not None and now - self._read_at < self.refresh_interval:
+            return self._snapshot
+        with self._lock:
+            if self._read_at is None or now - self._read_at >= self.refresh_interval:
+                statuses = run_blocking(self._read)
+                if statuses != dict(self._snapshot.statuses):
+                    self._snapshot = FleetSnapshot.build(self._snapshot.version + 1, statuses)
+                self._read_at = now
+        return self._snapshot
+
+    def new_logs(self) -> List[tuple]:
+        """Log rows written since the last call, as (bot, timestamp, action, details).
+        
+        The first call for each database only marks where to start, so
+        history is never replayed.
+        """
+        return run_blocking(self._tail_logs)
+
+    def _tail_logs(self) -> List[tuple]:
+        rows = []
+        for path in self._paths():
+            key = str(path)
+            try:
+                conn = self._connect(path)
+                try:
+                    last_id = self._log_ids.get(key)
+                    if last_id is None:
+                        self._log_ids[key] = conn.execute("SELECT COALESCE(MAX(id), 0) FROM bot_logs").fetchone()[0]
+                        continue
+                    new = conn.execute(
+                        "SELECT id, bot_name, timestamp, action, details FROM bot_logs "
+                        "WHERE id > ? ORDER BY id LIMIT ?",
+                        (last_id, LOG_TAIL_BATCH)
+                    ).fetchall()
+                finally:
+                    conn.close()
+            except sqlite3.Error:
+                continue
+            if new:
+                self._log_ids[key] = new[-1][0]
+                rows.extend(row[1:] for row in new)
+        return rows
+
+_default_manager: Optional[BotManager] = None
+_default_manager_lock = threading.Lock()
+
+def get_bot_manager() -> BotManager:
+    """The process-wide BotManager, created (with its database) on first use"""
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = BotManager()
+        return _default_manager
 
-# Global bot manager instance
-bot_manager = BotManager() 
\ No newline at end of file
+def __getattr__(name: str):
+    # ``from mountain_gorilla.bot_manager import bot_manager`` builds the global
+    # instance lazily, so importing this module creates no database file
+    if name == "bot_manager":
+        return get_bot_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 Mountain Gorilla Bots Package
 """
 
+from .storage import BotStorage
 from .base_bot import BaseBot
 from .memori_bot import MemoriBot
 from .finan_bot import FinanBot
@@ -10,6 +11,7 @@ from .task_bot import TaskBot
 from .coach_bot import CoachBot
 
 __all__ = [
+    'BotStorage',
     'BaseBot',
     'MemoriBot',
     'FinanBot',
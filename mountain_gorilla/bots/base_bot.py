@@ -3,14 +3,30 @@ Base class for all Mountain Gorilla bots.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from .storage import BotStorage
 
 class BaseBot(ABC):
-    def __init__(self, name: str, level: int = 1):
+    def __init__(self, name: str, level: int = 1, storage: BotStorage = None):
         self.name = name
-        self.level = level
+        # Level and collections live in storage so every worker process shares them
+        self.storage = storage or BotStorage()
+        self.storage.ensure_bot(name, level)
         self.abilities: List[str] = []
         
+    @property
+    def level(self) -> int:
+        return self.storage.get_level(self.name)
+    
+    @level.setter
+    def level(self, value: int):
+        self.storage.set_level(self.name, value)
+    
+    @property
+    def version(self) -> int:
+        """Change counter bumped by every write to this bot's state."""
+        return self.storage.version(self.name)
+        
     @abstractmethod
     def get_ascii_art(self) -> str:
         """Return the ASCII art representation of the bot."""
@@ -18,7 +34,16 @@ class BaseBot(ABC):
     
     def level_up(self) -> None:
         """Increase the bot's level by 1."""
-        self.level += 1
+        self.storage.level_up(self.name)
+        
+    def page_items(self, kind: str, limit: int = 50, after: int = None,
+                   descending: bool = False, **filters) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Return one page of this bot's ``kind`` items and the id to continue after."""
+        return self.storage.page_items(self.name, kind, limit, after, descending, **filters)
+    
+    def iter_items(self, kind: str, descending: bool = False, **filters) -> Iterator[Dict[str, Any]]:
+        """Iterate over all of this bot's ``kind`` items without loading them at once."""
+        return self.storage.iter_items(self.name, kind, descending=descending, **filters)
         
     def get_abilities(self) -> List[str]:
         """Return the list of bot abilities."""
@@ -3,13 +3,14 @@ CoachBot - A bot specialized in providing motivation and coaching.
 """
 
 from typing import List, Dict, Any
+from datetime import datetime
 from .base_bot import BaseBot
+from .storage import BotStorage
 
 class CoachBot(BaseBot):
-    def __init__(self, level: int = 1):
-        super().__init__("CoachBot", level)
+    def __init__(self, level: int = 1, storage: BotStorage = None):
+        super().__init__("CoachBot", level, storage)
         self.abilities = ["Motivational Tips", "Goal Setting", "Progress Tracking"]
-        self.goals: List[Dict[str, Any]] = []
         self.motivational_quotes = [
             "The only way to do great work is to love what you do.",
             "Success is not final, failure is not fatal: it is the courage to continue that counts.",
@@ -18,6 +19,10 @@ class CoachBot(BaseBot):
             "Don't watch the clock; do what it does. Keep going."
         ]
         
+    @property
+    def goals(self) -> List[Dict[str, Any]]:
+        return self.storage.list_items(self.name, "goal")
+        
     def get_ascii_art(self) -> str:
         return r"""
       ____
@@ -32,30 +37,28 @@ class CoachBot(BaseBot):
                  target_date: str = None) -> None:
         """Add a new goal to track."""
         goal = {
-            "id": len(self.goals) + 1,
             "title": title,
             "description": description,
             "target_date": target_date,
             "status": "in_progress",
             "progress": 0,
-            "created_at": "2024-03-21"  # TODO: Use actual datetime
+            "created_at": datetime.now().isoformat()
         }
-        self.goals.append(goal)
+        self.storage.add_item(self.name, "goal", goal, status=goal["status"])
         
     def update_goal_progress(self, goal_id: int, progress: int) -> None:
         """Update the progress of a goal."""
-        for goal in self.goals:
-            if goal["id"] == goal_id:
+        with self.storage.transaction():
+            goal = self.storage.get_item(self.name, "goal", goal_id)
+            if goal:
                 goal["progress"] = max(0, min(100, progress))
                 if goal["progress"] >= 100:
                     goal["status"] = "completed"
-                break
+                self.storage.update_item(self.name, goal_id, goal, status=goal["status"])
                 
     def get_goals(self, status: str = None) -> List[Dict[str, Any]]:
         """Get goals, optionally filtered by status."""
-        if not status:
-            return self.goals.copy()
-        return [g for g in self.goals if g["status"] == status]
+        return self.storage.list_items(self.name, "goal", status=status or None)
     
     def get_motivational_quote(self) -> str:
         """Get a random motivational quote."""
@@ -64,9 +67,10 @@ class CoachBot(BaseBot):
     
     def analyze_goals(self) -> Dict[str, Any]:
         """Analyze goals and return insights."""
+        goals = self.goals
         return {
-            "total_goals": len(self.goals),
-            "completed_goals": len([g for g in self.goals if g["status"] == "completed"]),
-            "in_progress_goals": len([g for g in self.goals if g["status"] == "in_progress"]),
-            "average_progress": sum(g["progress"] for g in self.goals) / len(self.goals) if self.goals else 0
+            "total_goals": len(goals),
+            "completed_goals": len([g for g in goals if g["status"] == "completed"]),
+            "in_progress_goals": len([g for g in goals if g["status"] == "in_progress"]),
+            "average_progress": sum(g["progress"] for g in goals) / len(goals) if goals else 0
         } 
\ No newline at end of file
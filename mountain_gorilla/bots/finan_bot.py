@@ -2,19 +2,26 @@
 FinanBot - A bot specialized in financial management and tracking.
 """
 
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import Iterable, List, Dict, Any
 from decimal import Decimal
 from .base_bot import BaseBot
+from .storage import BotStorage
 
 class FinanBot(BaseBot):
-    def __init__(self, level: int = 1):
-        super().__init__("FinanBot", level)
+    def __init__(self, level: int = 1, storage: BotStorage = None):
+        super().__init__("FinanBot", level, storage)
         self.abilities = ["Budget Tracking", "Expense Analysis", "Financial Planning"]
-        self.balance: Dict[str, Decimal] = {
-            "ETH": Decimal("0.0"),
-            "BTC": Decimal("0.0")
-        }
-        self.transactions: List[Dict[str, Any]] = []
+        
+    @property
+    def balance(self) -> Dict[str, Decimal]:
+        balance = {"ETH": Decimal("0.0"), "BTC": Decimal("0.0")}
+        balance.update(self.storage.get_balances(self.name))
+        return balance
+    
+    @property
+    def transactions(self) -> List[Dict[str, Any]]:
+        return self.storage.list_items(self.name, "transaction")
         
     def get_ascii_art(self) -> str:
         return r"""
@@ -26,9 +33,7 @@ class FinanBot(BaseBot):
     
     def update_balance(self, currency: str, amount: Decimal) -> None:
         """Update the balance for a specific currency."""
-        if currency not in self.balance:
-            self.balance[currency] = Decimal("0.0")
-        self.balance[currency] += amount
+        self.storage.add_to_balance(self.name, currency, Decimal(str(amount)))
         
     def record_transaction(self, 
                           currency: str, 
@@ -36,21 +41,48 @@ class FinanBot(BaseBot):
                           transaction_type: str,
                           description: str) -> None:
         """Record a new transaction."""
-        transaction = {
+        self.record_transactions([{
             "currency": currency,
             "amount": amount,
-            "type": transaction_type,
-            "description": description,
-            "timestamp": "2024-03-21"  # TODO: Use actual datetime
-        }
-        self.transactions.append(transaction)
-        self.update_balance(currency, amount)
+            "transaction_type": transaction_type,
+            "description": description
+        }])
+        
+    def record_transactions(self, transactions: Iterable[Dict[str, Any]]) -> List[int]:
+        """Record many transactions in one storage transaction and return their ids.
+        
+        Each item has the ``record_transaction`` arguments as keys. Balances
+        change once per currency by the summed amount, committed together
+        with the entries.
+        """
+        totals: Dict[str, Decimal] = {}
+        
+        def rows():
+            timestamp = datetime.now().isoformat()
+            for t in transactions:
+                amount = Decimal(str(t["amount"]))
+                totals[t["currency"]] = totals.get(t["currency"], Decimal("0.0")) + amount
+                transaction = {
+                    "currency": t["currency"],
+                    "amount": amount,
+                    "type": t["transaction_type"],
+                    "description": t.get("description"),
+                    "timestamp": timestamp
+                }
+                yield transaction, transaction["type"], None, ()
+                
+        with self.storage.transaction():
+            ids = self.storage.add_items(self.name, "transaction", rows())
+            for currency, amount in totals.items():
+                self.update_balance(currency, amount)
+        return ids
         
     def get_balance(self, currency: str = None) -> Dict[str, Decimal]:
         """Get balance for specific currency or all currencies."""
+        balance = self.balance
         if currency:
-            return {currency: self.balance.get(currency, Decimal("0.0"))}
-        return self.balance.copy()
+            return {currency: balance.get(currency, Decimal("0.0"))}
+        return balance
     
     def analyze_expenses(self, currency: str = None) -> Dict[str, Any]:
         """Analyze expenses and return insights."""
@@ -2,14 +2,19 @@
 MemoriBot - A bot specialized in storing and retrieving memories.
 """
 
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 from .base_bot import BaseBot
+from .storage import BotStorage
 
 class MemoriBot(BaseBot):
-    def __init__(self, level: int = 1):
-        super().__init__("MemoriBot", level)
+    def __init__(self, level: int = 1, storage: BotStorage = None):
+        super().__init__("MemoriBot", level, storage)
         self.abilities = ["Store Memories", "Retrieve Memories", "Memory Analysis"]
-        self.memories: List[Dict[str, Any]] = []
+        
+    @property
+    def memories(self) -> List[Dict[str, Any]]:
+        return self.storage.list_items(self.name, "memory")
         
     def get_ascii_art(self) -> str:
         return r"""
@@ -19,28 +24,37 @@ class MemoriBot(BaseBot):
       ||||
     """
     
-    def store_memory(self, content: str, tags: List[str] = None) -> None:
-        """Store a new memory with optional tags."""
+    @staticmethod
+    def _memory_row(content: str, tags: List[str] = None) -> Tuple[Dict[str, Any], Optional[str], Optional[str], List[str]]:
         memory = {
             "content": content,
             "tags": tags or [],
-            "timestamp": "2024-03-21"  # TODO: Use actual datetime
+            "timestamp": datetime.now().isoformat()
         }
-        self.memories.append(memory)
+        return memory, None, None, memory["tags"]
+    
+    def store_memory(self, content: str, tags: List[str] = None) -> None:
+        """Store a new memory with optional tags."""
+        self.storage.add_items(self.name, "memory", [self._memory_row(content, tags)])
+        
+    def store_memories(self, memories: Iterable[Dict[str, Any]]) -> List[int]:
+        """Store many memories ({"content", "tags"}) in one transaction and return their ids."""
+        return self.storage.add_items(
+            self.name, "memory", (self._memory_row(m["content"], m.get("tags")) for m in memories)
+        )
         
     def retrieve_memories(self, tags: List[str] = None) -> List[Dict[str, Any]]:
         """Retrieve memories, optionally filtered by tags."""
-        if not tags:
-            return self.memories
-        return [m for m in self.memories if any(tag in m["tags"] for tag in tags)]
+        return self.storage.list_items(self.name, "memory", tags=tags)
     
     def analyze_memories(self) -> Dict[str, Any]:
         """Analyze stored memories and return insights."""
+        memories = self.memories
         return {
-            "total_memories": len(self.memories),
-            "unique_tags": list(set(tag for m in self.memories for tag in m["tags"])),
+            "total_memories": len(memories),
+            "unique_tags": list(set(tag for m in memories for tag in m["tags"])),
             "memory_count_by_tag": {
-                tag: len([m for m in self.memories if tag in m["tags"]])
-                for tag in set(tag for m in self.memories for tag in m["tags"])
+                tag: len([m for m in memories if tag in m["tags"]])
+                for tag in set(tag for m in memories for tag in m["tags"])
             }
         } 
\ No newline at end of file
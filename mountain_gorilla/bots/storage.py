@@ -0,0 +1,380 @@
+"""
+Shared storage for Mountain Gorilla bots.
+SQLite in WAL mode so every web worker process sees the same bot state,
+with a per-process read-through cache invalidated via PRAGMA data_version.
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from mountain_gorilla.metrics import db_latency
+
+# Cached query results kept per process before the cache is reset wholesale
+MAX_CACHED_QUERIES = 512
+
+def _encode(data: Dict[str, Any]) -> str:
+    def default(value):
+        if isinstance(value, Decimal):
+            return {"__decimal__": str(value)}
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return json.dumps(data, default=default, separators=(",", ":"))
+
+def _decode_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and "__decimal__" in obj:
+        return Decimal(obj["__decimal__"])
+    return obj
+
+def _decode(text: str) -> Dict[str, Any]:
+    return json.loads(text, object_hook=_decode_hook)
+
+def _gevent_patched() -> bool:
+    """Whether we run under a monkey-patched gevent worker"""
+    monkey = sys.modules.get("gevent.monkey")
+    return bool(monkey and monkey.is_module_patched("threading"))
+
+def run_blocking(fn, *args):
+    """Call ``fn``, which may block on SQLite I/O or locks.
+
+    Under gevent the call runs on the hub's thread pool, so only the calling
+    greenlet waits instead of every request the worker holds; otherwise it
+    runs inline. Row fetching must happen inside ``fn``.
+    """
+    if _gevent_patched():
+        import gevent
+        return gevent.get_hub().threadpool.apply(fn, args)
+    return fn(*args)
+
+class BotStorage:
+    """Bot levels, item collections and balances in one SQLite database.
+
+    Items (memories, transactions, tasks, goals, ...) are JSON documents
+    with their status, priority and tags in indexed columns. Each owner has
+    a version that every write to it bumps, so callers can cheaply tell
+    whether a bot changed.
+
+    Reads are served from a per-process cache. Before trusting it, a read
+    checks ``PRAGMA data_version``, which changes whenever another
+    connection (another worker) commits, so a worker never serves state
+    older than the last commit it could have seen. Writes made through this
+    object clear the cache themselves.
+
+    Reads, taking the write lock and commits go through ``run_blocking``.
+    Statements inside a transaction run inline: they hold the write lock,
+    so they never wait on another process.
+    """
+
+    def __init__(self, db_path: str = ":memory:"):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.RLock()  # one connection per process, shared by its threads
+        self._depth = 0
+        self._touched: set = set()
+        self._cache: Dict[tuple, Any] = {}
+        self._data_version: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Reconnect after fork so worker processes never share a connection
+        if self._conn is None or self._pid != os.getpid():
+            self._conn, self._pid = run_blocking(self._open, self.db_path), os.getpid()
+            self._cache, self._data_version = {}, None
+        return self._conn
+
+    @classmethod
+    def _open(cls, db_path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        if db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+        cls._create_schema(conn)
+        return conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection):
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS bot_state (
+                name TEXT PRIMARY KEY,
+                level INTEGER NOT NULL DEFAULT 1,
+                version INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                owner TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                status TEXT,
+                priority TEXT,
+                created_at TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_items_owner_kind ON items (owner, kind, id);
+            CREATE INDEX IF NOT EXISTS idx_items_status ON items (owner, kind, status, id);
+            CREATE INDEX IF NOT EXISTS idx_items_priority ON items (owner, kind, priority, id);
+            CREATE TABLE IF NOT EXISTS item_tags (
+                item_id INTEGER NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (tag, item_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_item_tags_item ON item_tags (item_id);
+            CREATE TABLE IF NOT EXISTS balances (
+                owner TEXT NOT NULL,
+                currency TEXT NOT NULL,
+                amount TEXT NOT NULL,
+                PRIMARY KEY (owner, currency)
+            );
+        ''')
+
+    def _fresh(self) -> sqlite3.Connection:
+        """Connection for a read, dropping the cache if anyone else committed"""
+        conn = self._connection()
+        if self._depth == 0:
+            # Answered from the WAL index in shared memory; cheap enough to run inline
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._data_version:
+                self._cache.clear()
+                self._data_version = version
+        return conn
+
+    def _cached(self, key: tuple, load):
+        with self._lock:
+            conn = self._fresh()
+            if self._depth == 0 and key in self._cache:
+                return self._cache[key]
+            with db_latency.time(operation="read"):
+                value = run_blocking(load, conn)
+            if self._depth == 0:
+                if len(self._cache) >= MAX_CACHED_QUERIES:
+                    self._cache.clear()
+                self._cache[key] = value
+            return value
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group writes into one atomic commit; nests"""
+        with self._lock:
+            conn = self._connection()
+            if self._depth == 0:
+                started = time.perf_counter()
+                self._begin(conn)
+            self._depth += 1
+            try:
+                yield conn
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    run_blocking(conn.execute, "ROLLBACK")
+                    self._touched.clear()
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                conn.executemany(
+                    "UPDATE bot_state SET version = version + 1 WHERE name = ?",
+                    [(owner,) for owner in self._touched]
+                )
+                self._touched.clear()
+                run_blocking(conn.execute, "COMMIT")  # may checkpoint the WAL
+                self._cache.clear()
+                db_latency.observe(time.perf_counter() - started, operation="write")
+
+    @staticmethod
+    def _begin(conn: sqlite3.Connection):
+        # Taking the write lock can wait on another process (up to busy_timeout)
+        run_blocking(conn.execute, "BEGIN IMMEDIATE")
+
+    def _touch(self, conn: sqlite3.Connection, owner: str):
+        conn.execute("INSERT OR IGNORE INTO bot_state (name) VALUES (?)", (owner,))
+        self._touched.add(owner)
+
+    # Bot state
+    def ensure_bot(self, name: str, level: int = 1):
+        """Create the bot's row with ``level`` unless it already exists"""
+        with self._lock:
+            run_blocking(
+                self._connection().execute,
+                "INSERT OR IGNORE INTO bot_state (name, level) VALUES (?, ?)", (name, level)
+            )
+            self._cache.clear()
+
+    def get_level(self, name: str) -> int:
+        row = self._cached(("level", name), lambda conn: conn.execute(
+            "SELECT level FROM bot_state WHERE name = ?", (name,)).fetchone())
+        return row[0] if row else 1
+
+    def set_level(self, name: str, level: int):
+        with self.transaction() as conn:
+            self._touch(conn, name)
+            conn.execute("UPDATE bot_state SET level = ? WHERE name = ?", (level, name))
+
+    def level_up(self, name: str) -> int:
+        with self.transaction() as conn:
+            self._touch(conn, name)
+            conn.execute("UPDATE bot_state SET level = level + 1 WHERE name = ?", (name,))
+            return conn.execute("SELECT level FROM bot_state WHERE name = ?", (name,)).fetchone()[0]
+
+    def version(self, name: str) -> int:
+        """Change counter for one owner, consistent across processes"""
+        row = self._cached(("version", name), lambda conn: conn.execute(
+            "SELECT version FROM bot_state WHERE name = ?", (name,)).fetchone())
+        return row[0] if row else 0
+
+    def versions(self) -> Dict[str, int]:
+        """Change counters of every owner in one cached read"""
+        return dict(self._cached(("versions",), lambda conn: dict(conn.execute(
+            "SELECT name, version FROM bot_state"))))
+
+    # Items
+    def add_item(self, owner: str, kind: str, data: Dict[str, Any], status: str = None,
+                 priority: str = None, tags: Iterable[str] = ()) -> int:
+        return self.add_items(owner, kind, [(data, status, priority, tags)])[0]
+
+    def add_items(self, owner: str, kind: str,
+                  rows: Iterable[Tuple[Dict[str, Any], Optional[str], Optional[str], Iterable[str]]]) -> List[int]:
+        """Insert ``(data, status, priority, tags)`` rows in one transaction; returns their ids"""
+        ids = []
+        with self.transaction() as conn:
+            self._touch(conn, owner)
+            created_at = datetime.now().isoformat()
+            for data, status, priority, tags in rows:
+                item_id = conn.execute(
+                    "INSERT INTO items (owner, kind, status, priority, created_at, data) VALUES (?, ?, ?, ?, ?, ?)",
+                    (owner, kind, status, priority, created_at, _encode(data))
+                ).lastrowid
+                if tags:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO item_tags (item_id, tag) VALUES (?, ?)",
+                        [(item_id, tag) for tag in tags]
+                    )
+                ids.append(item_id)
+        return ids
+
+    def update_item(self, owner: str, item_id: int, data: Dict[str, Any], status: str = None) -> bool:
+        data = {key: value for key, value in data.items() if key != "id"}  # id lives in its own column
+        with self.transaction() as conn:
+            self._touch(conn, owner)
+            return conn.execute(
+                "UPDATE items SET data = ?, status = COALESCE(?, status) WHERE id = ? AND owner = ?",
+                (_encode(data), status, item_id, owner)
+            ).rowcount > 0
+
+    def delete_items(self, owner: str, item_ids: Iterable[int]) -> int:
+        ids = [(item_id, owner) for item_id in item_ids]
+        with self.transaction() as conn:
+            self._touch(conn, owner)
+            conn.executemany(
+                "DELETE FROM item_tags WHERE item_id IN (SELECT id FROM items WHERE id = ? AND owner = ?)", ids
+            )
+            return conn.executemany("DELETE FROM items WHERE id = ? AND owner = ?", ids).rowcount
+
+    def get_item(self, owner: str, kind: str, item_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._fresh()
+            row = run_blocking(lambda: conn.execute(
+                "SELECT id, data FROM items WHERE id = ? AND owner = ? AND kind = ?", (item_id, owner, kind)
+            ).fetchone())
+        return dict(_decode(row[1]), id=row[0]) if row else None
+
+    @staticmethod
+    def _select(owner: str, kind: str, status: str = None, priority: str = None,
+                tags: Sequence[str] = (), after: int = None, descending: bool = False,
+                limit: int = None) -> Tuple[str, List[Any]]:
+        """SELECT for items in id order.
+
+        A single tag walks that tag's index range in id order; several tags
+        walk the items in id order and probe the tag index per row. Either
+        way a LIMIT stops the scan early instead of sorting every match.
+        """
+        if len(tags) == 1:
+            sql = ("SELECT i.id, i.data FROM item_tags t JOIN items i ON i.id = t.item_id "
+                   "WHERE t.tag = ? AND i.owner = ? AND i.kind = ?")
+            params: List[Any] = [tags[0], owner, kind]
+            id_column = "t.item_id"
+        else:
+            sql = "SELECT i.id, i.data FROM items i WHERE i.owner = ? AND i.kind = ?"
+            params = [owner, kind]
+            id_column = "i.id"
+            if tags:
+                sql += (f" AND EXISTS (SELECT 1 FROM item_tags t WHERE t.item_id = i.id"
+                        f" AND t.tag IN ({','.join('?' * len(tags))}))")
+                params.extend(tags)
+        if status is not None:
+            sql += " AND i.status = ?"
+            params.append(status)
+        if priority is not None:
+            sql += " AND i.priority = ?"
+            params.append(priority)
+        if after is not None:
+            sql += f" AND {id_column} {'<' if descending else '>'} ?"
+            params.append(after)
+        sql += f" ORDER BY {id_column} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return sql, params
+
+    def list_items(self, owner: str, kind: str, status: str = None,
+                   tags: Iterable[str] = None) -> List[Dict[str, Any]]:
+        """Items oldest first, optionally filtered by status or any of ``tags``"""
+        tags = tuple(sorted(set(tags))) if tags else ()
+
+        def load(conn):
+            sql, params = self._select(owner, kind, status, tags=tags)
+            return [dict(_decode(data), id=item_id) for item_id, data in conn.execute(sql, params)]
+
+        return [dict(item) for item in self._cached(("items", owner, kind, status, tags), load)]
+
+    def page_items(self, owner: str, kind: str, limit: int = 50, after: int = None,
+                   descending: bool = False, status: str = None, priority: str = None,
+                   tags: Iterable[str] = None) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """One page of items after the id ``after`` (keyset pagination).
+
+        Returns the items and the id to pass as ``after`` for the next page,
+        or None on the last page. Each page is an index range scan, so cost
+        does not grow with the collection or with how deep the page is.
+        """
+        tags = tuple(sorted(set(tags))) if tags else ()
+        sql, params = self._select(owner, kind, status, priority, tags, after, descending, limit + 1)
+        with self._lock, db_latency.time(operation="page"):
+            conn = self._fresh()
+            rows = run_blocking(lambda: conn.execute(sql, params).fetchall())
+        items = [dict(_decode(data), id=item_id) for item_id, data in rows[:limit]]
+        return items, (items[-1]["id"] if len(rows) > limit else None)
+
+    def iter_items(self, owner: str, kind: str, batch: int = 500, descending: bool = False,
+                   **filters) -> Iterator[Dict[str, Any]]:
+        """Every matching item, fetched a page at a time so memory stays flat"""
+        after = None
+        while True:
+            items, after = self.page_items(owner, kind, batch, after, descending, **filters)
+            yield from items
+            if after is None:
+                return
+
+    # Balances
+    def get_balances(self, owner: str) -> Dict[str, Decimal]:
+        balances = self._cached(("balances", owner), lambda conn: {
+            currency: Decimal(amount) for currency, amount in conn.execute(
+                "SELECT currency, amount FROM balances WHERE owner = ?", (owner,))
+        })
+        return dict(balances)
+
+    def add_to_balance(self, owner: str, currency: str, amount: Decimal) -> Decimal:
+        """Atomically add ``amount`` (Decimal, stored exactly) to a balance"""
+        with self.transaction() as conn:
+            self._touch(conn, owner)
+            row = conn.execute(
+                "SELECT amount FROM balances WHERE owner = ? AND currency = ?", (owner, currency)
+            ).fetchone()
+            total = (Decimal(row[0]) if row else Decimal("0.0")) + Decimal(amount)
+            conn.execute(
+                "INSERT INTO balances (owner, currency, amount) VALUES (?, ?, ?) "
+                "ON CONFLICT (owner, currency) DO UPDATE SET amount = excluded.amount",
+                (owner, currency, str(total))
+            )
+            return total
@@ -2,15 +2,19 @@
 TaskBot - A bot specialized in task management and organization.
 """
 
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any
 from datetime import datetime
 from .base_bot import BaseBot
+from .storage import BotStorage
 
 class TaskBot(BaseBot):
-    def __init__(self, level: int = 1):
-        super().__init__("TaskBot", level)
+    def __init__(self, level: int = 1, storage: BotStorage = None):
+        super().__init__("TaskBot", level, storage)
         self.abilities = ["Manage Tasks", "Task Prioritization", "Progress Tracking"]
-        self.tasks: List[Dict[str, Any]] = []
+        
+    @property
+    def tasks(self) -> List[Dict[str, Any]]:
+        return self.storage.list_items(self.name, "task")
         
     def get_ascii_art(self) -> str:
         return r"""
@@ -26,40 +30,54 @@ class TaskBot(BaseBot):
                  priority: str = "medium",
                  due_date: str = None) -> None:
         """Add a new task to the list."""
-        task = {
-            "id": len(self.tasks) + 1,
+        self.add_tasks([{
             "title": title,
             "description": description,
             "priority": priority,
-            "due_date": due_date,
-            "status": "pending",
-            "created_at": "2024-03-21",  # TODO: Use actual datetime
-            "completed_at": None
-        }
-        self.tasks.append(task)
+            "due_date": due_date
+        }])
+        
+    def add_tasks(self, tasks: Iterable[Dict[str, Any]]) -> List[int]:
+        """Add many tasks in one transaction and return their ids."""
+        def rows():
+            created_at = datetime.now().isoformat()
+            for t in tasks:
+                task = {
+                    "title": t["title"],
+                    "description": t.get("description"),
+                    "priority": t.get("priority", "medium"),
+                    "due_date": t.get("due_date"),
+                    "status": "pending",
+                    "created_at": created_at,
+                    "completed_at": None
+                }
+                yield task, task["status"], task["priority"], ()
+                
+        # The storage row id becomes the task id, unique across workers
+        return self.storage.add_items(self.name, "task", rows())
         
     def complete_task(self, task_id: int) -> None:
         """Mark a task as completed."""
-        for task in self.tasks:
-            if task["id"] == task_id:
+        with self.storage.transaction():
+            task = self.storage.get_item(self.name, "task", task_id)
+            if task:
                 task["status"] = "completed"
-                task["completed_at"] = "2024-03-21"  # TODO: Use actual datetime
-                break
+                task["completed_at"] = datetime.now().isoformat()
+                self.storage.update_item(self.name, task_id, task, status=task["status"])
                 
     def get_tasks(self, status: str = None) -> List[Dict[str, Any]]:
         """Get tasks, optionally filtered by status."""
-        if not status:
-            return self.tasks.copy()
-        return [t for t in self.tasks if t["status"] == status]
+        return self.storage.list_items(self.name, "task", status=status or None)
     
     def analyze_tasks(self) -> Dict[str, Any]:
         """Analyze tasks and return insights."""
+        tasks = self.tasks
         return {
-            "total_tasks": len(self.tasks),
-            "completed_tasks": len([t for t in self.tasks if t["status"] == "completed"]),
-            "pending_tasks": len([t for t in self.tasks if t["status"] == "pending"]),
+            "total_tasks": len(tasks),
+            "completed_tasks": len([t for t in tasks if t["status"] == "completed"]),
+            "pending_tasks": len([t for t in tasks if t["status"] == "pending"]),
             "tasks_by_priority": {
-                p: len([t for t in self.tasks if t["priority"] == p])
-                for p in set(t["priority"] for t in self.tasks)
+                p: len([t for t in tasks if t["priority"] == p])
+                for p in set(t["priority"] for t in tasks)
             }
         } 
\ No newline at end of file
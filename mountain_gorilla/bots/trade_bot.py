@@ -2,16 +2,24 @@
 TradeBot - A bot specialized in trading and market analysis.
 """
 
+from datetime import datetime
 from typing import List, Dict, Any
 from decimal import Decimal
 from .base_bot import BaseBot
+from .storage import BotStorage
 
 class TradeBot(BaseBot):
-    def __init__(self, level: int = 1):
-        super().__init__("TradeBot", level)
+    def __init__(self, level: int = 1, storage: BotStorage = None):
+        super().__init__("TradeBot", level, storage)
         self.abilities = ["Stock Watchlist", "Market Analysis", "Trade Execution"]
-        self.watchlist: List[Dict[str, Any]] = []
-        self.trades: List[Dict[str, Any]] = []
+        
+    @property
+    def watchlist(self) -> List[Dict[str, Any]]:
+        return self.storage.list_items(self.name, "watchlist")
+    
+    @property
+    def trades(self) -> List[Dict[str, Any]]:
+        return self.storage.list_items(self.name, "trade")
         
     def get_ascii_art(self) -> str:
         return r"""
@@ -29,11 +37,14 @@ class TradeBot(BaseBot):
             "current_price": Decimal("0.0"),  # TODO: Implement real-time price fetching
             "status": "active"
         }
-        self.watchlist.append(watchlist_item)
+        self.storage.add_item(self.name, "watchlist", watchlist_item, status=watchlist_item["status"])
         
     def remove_from_watchlist(self, symbol: str) -> None:
         """Remove a symbol from the watchlist."""
-        self.watchlist = [item for item in self.watchlist if item["symbol"] != symbol]
+        with self.storage.transaction():
+            self.storage.delete_items(self.name, [
+                item["id"] for item in self.watchlist if item["symbol"] == symbol
+            ])
         
     def execute_trade(self, 
                      symbol: str, 
@@ -46,22 +57,23 @@ class TradeBot(BaseBot):
             "amount": amount,
             "type": trade_type,
             "price": price,
-            "timestamp": "2024-03-21"  # TODO: Use actual datetime
+            "timestamp": datetime.now().isoformat()
         }
-        self.trades.append(trade)
+        self.storage.add_item(self.name, "trade", trade, status=trade_type)
         
     def get_watchlist(self) -> List[Dict[str, Any]]:
         """Get the current watchlist."""
-        return self.watchlist.copy()
+        return self.watchlist
     
     def analyze_trades(self) -> Dict[str, Any]:
         """Analyze trading history and return insights."""
+        trades = self.trades
         return {
-            "total_trades": len(self.trades),
+            "total_trades": len(trades),
             "trades_by_type": {
-                t["type"]: len([tr for tr in self.trades if tr["type"] == t["type"]])
-                for t in self.trades
+                t["type"]: len([tr for tr in trades if tr["type"] == t["type"]])
+                for t in trades
             },
-            "total_volume": sum(t["amount"] * t["price"] for t in self.trades),
+            "total_volume": sum(t["amount"] * t["price"] for t in trades),
             "active_watchlist_items": len([w for w in self.watchlist if w["status"] == "active"])
         } 
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""
+Terminal Charts for Mountain Gorilla
+Sparklines and bar charts over long ring-buffer histories, downsampled to
+the panel width with a cached min/max-per-bucket reducer.
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+import numpy as np
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.text import Text
+from mountain_gorilla.ringbuffer import RingBuffer
+
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+class SeriesFrame(NamedTuple):
+    """A zero-copy view of a ring buffer's window, valid until its next append"""
+    values: np.ndarray  # oldest first
+    end: int  # ``RingBuffer.appended`` when viewed
+
+    @classmethod
+    def view(cls, series: RingBuffer) -> "SeriesFrame":
+        return cls(np.frombuffer(series.window(), dtype=np.float64), series.appended)
+
+class ChartFrame(NamedTuple):
+    """What a chart draws: one (low, high) per column and the latest value"""
+    lows: np.ndarray
+    highs: np.ndarray
+    latest: Optional[float]
+    max_width: int  # panel width the columns were reduced for
+
+class MinMaxDownsampler:
+    """Reduces a series to at most ``width`` (low, high) buckets.
+
+    Buckets are aligned to absolute sample indices (``SeriesFrame.end``),
+    so once a bucket is complete its min/max never changes and is cached.
+    Each redraw only scans the newest partial bucket and the oldest one the
+    window is sliding out of, whatever the history length.
+    """
+
+    def __init__(self):
+        self._bucket_size = 0
+        self._cache: Dict[int, Tuple[float, float]] = {}
+
+    def downsample(self, frame: SeriesFrame, width: int) -> Tuple[np.ndarray, np.ndarray]:
+        values, end = frame
+        n = len(values)
+        if n == 0 or width <= 0:
+            empty = np.zeros(0)
+            return empty, empty
+
+        start = end - n
+        if n <= width:
+            return values.copy(), values.copy()
+
+        bucket_size = -(-n // width)
+        if bucket_size != self._bucket_size:
+            self._bucket_size = bucket_size
+            self._cache = {}
+
+        first = start // bucket_size
+        last = (end - 1) // bucket_size
+        if last - first + 1 > width:
+            first = last - width + 1  # drop the sliver of the oldest bucket
+
+        lows = np.empty(last - first + 1)
+        highs = np.empty(last - first + 1)
+        for i, bucket in enumerate(range(first, last + 1)):
+            lo_index = bucket * bucket_size
+            hi_index = lo_index + bucket_size
+            complete = lo_index >= start and hi_index <= end
+            cached = self._cache.get(bucket) if complete else None
+            if cached is None:
+                segment = values[max(lo_index, start) - start:min(hi_index, end) - start]
+                cached = (float(segment.min()), float(segment.max()))
+                if complete:
+                    self._cache[bucket] = cached
+            lows[i], highs[i] = cached
+
+        for bucket in [b for b in self._cache if b < first]:
+            del self._cache[bucket]
+        return lows, highs
+
+def _scale(values: np.ndarray, lo: float, hi: float, steps: int) -> np.ndarray:
+    """Map values onto 0..steps-1"""
+    if hi <= lo:
+        return np.full(len(values), steps // 2, dtype=int)
+    return np.clip(((values - lo) / (hi - lo) * (steps - 1)).round().astype(int), 0, steps - 1)
+
+class SeriesChart:
+    """Base for charts of one ring-buffer series, downsampled to their panel width.
+
+    ``capture`` reduces the series while its writers are held off and keeps
+    only the per-column min/max, so a long history costs about what a
+    short one does. The chart then draws that frame, at the panel width it
+    last drew at, without touching the series again.
+    """
+
+    def __init__(self, series: RingBuffer, style: str, fmt: str):
+        self.series = series
+        self.style = style
+        self.fmt = fmt
+        self.downsampler = MinMaxDownsampler()
+        self.max_width: Optional[int] = None  # panel width at the last draw
+        self.frame: Optional[ChartFrame] = None
+
+    def _columns(self, max_width: int, latest: Optional[float]) -> int:
+        """Columns of chart that fit ``max_width`` next to the labels"""
+        raise NotImplementedError
+
+    def _reduce(self, max_width: int) -> ChartFrame:
+        latest = self.series.latest()
+        lows, highs = self.downsampler.downsample(SeriesFrame.view(self.series), self._columns(max_width, latest))
+        return ChartFrame(lows, highs, latest, max_width)
+
+    def capture(self) -> None:
+        """Reduce the series for the next draw; call it while the series' writers are held off"""
+        if self.max_width is not None:
+            self.frame = self._reduce(self.max_width)
+
+    def _current_frame(self, max_width: int) -> ChartFrame:
+        if self.frame is None or self.frame.max_width != max_width:
+            # First draw, a resize, or a standalone chart nobody captures for: reduce the live series
+            self.max_width = max_width
+            return self._reduce(max_width)
+        return self.frame
+
+class Sparkline(SeriesChart):
+    """One-line sparkline of a ring-buffer series that fits its panel width"""
+
+    def __init__(self, series: RingBuffer, label: str = "", style: str = "cyan", fmt: str = "{:,.2f}"):
+        super().__init__(series, style, fmt)
+        self.label = label
+
+    def _prefix(self) -> str:
+        return f"{self.label} " if self.label else ""
+
+    def _suffix(self, latest: Optional[float]) -> str:
+        return f" {self.fmt.format(latest)}" if latest is not None else ""
+
+    def _columns(self, max_width: int, latest: Optional[float]) -> int:
+        return max_width - len(self._prefix()) - len(self._suffix(latest))
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        frame = self._current_frame(options.max_width)
+        highs = frame.highs
+        line = Text(self._prefix(), style="bold")
+        if len(highs):
+            levels = _scale(highs, float(highs.min()), float(highs.max()), len(SPARK_BLOCKS))
+            line.append("".join(SPARK_BLOCKS[level] for level in levels), style=self.style)
+        line.append(self._suffix(frame.latest), style="dim")
+        yield line
+
+class RangeChart(SeriesChart):
+    """Multi-row chart drawing each column's min-to-max range as a vertical bar"""
+
+    def __init__(self, series: RingBuffer, height: int = 8, style: str = "green", fmt: str = "{:,.2f}"):
+        super().__init__(series, style, fmt)
+        self.height = height
+
+    def _columns(self, max_width: int, latest: Optional[float]) -> int:
+        return max_width - 12  # the axis labels
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        height = min(self.height, options.height or self.height)
+        frame = self._current_frame(options.max_width)
+        lows, highs = frame.lows, frame.highs
+        if not len(highs):
+            yield Text("Waiting for data...", style="dim")
+            return
+
+        lo, hi = float(lows.min()), float(highs.max())
+        bottoms = _scale(lows, lo, hi, height)
+        tops = _scale(highs, lo, hi, height)
+        for row in range(height - 1, -1, -1):
+            if row == height - 1:
+                axis = self.fmt.format(hi)
+            elif row == 0:
+                axis = self.fmt.format(lo)
+            else:
+                axis = ""
+            cells = "".join("█" if b <= row <= t else " " for b, t in zip(bottoms, tops))
+            line = Text(f"{axis:>11} ", style="dim")
+            line.append(cells, style=self.style)
+            yield line
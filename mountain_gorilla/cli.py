@@ -2,6 +2,7 @@
 CLI command definitions using the 'click' library, with a fun animated dashboard.
 """
 
+import json
 import time
 import click
 from rich.console import Console
@@ -10,16 +11,25 @@ from rich.text import Text
 from rich.style import Style
 from rich.table import Table
 from mountain_gorilla.command_center import CommandCenter
-from mountain_gorilla.bot_manager import bot_manager
+from mountain_gorilla.bot_manager import get_bot_manager
 from mountain_gorilla.security import vault_manager, transaction_signer, backup_manager, audit_manager
 from mountain_gorilla import __version__
 
 console = Console()
 
+def fleet_manager():
+    """The process's BotManager, for commands that run bots.
+    
+    Built on first use, so other commands never create its database, and
+    set to drain running bots and flush their logs on exit or SIGTERM.
+    """
+    manager = get_bot_manager()
+    manager.install_shutdown_hooks()
+    return manager
+
 @click.group()
 def mgcc_cli():
     """Mountain Gorilla Command Center (MGCC) - Manage your ASCII-based AI Bots."""
-    pass
 
 @mgcc_cli.command()
 def list():
@@ -51,9 +61,17 @@ def version():
 
 # Bot Deployment Layer Commands
 @mgcc_cli.group()
-def bots():
+@click.option("--shards", type=int, default=0, envvar="MGCC_SHARDS",
+              help="Run the fleet in this many worker processes (sharded mode)")
+@click.pass_context
+def bots(ctx, shards):
     """Manage Silverback-style trading bots."""
-    pass
+    if shards > 0:
+        from mountain_gorilla.sharding import ShardedBotManager
+        ctx.obj = ShardedBotManager(workers=shards)
+        ctx.call_on_close(ctx.obj.shutdown)
+    else:
+        ctx.obj = fleet_manager()
 
 @bots.command()
 @click.option("--name", required=True, help="Bot name")
@@ -62,9 +80,10 @@ def bots():
 @click.option("--intervals", default="1h", help="Trading intervals")
 @click.option("--gas-budget", default=0.01, type=float, help="Gas budget in ETH")
 @click.option("--max-position", default=0.1, type=float, help="Maximum position size")
-def deploy(name, strategy, risk_level, intervals, gas_budget, max_position):
+@click.pass_obj
+def deploy(fleet, name, strategy, risk_level, intervals, gas_budget, max_position):
     """Deploy a new trading bot."""
-    success = bot_manager.deploy_bot(
+    success = fleet.deploy_bot(
         name=name,
         strategy=strategy,
         risk_level=risk_level,
@@ -76,46 +95,53 @@ def deploy(name, strategy, risk_level, intervals, gas_budget, max_position):
         console.print(f"[green]✅ Bot '{name}' deployed successfully![/green]")
 
 @bots.command()
-def list():
+@click.pass_obj
+def list(fleet):
     """List all deployed bots and their status."""
-    bot_manager.list_bots()
+    fleet.list_bots()
 
 @bots.command()
 @click.argument("bot_name")
 @click.option("--limit", default=20, help="Number of log entries to show")
-def log(bot_name, limit):
+@click.pass_obj
+def log(fleet, bot_name, limit):
     """View bot execution logs."""
-    bot_manager.show_bot_logs(bot_name, limit)
+    fleet.show_bot_logs(bot_name, limit)
 
 @bots.command()
 @click.argument("bot_name")
-def start(bot_name):
+@click.pass_obj
+def start(fleet, bot_name):
     """Start a bot."""
-    bot_manager.start_bot(bot_name)
+    fleet.start_bot(bot_name)
 
 @bots.command()
 @click.argument("bot_name")
-def stop(bot_name):
+@click.pass_obj
+def stop(fleet, bot_name):
     """Stop a bot."""
-    bot_manager.stop_bot(bot_name)
+    fleet.stop_bot(bot_name)
 
 @bots.command()
 @click.argument("bot_name")
-def pause(bot_name):
+@click.pass_obj
+def pause(fleet, bot_name):
     """Pause a bot."""
-    bot_manager.pause_bot(bot_name)
+    fleet.pause_bot(bot_name)
 
 @bots.command()
 @click.argument("bot_name")
-def resume(bot_name):
+@click.pass_obj
+def resume(fleet, bot_name):
     """Resume a paused bot."""
-    bot_manager.resume_bot(bot_name)
+    fleet.resume_bot(bot_name)
 
 @bots.command()
 @click.argument("bot_name")
-def kill(bot_name):
+@click.pass_obj
+def kill(fleet, bot_name):
     """Kill a bot (force stop)."""
-    bot_manager.stop_bot(bot_name)
+    fleet.stop_bot(bot_name)
 
 @bots.command()
 @click.argument("bot_name")
@@ -125,7 +151,8 @@ def kill(bot_name):
 @click.option("--max-position", type=float, help="Set max position size")
 @click.option("--stop-loss", type=float, help="Set stop loss percentage")
 @click.option("--take-profit", type=float, help="Set take profit percentage")
-def config(bot_name, risk_level, intervals, gas_budget, max_position, stop_loss, take_profit):
+@click.pass_obj
+def config(fleet, bot_name, risk_level, intervals, gas_budget, max_position, stop_loss, take_profit):
     """Configure bot parameters."""
     config_updates = {}
     if risk_level:
@@ -142,7 +169,7 @@ def config(bot_name, risk_level, intervals, gas_budget, max_position, stop_loss,
         config_updates["take_profit"] = take_profit
     
     if config_updates:
-        bot_manager.configure_bot(bot_name, **config_updates)
+        fleet.configure_bot(bot_name, **config_updates)
     else:
         console.print("[yellow]No configuration parameters provided. Use --help for options.[/yellow]")
 
@@ -150,7 +177,7 @@ def config(bot_name, risk_level, intervals, gas_budget, max_position, stop_loss,
 @click.option("--strategy", default="rsi", help="Market scan strategy")
 def market_scan(strategy):
     """Run market analysis and return trading signals."""
-    signals = bot_manager.market_scan(strategy)
+    signals = fleet_manager().market_scan(strategy)
     
     table = Table(title=f"📊 Market Scan Results ({strategy.upper()})")
     table.add_column("Token", style="cyan")
@@ -186,7 +213,7 @@ def market_scan(strategy):
 @click.option("--dry-run", is_flag=True, default=True, help="Run in dry-run mode")
 def test(bot_name, dry_run):
     """Test bot strategy with historical data."""
-    results = bot_manager.test_strategy(bot_name, dry_run)
+    results = fleet_manager().test_strategy(bot_name, dry_run)
     
     if not results:
         return
@@ -270,9 +297,12 @@ def sign():
 @click.option("--value", required=True, type=float, help="Amount in ETH")
 @click.option("--gas", default=21000, help="Gas limit")
 @click.option("--data", default="", help="Transaction data")
-def create(wallet, to, value, gas, data):
+@click.option("--not-urgent", is_flag=True, help="Defer to a cheaper forecast gas window if one is near")
+@click.option("--max-wait", default=6, help="Hours a non-urgent transaction may be deferred")
+def create(wallet, to, value, gas, data, not_urgent, max_wait):
     """Create a new transaction for approval."""
-    tx_id = transaction_signer.create_transaction(wallet, to, value, gas, data)
+    tx_id = transaction_signer.create_transaction(wallet, to, value, gas, data,
+                                                  urgent=not not_urgent, max_wait_hours=max_wait)
     console.print(f"[green]Transaction {tx_id} created[/green]")
 
 @sign.command()
@@ -282,9 +312,10 @@ def pending():
 
 @sign.command()
 @click.option("--tx-id", required=True, help="Transaction ID")
-def approve(tx_id):
+@click.option("--force", is_flag=True, help="Sign a deferred transaction before its gas window")
+def approve(tx_id, force):
     """Approve and sign a transaction."""
-    transaction_signer.approve_transaction(tx_id)
+    transaction_signer.approve_transaction(tx_id, force=force)
 
 @sign.command()
 @click.option("--tx-id", required=True, help="Transaction ID")
@@ -318,6 +349,50 @@ def audit():
     """Run security audit on contract approvals."""
     audit_manager.show_audit_report()
 
+@mgcc_cli.command()
+@click.option("--url", help="Load an already running server")
+@click.option("--test-client", is_flag=True, help="Load the app in process through Flask's test client")
+@click.option("--compare", "worker_classes", default="sync,gevent",
+              help="Comma-separated gunicorn worker classes to start and compare (default target)")
+@click.option("--workers", default=2, help="Gunicorn worker processes per run")
+@click.option("--mix", help="Operation weights, e.g. bots=5,store_memory=1 (default: UI-like mix)")
+@click.option("--rps", type=float, help="Target request rate (open loop); default is closed loop")
+@click.option("--concurrency", default=50, help="Concurrent clients")
+@click.option("--duration", default=10.0, help="Seconds of load per run")
+@click.option("--streams", default=0, help="SSE streams held open during each HTTP run")
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSON")
+def loadtest(url, test_client, worker_classes, workers, mix, rps, concurrency, duration, streams, as_json):
+    """Load test the web API and report throughput, errors and latency percentiles."""
+    import asyncio
+    from mountain_gorilla.loadtest import drive, drive_app, compare, parse_mix, build_report_table
+    try:
+        mix = parse_mix(mix) if mix else None
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--mix")
+    if url:
+        results = {url: asyncio.run(drive(url, mix, rps, concurrency, duration, streams))}
+    elif test_client:
+        results = {"test-client": drive_app(mix, rps, concurrency, duration)}
+    else:
+        results = compare([w for w in worker_classes.split(",") if w], workers=workers, mix=mix, rps=rps,
+                          concurrency=concurrency, duration=duration, streams=streams)
+    if as_json:
+        click.echo(json.dumps(results, indent=2))
+    else:
+        console.print(build_report_table(results))
+
+@mgcc_cli.command()
+@click.option("--size", default=1000, help="Rows in the transaction and trade payloads")
+@click.option("--json", "as_json", is_flag=True, help="Print results as JSON")
+def jsonbench(size, as_json):
+    """Benchmark web API JSON encoding (stdlib vs fast provider)."""
+    from mountain_gorilla.json_bench import run_benchmark, build_report_table
+    report = run_benchmark(size)
+    if as_json:
+        click.echo(json.dumps(report, indent=2))
+    else:
+        console.print(build_report_table(report))
+
 def animate_banner(text: str, delay: float = 0.001) -> None:
     """
     Print a string character-by-character with a very small delay to simulate animation.
@@ -329,11 +404,30 @@ def animate_banner(text: str, delay: float = 0.001) -> None:
     console.print()  # Move to the next line
 
 @mgcc_cli.command()
-def dashboard():
+@click.option("--headless", is_flag=True, help="Benchmark dashboard rendering off screen instead")
+@click.option("--frames", default=200, help="Frames to render in headless mode")
+@click.option("--bots", "fleet_size", default=100, help="Synthetic bots in headless mode")
+@click.option("--tokens", default=6, help="Synthetic price feed tokens in headless mode")
+@click.option("--positions", default=1000, help="Synthetic portfolio positions in headless mode")
+@click.option("--width", default=160, help="Off-screen console width")
+@click.option("--height", default=50, help="Off-screen console height")
+@click.option("--json", "as_json", is_flag=True, help="Print the headless report as JSON")
+def dashboard(headless, frames, fleet_size, tokens, positions, width, height, as_json):
     """
     Displays a beautiful, animated terminal dashboard.
     Press 1-9 to navigate commands. Press q to quit.
+    With --headless, renders the live dashboard off screen and reports frame times.
     """
+    if headless:
+        from mountain_gorilla.dashboard_bench import run_headless, build_report_table
+        report = run_headless(frames=frames, bots=fleet_size, tokens=tokens, positions=positions,
+                              width=width, height=height)
+        if as_json:
+            click.echo(json.dumps(report, indent=2))
+        else:
+            console.print(build_report_table(report))
+        return
+
     console.clear()
     animate_banner("Welcome to the Mountain Gorilla Command Center!", delay=0.001)
     time.sleep(0.2)  # Reduced wait time
@@ -393,6 +487,7 @@ def dashboard():
             console.print("  [5] Configure Bot")
             console.print("  [Enter] Return to Main Menu")
             bot_choice = console.input("[bold yellow]Bot action[/]: ")
+            bot_manager = fleet_manager()
             
             if bot_choice == "1":
                 bot_manager.list_bots()
@@ -427,6 +522,7 @@ def dashboard():
             console.print("  [2] Test Strategy")
             console.print("  [Enter] Return to Main Menu")
             market_choice = console.input("[bold yellow]Analysis type[/]: ")
+            bot_manager = fleet_manager()
             
             if market_choice == "1":
                 strategy = console.input("Strategy (rsi, momentum): ") or "rsi"
@@ -3,10 +3,13 @@ Terminal Dashboard UI / TUI Components for Mountain Gorilla
 Live price tickers, position dashboards, bot status monitors, and portfolio growth graphs.
 """
 
+import os
+import sys
 import time
-import random
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Any
 from rich.console import Console
 from rich.live import Live
 from rich.layout import Layout
@@ -17,106 +20,164 @@ from rich.align import Align
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.rule import Rule
 from rich.columns import Columns
-from mountain_gorilla.bot_manager import bot_manager
+from rich.console import Group
+from mountain_gorilla.bot_manager import get_bot_manager
+from mountain_gorilla.ringbuffer import RingBuffer
+from mountain_gorilla.market import LivePriceTicker, PortfolioTracker, GasTracker
+from mountain_gorilla.charts import Sparkline, RangeChart
+from mountain_gorilla.fleet_view import FleetView
+from mountain_gorilla.aggregates import AggregateMetrics, aggregates as default_aggregates
 
-console = Console()
+try:
+    import select
+    import termios
+    import tty
+except ImportError:  # Windows: no raw keyboard input, hotkeys are disabled
+    termios = None
 
-class LivePriceTicker:
-    """Simulates live price data for cryptocurrencies"""
-    
-    def __init__(self):
-        self.prices = {
-            "ETH": 3200.0,
-            "BTC": 65000.0,
-            "USDC": 1.0,
-            "WETH": 3200.0,
-            "UNI": 12.5,
-            "LINK": 18.2
-        }
-        self.price_history = {token: [] for token in self.prices.keys()}
-    
-    def update_prices(self):
-        """Simulate price movements"""
-        for token in self.prices:
-            # Simulate realistic price movements
-            change = random.uniform(-0.02, 0.02)  # ±2% change
-            self.prices[token] *= (1 + change)
-            
-            # Keep price history for charts
-            self.price_history[token].append(self.prices[token])
-            if len(self.price_history[token]) > 50:
-                self.price_history[token].pop(0)
-    
-    def get_price_change(self, token: str) -> tuple:
-        """Get current price and 24h change"""
-        if len(self.price_history[token]) < 2:
-            return self.prices[token], 0.0
-        
-        current = self.prices[token]
-        previous = self.price_history[token][-2] if len(self.price_history[token]) > 1 else current
-        change_pct = ((current - previous) / previous) * 100
-        return current, change_pct
+console = Console()
 
-class PortfolioTracker:
-    """Tracks portfolio positions and performance"""
-    
-    def __init__(self):
-        self.positions = {
-            "ETH": {"amount": 2.5, "avg_price": 3000.0},
-            "USDC": {"amount": 5000.0, "avg_price": 1.0},
-            "WETH": {"amount": 1.0, "avg_price": 3100.0}
-        }
-        self.total_value = 0.0
-        self.daily_pnl = 0.0
-    
-    def update_portfolio(self, price_ticker: LivePriceTicker):
-        """Update portfolio value based on current prices"""
-        self.total_value = 0.0
-        for token, position in self.positions.items():
-            current_price = price_ticker.prices.get(token, 0)
-            position_value = position["amount"] * current_price
-            self.total_value += position_value
-            
-            # Calculate unrealized PnL
-            position["unrealized_pnl"] = (current_price - position["avg_price"]) * position["amount"]
-        
-        # Simulate daily PnL
-        self.daily_pnl = random.uniform(-500, 1000)
+class FrameStats:
+    """Rolling frame rate and frame time for the dashboard render loop"""
+    
+    def __init__(self, window: int = 120):
+        self.frame_starts = RingBuffer(window)
+        self.frame_times = RingBuffer(window)
+        self.frames = 0
+        self.skipped = 0  # frames where nothing changed and refresh was skipped
+        self.window = window
+        self.panel_times: Dict[str, RingBuffer] = {}  # seconds per panel rebuild
+    
+    def record(self, started: float, finished: float, rendered: bool):
+        self.frame_starts.append(started)
+        self.frame_times.append(finished - started)
+        self.frames += 1
+        if not rendered:
+            self.skipped += 1
+    
+    def record_panel(self, name: str, seconds: float):
+        times = self.panel_times.get(name)
+        if times is None:
+            times = self.panel_times[name] = RingBuffer(self.window)
+        times.append(seconds)
+    
+    @property
+    def fps(self) -> float:
+        starts = self.frame_starts
+        if len(starts) < 2 or starts[-1] == starts[0]:
+            return 0.0
+        return (len(starts) - 1) / (starts[-1] - starts[0])
+    
+    @property
+    def frame_ms(self) -> float:
+        times = self.frame_times.window()
+        return sum(times) / len(times) * 1000 if len(times) else 0.0
 
-class GasTracker:
-    """Tracks gas fees and optimal transaction windows"""
-    
-    def __init__(self):
-        self.current_gas = 25  # gwei
-        self.gas_history = []
-    
-    def update_gas(self):
-        """Simulate gas fee changes"""
-        # Simulate realistic gas fee patterns
-        change = random.uniform(-5, 10)
-        self.current_gas = max(5, min(100, self.current_gas + change))
-        self.gas_history.append(self.current_gas)
+class KeyReader:
+    """Non-blocking single-keystroke reader for POSIX terminals.
+    
+    Puts stdin in cbreak mode for the duration of the ``with`` block, so keys
+    arrive without Enter while Ctrl-C still interrupts. On a non-TTY or
+    without termios, ``read_key`` just waits out the timeout.
+    """
+    
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self._saved = None
+    
+    @property
+    def enabled(self) -> bool:
+        try:
+            return termios is not None and self.stream.isatty()
+        except ValueError:  # closed stream
+            return False
+    
+    def __enter__(self):
+        if self.enabled:
+            fd = self.stream.fileno()
+            self._saved = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        return self
+    
+    def __exit__(self, *exc):
+        if self._saved is not None:
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved)
+            self._saved = None
+    
+    @contextmanager
+    def suspended(self):
+        """Temporarily restore line-buffered input, e.g. for prompts"""
+        self.__exit__()
+        try:
+            yield
+        finally:
+            self.__enter__()
+    
+    def read_key(self, timeout: float) -> Optional[str]:
+        """Return one keystroke, or None if none arrives within ``timeout``"""
+        if self._saved is None:
+            time.sleep(timeout)
+            return None
         
-        if len(self.gas_history) > 20:
-            self.gas_history.pop(0)
-    
-    def get_gas_status(self) -> str:
-        """Get gas fee status"""
-        if self.current_gas < 15:
-            return "low"
-        elif self.current_gas < 40:
-            return "medium"
-        else:
-            return "high"
+        ready, _, _ = select.select([self.stream], [], [], timeout)
+        if not ready:
+            return None
+        return os.read(self.stream.fileno(), 1).decode(errors="ignore")
 
 class TerminalDashboard:
     """Main terminal dashboard with live updates"""
     
-    def __init__(self):
-        self.price_ticker = LivePriceTicker()
-        self.portfolio = PortfolioTracker()
-        self.gas_tracker = GasTracker()
+    def __init__(self, frame_rate: float = 10.0, data_interval: float = 0.5,
+                 bots=None, price_ticker: LivePriceTicker = None,
+                 portfolio: PortfolioTracker = None, gas_tracker: GasTracker = None,
+                 aggregates: AggregateMetrics = None):
+        self.frame_rate = frame_rate
+        self.data_interval = data_interval
+        self.bot_manager = bots or get_bot_manager()
+        self.price_ticker = price_ticker or LivePriceTicker()
+        self.portfolio = portfolio or PortfolioTracker()
+        self.gas_tracker = gas_tracker or GasTracker()
+        self.aggregates = aggregates or default_aggregates
         self.layout = self._create_layout()
+        self.frame_stats = FrameStats()
+        self.fleet_view = FleetView()
+        # Chart renderables live as long as the dashboard so their downsampling caches do too
+        self.charts = Group(
+            RangeChart(self.price_ticker.price_history["ETH"], height=6, fmt="${:,.0f}"),
+            Sparkline(self.portfolio.value_history, label="Portfolio", style="blue", fmt="${:,.0f}"),
+            Sparkline(self.gas_tracker.gas_history, label="Gas      ", style="yellow", fmt="{:.0f} gwei"),
+        )
+        # Each panel is rebuilt only when the key its dependencies produce changes
+        self.panels: Dict[str, Tuple[Callable[[], Any], Callable[[], Hashable]]] = {
+            "header": (self._create_header, self._header_key),
+            "prices": (self._create_price_ticker, lambda: self.price_ticker.version),
+            "portfolio": (self._create_portfolio_panel, lambda: self.price_ticker.version),
+            "bots": (self._create_bot_status,
+                     lambda: (self.bot_manager.snapshot().version, self.fleet_view.version)),
+            "gas": (self._create_gas_panel, lambda: self.gas_tracker.version),
+            "charts": (self._create_charts_panel,
+                       lambda: (self.price_ticker.version, self.gas_tracker.version)),
+            "footer": (self._create_footer, lambda: None),
+        }
+        self._panel_keys: Dict[str, Hashable] = {}
+        # Held by the data worker while it refreshes; the renderer never waits on it
+        self._data_lock = threading.Lock()
+        self._stop = threading.Event()
+        self.hotkeys: Dict[str, Callable[[], None]] = {
+            "1": self._action_deploy_bot,
+            "2": self._action_market_scan,
+            "3": self._action_portfolio,
+            "4": self._action_bot_logs,
+        }
+        # Navigation keys act on the live view without leaving the dashboard
+        self.view_keys: Dict[str, Callable[[], None]] = {
+            "j": lambda: self.fleet_view.scroll(1),
+            "k": lambda: self.fleet_view.scroll(-1),
+            "J": lambda: self.fleet_view.page(1),
+            "K": lambda: self.fleet_view.page(-1),
+            "s": self.fleet_view.cycle_sort,
+            "f": self.fleet_view.cycle_filter,
+        }
     
     def _create_layout(self) -> Layout:
         """Create the dashboard layout"""
@@ -135,7 +196,8 @@ class TerminalDashboard:
         
         layout["left"].split_column(
             Layout(name="prices"),
-            Layout(name="portfolio")
+            Layout(name="portfolio"),
+            Layout(name="charts", size=10)
         )
         
         layout["right"].split_column(
@@ -149,12 +211,27 @@ class TerminalDashboard:
         """Create the header panel"""
         title = Text("🦍 Mountain Gorilla Command Center", style="bold cyan")
         timestamp = Text(f"Last Updated: {datetime.now().strftime('%H:%M:%S')}", style="dim")
+        summary = self.aggregates.summary()
+        total_value = summary["portfolio"]["total_value"]
+        fleet = Text(
+            f"{summary['bots']['running']}/{summary['bots']['total']} bots running"
+            + (f" | ${total_value:,.2f}" if total_value is not None else ""),
+            style="green"
+        )
+        stats = Text(
+            f"{self.frame_stats.fps:.1f} FPS | {self.frame_stats.frame_ms:.1f} ms/frame",
+            style="dim"
+        )
         
         return Panel(
-            Align.center(Columns([title, timestamp])),
+            Align.center(Columns([title, timestamp, fleet, stats])),
             border_style="magenta"
         )
     
+    def _header_key(self) -> Hashable:
+        """The header shows the clock, so it changes once per second"""
+        return datetime.now().strftime('%H:%M:%S')
+    
     def _create_price_ticker(self) -> Panel:
         """Create live price ticker"""
         table = Table(show_header=True, header_style="bold blue")
@@ -163,7 +240,7 @@ class TerminalDashboard:
         table.add_column("24h Change", style="green")
         table.add_column("Status", style="yellow")
         
-        for token in ["ETH", "BTC", "USDC", "WETH", "UNI", "LINK"]:
+        for token in self.price_ticker.prices:
             price, change = self.price_ticker.get_price_change(token)
             
             # Color code the change
@@ -188,8 +265,6 @@ class TerminalDashboard:
     
     def _create_portfolio_panel(self) -> Panel:
         """Create portfolio overview"""
-        self.portfolio.update_portfolio(self.price_ticker)
-        
         table = Table(show_header=True, header_style="bold blue")
         table.add_column("Asset", style="cyan")
         table.add_column("Amount", style="white")
@@ -197,9 +272,7 @@ class TerminalDashboard:
         table.add_column("PnL", style="yellow")
         
         for token, position in self.portfolio.positions.items():
-            current_price = self.price_ticker.prices.get(token, 0)
-            value = position["amount"] * current_price
-            pnl = position.get("unrealized_pnl", 0)
+            pnl = position["unrealized_pnl"]
             
             pnl_color = "green" if pnl >= 0 else "red"
             pnl_text = f"[{pnl_color}]{pnl:+.2f}[/{pnl_color}]"
@@ -207,53 +280,28 @@ class TerminalDashboard:
             table.add_row(
                 token,
                 f"{position['amount']:.4f}",
-                f"${value:.2f}",
+                f"${position['value']:.2f}",
                 pnl_text
             )
         
-        # Add total row
+        # Add total row with today's PnL against the prior close
+        daily_color = "green" if self.portfolio.daily_pnl >= 0 else "red"
         table.add_row(
             "[bold]TOTAL[/bold]",
             "",
             f"[bold]${self.portfolio.total_value:.2f}[/bold]",
-            f"[bold]{'green' if self.portfolio.daily_pnl >= 0 else 'red'}${self.portfolio.daily_pnl:+.2f}[/bold]"
+            f"[bold {daily_color}]${self.portfolio.daily_pnl:+.2f}[/bold {daily_color}]"
         )
         
         return Panel(table, title="💼 Portfolio", border_style="blue")
     
     def _create_bot_status(self) -> Panel:
-        """Create bot status monitor"""
-        table = Table(show_header=True, header_style="bold blue")
-        table.add_column("Bot", style="cyan")
-        table.add_column("Status", style="green")
-        table.add_column("Trades", style="white")
-        table.add_column("PnL", style="yellow")
-        
-        for name, config in bot_manager.bots.items():
-            status = bot_manager.statuses.get(name, None)
-            if status:
-                status_color = {
-                    "running": "green",
-                    "paused": "yellow",
-                    "stopped": "red",
-                    "error": "red"
-                }.get(status.status, "white")
-                
-                table.add_row(
-                    name,
-                    f"[{status_color}]{status.status}[/{status_color}]",
-                    str(status.total_trades),
-                    f"${status.pnl:.2f}"
-                )
-        
-        if not bot_manager.bots:
-            table.add_row("No bots", "deployed", "", "")
-        
-        return Panel(table, title="🤖 Bot Status", border_style="magenta")
+        """Create bot status monitor; only the rows that fit are ever built"""
+        self.fleet_view.sync(self.bot_manager.snapshot())
+        return Panel(self.fleet_view, title="🤖 Bot Status", border_style="magenta")
     
     def _create_gas_panel(self) -> Panel:
         """Create gas fee tracker"""
-        self.gas_tracker.update_gas()
         gas_status = self.gas_tracker.get_gas_status()
         
         status_color = {
@@ -265,15 +313,31 @@ class TerminalDashboard:
         gas_text = f"[{status_color}]{self.gas_tracker.current_gas:.1f} gwei[/{status_color}]"
         status_text = f"[{status_color}]{gas_status.upper()}[/{status_color}]"
         
+        analytics = self.gas_tracker.analytics
+        window = analytics.cheapest_window(6)
+        if window is None or window.hours_ahead == 0:
+            optimal = "[green]Now[/green]"
+        else:
+            optimal = f"{window.starts_at.strftime('%H:%M')} (~{window.expected_gwei:.1f} gwei)"
+        median = analytics.percentile(0.5)
+        
         content = f"""
 Current Gas: {gas_text}
 Status: {status_text}
+Trend: {analytics.trend} (median {median or 0:.1f} gwei)
 
-Optimal Window: {'Now' if gas_status == 'low' else 'Wait'}
+Optimal Window: {optimal}
         """
         
         return Panel(content, title="⛽ Gas Tracker", border_style="yellow")
     
+    def _create_charts_panel(self) -> Panel:
+        """Create price, portfolio value and gas history charts"""
+        # Runs under the data lock; the charts draw later, during live.refresh()
+        for chart in self.charts.renderables:
+            chart.capture()
+        return Panel(self.charts, title="📈 ETH / Portfolio / Gas", border_style="cyan")
+    
     def _create_footer(self) -> Panel:
         """Create footer with quick actions"""
         actions = [
@@ -281,6 +345,9 @@ Optimal Window: {'Now' if gas_status == 'low' else 'Wait'}
             "[2] Market Scan", 
             "[3] Portfolio",
             "[4] Bot Logs",
+            "[j/k] Scroll Bots",
+            "[s] Sort",
+            "[f] Filter",
             "[q] Quit"
         ]
         
@@ -289,67 +356,176 @@ Optimal Window: {'Now' if gas_status == 'low' else 'Wait'}
             border_style="cyan"
         )
     
+    def refresh_data(self):
+        """Advance the price and gas feeds and revalue the portfolio"""
+        self.price_ticker.update_prices()
+        self.gas_tracker.update_gas()
+        self.portfolio.update_portfolio(self.price_ticker)
+    
+    def render(self, names: List[str] = None) -> List[str]:
+        """Rebuild the panels whose dependencies changed; returns their names"""
+        changed = []
+        for name, (build, key) in self.panels.items():
+            if names is not None and name not in names:
+                continue
+            current = key()
+            if name in self._panel_keys and self._panel_keys[name] == current:
+                continue
+            started = time.perf_counter()
+            self.layout[name].update(build())
+            self.frame_stats.record_panel(name, time.perf_counter() - started)
+            self._panel_keys[name] = current
+            changed.append(name)
+        return changed
+    
     def update_dashboard(self) -> Layout:
         """Update all dashboard components"""
-        self.price_ticker.update_prices()
-        
-        self.layout["header"].update(self._create_header())
-        self.layout["prices"].update(self._create_price_ticker())
-        self.layout["portfolio"].update(self._create_portfolio_panel())
-        self.layout["bots"].update(self._create_bot_status())
-        self.layout["gas"].update(self._create_gas_panel())
-        self.layout["footer"].update(self._create_footer())
-        
+        self.update_frame()
         return self.layout
     
+    def update_frame(self) -> List[str]:
+        """Refresh data and re-render dirty panels, recording frame stats"""
+        with self._data_lock:
+            self.refresh_data()
+        return self.render_frame()
+    
+    def render_frame(self) -> List[str]:
+        """Re-render dirty panels without waiting for an in-progress data refresh"""
+        started = time.perf_counter()
+        if self._data_lock.acquire(blocking=False):
+            try:
+                changed = self.render()
+            finally:
+                self._data_lock.release()
+        else:
+            # Data is mid-update; keep the clock and frame stats moving
+            changed = self.render(["header"])
+        self.frame_stats.record(started, time.perf_counter(), bool(changed))
+        return changed
+    
+    def _data_loop(self):
+        """Background worker refreshing data every ``data_interval`` seconds"""
+        while not self._stop.is_set():
+            started = time.monotonic()
+            with self._data_lock:
+                self.refresh_data()
+            self._stop.wait(max(0.0, self.data_interval - (time.monotonic() - started)))
+    
+    def _pause(self):
+        console.input("\n[bold blue]Press Enter to return to the dashboard...[/bold blue]")
+    
+    def _action_deploy_bot(self):
+        name = console.input("[bold magenta]Bot name[/]: ").strip()
+        if name:
+            strategy = console.input("Strategy (eth-dca, momentum): ").strip() or "eth-dca"
+            self.bot_manager.deploy_bot(name, strategy)
+        self._pause()
+    
+    def _action_market_scan(self):
+        signals = self.bot_manager.market_scan()
+        table = Table(title=f"📊 Market Scan Results ({signals['strategy'].upper()})")
+        table.add_column("Token", style="cyan")
+        table.add_column("Signal", style="magenta")
+        table.add_column("Strength", style="yellow")
+        table.add_column("Reason", style="white")
+        for signal in signals["signals"]:
+            table.add_row(signal["token"], signal["signal"], f"{signal['strength']:.2f}", signal["reason"])
+        console.print(table)
+        self._pause()
+    
+    def _action_portfolio(self):
+        with self._data_lock:
+            panel = self._create_portfolio_panel()
+        console.print(panel)
+        self._pause()
+    
+    def _action_bot_logs(self):
+        name = console.input("[bold magenta]Bot name[/]: ").strip()
+        if name:
+            self.bot_manager.show_bot_logs(name)
+        self._pause()
+    
     def run(self):
         """Run the live dashboard"""
         console.clear()
         console.print("[bold cyan]Starting Mountain Gorilla Dashboard...[/bold cyan]")
         
-        with Live(self.update_dashboard(), refresh_per_second=2, screen=True) as live:
-            while True:
-                try:
-                    # Check for user input
-                    if console.input_timeout(timeout=0.5) == "q":
-                        break
-                    
-                    # Update dashboard
-                    live.update(self.update_dashboard())
+        self.update_frame()
+        self._stop.clear()
+        data_thread = threading.Thread(target=self._data_loop, name="mgcc-dashboard-data", daemon=True)
+        data_thread.start()
+        frame_interval = 1.0 / self.frame_rate
+        
+        try:
+            with KeyReader() as keys, Live(self.layout, console=console, auto_refresh=False, screen=True) as live:
+                live.refresh()
+                next_frame = time.monotonic() + frame_interval
+                while True:
+                    now = time.monotonic()
+                    if now >= next_frame:
+                        # Only repaint the terminal when a panel changed
+                        if self.render_frame():
+                            live.refresh()
+                        next_frame = max(next_frame + frame_interval, now)
+                        continue
                     
-                except KeyboardInterrupt:
-                    break
-                except Exception as e:
-                    console.print(f"[red]Dashboard error: {e}[/red]")
-                    break
+                    key = keys.read_key(next_frame - now)
+                    if key in ("q", "Q"):
+                        break
+                    if key in self.view_keys:
+                        self.view_keys[key]()
+                        next_frame = time.monotonic()
+                        continue
+                    if key in self.hotkeys:
+                        live.stop()
+                        with keys.suspended():
+                            self.hotkeys[key]()
+                        live.start()
+                        self._panel_keys.clear()  # repaint everything on return
+                        next_frame = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+        except Exception as e:
+            console.print(f"[red]Dashboard error: {e}[/red]")
+        finally:
+            self._stop.set()
+            data_thread.join(self.data_interval * 2)
         
         console.print("[bold green]Dashboard closed.[/bold green]")
 
+_quick_feed: Optional[Tuple[LivePriceTicker, PortfolioTracker]] = None
+
 def create_simple_dashboard():
     """Create a simpler dashboard for the main menu"""
-    price_ticker = LivePriceTicker()
-    portfolio = PortfolioTracker()
+    global _quick_feed
+    if _quick_feed is None:
+        _quick_feed = (LivePriceTicker(), PortfolioTracker())
+    price_ticker, portfolio = _quick_feed
     
-    # Update data
+    # Advance the shared feed; its events keep the aggregates current
     price_ticker.update_prices()
     portfolio.update_portfolio(price_ticker)
+    summary = default_aggregates.summary()
     
     # Create summary table
     table = Table(title="🦍 Quick Portfolio Summary")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="magenta")
     
-    table.add_row("Total Portfolio Value", f"${portfolio.total_value:.2f}")
-    table.add_row("Daily PnL", f"${portfolio.daily_pnl:+.2f}")
-    table.add_row("Active Bots", str(len([b for b in bot_manager.statuses.values() if b.status == "running"])))
-    table.add_row("ETH Price", f"${price_ticker.prices['ETH']:.2f}")
+    # Aggregates stay None until the feed's first event reaches them
+    money = lambda value, spec=".2f": "—" if value is None else f"${value:{spec}}"
+    table.add_row("Total Portfolio Value", money(summary["portfolio"]["total_value"]))
+    table.add_row("Daily PnL", money(summary["portfolio"]["daily_pnl"], "+.2f"))
+    table.add_row("Active Bots", str(summary["bots"]["running"]))
+    table.add_row("ETH Price", money(summary["prices"].get("ETH")))
     
     console.print(table)
     
-    # Show recent bot activity
-    if bot_manager.bots:
+    # Show recent bot activity, as persisted by the processes running bots
+    statuses = default_aggregates.fleet.snapshot().statuses
+    if statuses:
         console.print("\n[bold blue]Recent Bot Activity:[/bold blue]")
-        for name, status in list(bot_manager.statuses.items())[:3]:
+        for name, status in list(statuses.items())[:3]:
             console.print(f"  {name}: {status.status} (Last: {status.last_execution[:19]})")
 
 if __name__ == "__main__":
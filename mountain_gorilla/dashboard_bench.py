@@ -0,0 +1,191 @@
+"""
+Headless Dashboard Benchmark for Mountain Gorilla
+Renders TerminalDashboard frames to an off-screen console against a
+synthetic fleet and price feed, and reports per-panel and per-frame cost.
+"""
+
+import io
+import time
+import random
+import tracemalloc
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, List, Tuple
+from rich.console import Console
+from rich.table import Table
+from mountain_gorilla.bot_manager import BotStatus, FleetSnapshot
+from mountain_gorilla.events import EventBus
+from mountain_gorilla.portfolio import PortfolioBook
+from mountain_gorilla.gas import GasAnalytics
+from mountain_gorilla.aggregates import AggregateMetrics
+from mountain_gorilla.dashboard import TerminalDashboard, LivePriceTicker, PortfolioTracker, GasTracker
+
+class SyntheticFleet:
+    """Stand-in for BotManager that publishes snapshots of ``size`` fake bots"""
+
+    def __init__(self, size: int, churn: float = 0.01, seed: int = 0):
+        self.random = random.Random(seed)
+        self.churn = churn  # fraction of bots whose status changes per tick
+        now = datetime.now().isoformat()
+        statuses = {
+            f"bot-{i:05d}": BotStatus(
+                name=f"bot-{i:05d}",
+                status=self.random.choice(("running", "running", "paused", "stopped")),
+                last_execution=now,
+                total_trades=self.random.randint(0, 500),
+                pnl=self.random.uniform(-1000, 1000)
+            )
+            for i in range(size)
+        }
+        self._snapshot = FleetSnapshot.build(0, statuses)
+
+    def snapshot(self) -> FleetSnapshot:
+        return self._snapshot
+
+    def tick(self):
+        """Update a random slice of the fleet and publish a new snapshot"""
+        statuses = dict(self._snapshot.statuses)
+        if not statuses:
+            return
+        names = list(statuses)
+        for name in self.random.sample(names, max(1, int(len(names) * self.churn))):
+            status = statuses[name]
+            statuses[name] = BotStatus(
+                name=name,
+                status=status.status,
+                last_execution=datetime.now().isoformat(),
+                total_trades=status.total_trades + 1,
+                pnl=status.pnl + self.random.uniform(-10, 10)
+            )
+        # Only numbers change, so the per-status counts carry over
+        self._snapshot = FleetSnapshot(self._snapshot.version + 1, MappingProxyType(statuses),
+                                       self._snapshot.counts)
+
+def synthetic_dashboard(bots: int = 100, tokens: int = 6, positions: int = 1000,
+                        seed: int = 0) -> TerminalDashboard:
+    """Build a dashboard wired to a synthetic fleet, feed and portfolio"""
+    rng = random.Random(seed)
+    bus = EventBus()  # private bus so nothing else sees benchmark events
+    prices = dict(LivePriceTicker().prices)
+    for i in range(len(prices), tokens):
+        prices[f"TKN{i}"] = rng.uniform(0.1, 500)
+    prices = dict(list(prices.items())[:max(tokens, 1)])
+
+    book = PortfolioBook()
+    names = list(prices)
+    for i in range(positions):
+        token = names[i % len(names)]
+        book.add_position(f"wallet-{i // len(names)}", token, rng.uniform(0.1, 10), prices[token])
+
+    fleet = SyntheticFleet(bots, seed=seed)
+    dashboard = TerminalDashboard(
+        bots=fleet,
+        price_ticker=LivePriceTicker(event_bus=bus, prices=prices),
+        portfolio=PortfolioTracker(book, event_bus=bus),
+        gas_tracker=GasTracker(event_bus=bus, analytics=GasAnalytics()),
+        aggregates=AggregateMetrics(fleet=fleet, event_bus=bus)
+    )
+    return dashboard
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    """Mean/p50/p95/max of samples in seconds, reported in milliseconds"""
+    if not samples:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": pick(0.50) * 1000,
+        "p95_ms": pick(0.95) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+def run_headless(frames: int = 200, bots: int = 100, tokens: int = 6, positions: int = 1000,
+                 width: int = 160, height: int = 50, trace_frames: int = 20,
+                 seed: int = 0) -> Dict:
+    """Render ``frames`` dashboard frames off screen and return timing stats.
+
+    Each frame advances the feed and fleet, rebuilds dirty panels ("build")
+    and paints the full layout into an in-memory console ("paint"). Rich
+    renders lazily, so most of a large panel's cost shows up in the paint.
+    Allocations are measured in a separate traced pass of ``trace_frames``
+    frames so tracing overhead does not skew the timings.
+    """
+    dashboard = synthetic_dashboard(bots, tokens, positions, seed)
+    fleet = dashboard.bot_manager
+    screen = Console(file=io.StringIO(), width=width, height=height,
+                     force_terminal=True, color_system="truecolor")
+
+    def frame() -> Tuple[float, float]:
+        dashboard.refresh_data()
+        fleet.tick()
+        started = time.perf_counter()
+        dashboard.render_frame()
+        built = time.perf_counter()
+        screen.print(dashboard.layout)
+        screen.file.seek(0)
+        screen.file.truncate()
+        return built - started, time.perf_counter() - started
+
+    frame()  # warm up caches and imports
+    dashboard.frame_stats.panel_times.clear()
+    panel_samples: Dict[str, List[float]] = {}
+    build_times, frame_times = [], []
+    for _ in range(frames):
+        build, total = frame()
+        build_times.append(build)
+        frame_times.append(total)
+        for name, times in dashboard.frame_stats.panel_times.items():
+            if len(times):
+                panel_samples.setdefault(name, []).append(times.latest())
+            times.clear()
+
+    allocations = []
+    if trace_frames:
+        tracemalloc.start()
+        try:
+            for _ in range(trace_frames):
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                frame()
+                allocations.append(tracemalloc.get_traced_memory()[1] - before)
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "config": {"frames": frames, "bots": bots, "tokens": tokens, "positions": positions,
+                   "width": width, "height": height},
+        "build": _summary(build_times),
+        "paint": _summary([total - build for build, total in zip(build_times, frame_times)]),
+        "frame": _summary(frame_times),
+        "fps_capacity": len(frame_times) / sum(frame_times) if frame_times else 0.0,
+        "panels": {
+            name: dict(_summary(samples), builds=len(samples))
+            for name, samples in sorted(panel_samples.items())
+        },
+        "peak_alloc_kib_per_frame": (sum(allocations) / len(allocations) / 1024) if allocations else None,
+    }
+
+def build_report_table(report: Dict) -> Table:
+    """Rich table of a ``run_headless`` report"""
+    config = report["config"]
+    table = Table(title=(f"🦍 Headless Dashboard Benchmark ({config['frames']} frames, "
+                         f"{config['bots']} bots, {config['tokens']} tokens, {config['positions']} positions)"))
+    table.add_column("Stage", style="cyan")
+    table.add_column("Builds", style="white", justify="right")
+    table.add_column("Mean ms", style="green", justify="right")
+    table.add_column("p50 ms", style="green", justify="right")
+    table.add_column("p95 ms", style="yellow", justify="right")
+    table.add_column("Max ms", style="red", justify="right")
+
+    for name, stats in report["panels"].items():
+        table.add_row(name, str(stats["builds"]), f"{stats['mean_ms']:.3f}", f"{stats['p50_ms']:.3f}",
+                      f"{stats['p95_ms']:.3f}", f"{stats['max_ms']:.3f}")
+    for stage in ("build", "paint", "frame"):
+        stats = report[stage]
+        table.add_row(f"[bold]{stage}[/bold]", str(config["frames"]), f"{stats['mean_ms']:.3f}",
+                      f"{stats['p50_ms']:.3f}", f"{stats['p95_ms']:.3f}", f"{stats['max_ms']:.3f}")
+    table.caption = f"{report['fps_capacity']:.0f} frames/s capacity"
+    if report["peak_alloc_kib_per_frame"] is not None:
+        table.caption += f" | {report['peak_alloc_kib_per_frame']:.0f} KiB peak allocation per frame"
+    return table
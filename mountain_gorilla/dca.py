@@ -0,0 +1,251 @@
+"""
+DCA Order Aggregation Engine for Mountain Gorilla
+Groups scheduled DCA buys from every bot into time buckets, executes one
+aggregate order per token per bucket and splits fills back pro rata.
+"""
+
+import time
+import random
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_DOWN, localcontext
+from typing import Callable, Dict, List, Optional, Tuple
+from rich.console import Console
+from mountain_gorilla.events import EventBus, event_bus as default_event_bus, DCA_EXECUTION
+
+# Smallest unit allocations are rounded to (1 wei for 18-decimal tokens)
+QUANTUM = Decimal("1e-18")
+
+# Reference prices and gas cost used by the simulated executor
+REFERENCE_PRICES = {
+    "ETH": Decimal("3200"),
+    "WETH": Decimal("3200"),
+    "BTC": Decimal("65000"),
+    "USDC": Decimal("1"),
+    "UNI": Decimal("12.5"),
+    "LINK": Decimal("18.2"),
+}
+SIMULATED_SWAP_GAS_ETH = Decimal("0.004")
+
+console = Console()
+
+@dataclass(frozen=True)
+class DCAFill:
+    """Result of executing one aggregate order"""
+    token: str
+    amount: Decimal  # quantity actually filled
+    price: Decimal
+    fee: Decimal  # gas paid for the whole order, in ETH
+
+@dataclass(frozen=True)
+class DCAAllocation:
+    """One bot's pro rata share of an aggregate fill"""
+    bot: str
+    token: str
+    bucket: int
+    requested: Decimal
+    amount: Decimal
+    price: Decimal
+    fee: Decimal
+
+def simulated_executor(token: str, amount: Decimal) -> DCAFill:
+    """Fill the whole order at the reference price with a little slippage"""
+    reference = REFERENCE_PRICES.get(token, Decimal("1"))
+    slippage = Decimal(str(random.uniform(-0.001, 0.001)))
+    price = (reference * (1 + slippage)).quantize(Decimal("0.01"))
+    return DCAFill(token=token, amount=amount, price=price, fee=SIMULATED_SWAP_GAS_ETH)
+
+def split_pro_rata(total: Decimal, weights: Dict[str, Decimal]) -> Dict[str, Decimal]:
+    """Split ``total`` across ``weights`` so the shares sum to it exactly.
+
+    Shares are rounded down to QUANTUM and the leftover quanta go to the
+    largest remainders (ties broken by name for determinism).
+    """
+    weight_sum = sum(weights.values())
+    if not weight_sum:
+        return {key: Decimal(0) for key in weights}
+
+    shares, remainders = {}, []
+    with localcontext() as ctx:
+        ctx.prec = 60  # room for 18 decimals on large totals
+        for key, weight in weights.items():
+            exact = total * weight / weight_sum
+            share = exact.quantize(QUANTUM, rounding=ROUND_DOWN)
+            shares[key] = share
+            remainders.append((exact - share, key))
+
+        leftover = int((total - sum(shares.values())) / QUANTUM)
+    for _, key in sorted(remainders, key=lambda r: (-r[0], r[1]))[:leftover]:
+        shares[key] += QUANTUM
+    return shares
+
+class DCAEngine:
+    """Buckets DCA buys from many bots into one execution per token per bucket"""
+
+    def __init__(self,
+                 bucket_seconds: float = 60.0,
+                 executor: Callable[[str, Decimal], DCAFill] = None,
+                 on_fill: Callable[[DCAAllocation], None] = None,
+                 event_bus: EventBus = None):
+        self.bucket_seconds = bucket_seconds
+        self.executor = executor or simulated_executor
+        self.on_fill = on_fill
+        self.event_bus = event_bus or default_event_bus
+        # (bucket, token) -> bot -> requested amount
+        self._pending: Dict[Tuple[int, str], Dict[str, Decimal]] = {}
+        # bot -> token -> {"amount", "cost", "fee"}
+        self.ledger: Dict[str, Dict[str, Dict[str, Decimal]]] = defaultdict(dict)
+        self.orders_submitted = 0
+        self.executions = 0
+        self.fill_errors = 0  # allocations whose on_fill callback raised
+        self.execution_errors = 0  # executor calls that raised (their batches were requeued)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _bucket(self, now: float) -> int:
+        return int(now // self.bucket_seconds)
+
+    def submit(self, bot: str, token: str, amount, now: float = None) -> int:
+        """Schedule a buy for the bucket containing ``now``; returns the bucket"""
+        amount = Decimal(str(amount))
+        if amount <= 0:
+            raise ValueError("DCA amount must be positive")
+
+        bucket = self._bucket(time.time() if now is None else now)
+        with self._lock:
+            requests = self._pending.setdefault((bucket, token), {})
+            requests[bot] = requests.get(bot, Decimal(0)) + amount
+            self.orders_submitted += 1
+        return bucket
+
+    def cancel(self, bot: str) -> Decimal:
+        """Drop every pending request from a bot; returns the amount cancelled"""
+        cancelled = Decimal(0)
+        with self._lock:
+            for key in list(self._pending):
+                cancelled += self._pending[key].pop(bot, Decimal(0))
+                if not self._pending[key]:
+                    del self._pending[key]
+        return cancelled
+
+    def pending(self) -> Dict[Tuple[int, str], Decimal]:
+        """Total requested amount per open (bucket, token)"""
+        with self._lock:
+            return {key: sum(requests.values()) for key, requests in self._pending.items()}
+
+    def pending_by_bot(self) -> Dict[str, Decimal]:
+        """Total requested amount per bot across open buckets"""
+        totals: Dict[str, Decimal] = defaultdict(Decimal)
+        with self._lock:
+            for requests in self._pending.values():
+                for bot, amount in requests.items():
+                    totals[bot] += amount
+        return dict(totals)
+
+    def flush_due(self, now: float = None) -> List[DCAAllocation]:
+        """Execute every bucket that has closed by ``now``"""
+        current = self._bucket(time.time() if now is None else now)
+        return self._execute_where(lambda bucket: bucket < current)
+
+    def flush(self) -> List[DCAAllocation]:
+        """Execute every pending bucket, including the open one"""
+        return self._execute_where(lambda bucket: True)
+
+    def _execute_where(self, due: Callable[[int], bool]) -> List[DCAAllocation]:
+        with self._lock:
+            ready = sorted(key for key in self._pending if due(key[0]))
+            batches = [(key, self._pending.pop(key)) for key in ready]
+
+        allocations = []
+        for index, ((bucket, token), requests) in enumerate(batches):
+            try:
+                fill = self.executor(token, sum(requests.values()))
+            except Exception:
+                # Put this and every later batch back so nothing is lost
+                with self._lock:
+                    self.execution_errors += 1
+                    for key, batch in batches[index:]:
+                        merged = self._pending.setdefault(key, {})
+                        for bot, amount in batch.items():
+                            merged[bot] = merged.get(bot, Decimal(0)) + amount
+                raise
+            self.executions += 1
+            allocations.extend(self._allocate(bucket, token, requests, fill))
+        return allocations
+
+    def _allocate(self, bucket: int, token: str, requests: Dict[str, Decimal],
+                  fill: DCAFill) -> List[DCAAllocation]:
+        """Split an aggregate fill back into each bot's ledger"""
+        amounts = split_pro_rata(fill.amount, requests)
+        fees = split_pro_rata(fill.fee, requests)
+        allocations = []
+        for bot, requested in requests.items():
+            allocation = DCAAllocation(
+                bot=bot,
+                token=token,
+                bucket=bucket,
+                requested=requested,
+                amount=amounts[bot],
+                price=fill.price,
+                fee=fees[bot]
+            )
+            entry = self.ledger[bot].setdefault(
+                token, {"amount": Decimal(0), "cost": Decimal(0), "fee": Decimal(0)}
+            )
+            entry["amount"] += allocation.amount
+            entry["cost"] += allocation.amount * fill.price
+            entry["fee"] += allocation.fee
+            allocations.append(allocation)
+
+            if self.on_fill:
+                # The order is already filled: a failing callback must not
+                # stop the other bots' shares (or later batches) from booking,
+                # and requeueing would buy twice
+                try:
+                    self.on_fill(allocation)
+                except Exception as e:
+                    self.fill_errors += 1
+                    console.print(f"[red]Failed to book DCA fill of {allocation.amount} {token} "
+                                  f"for {bot}: {e!r}[/red]")
+
+        self.event_bus.publish(
+            DCA_EXECUTION,
+            token=token,
+            bucket=bucket,
+            bots=len(requests),
+            requested=sum(requests.values()),
+            filled=fill.amount,
+            price=fill.price,
+            fee=fill.fee
+        )
+        return allocations
+
+    def start(self):
+        """Run the bucket flusher in the background (idempotent)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="mgcc-dca", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """Stop the background flusher; pending buckets are left for flush()"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            now = time.time()
+            next_boundary = (self._bucket(now) + 1) * self.bucket_seconds
+            if self._stop.wait(max(0.0, next_boundary - now)):
+                break
+            try:
+                self.flush_due()
+            except Exception as e:
+                # Only executor failures get here, and those batches were
+                # requeued; retry on the next boundary
+                console.print(f"[red]DCA execution failed, retrying next bucket: {e!r}[/red]")
@@ -0,0 +1,147 @@
+"""
+In-process Event Bus for Mountain Gorilla
+Lightweight pub/sub for bot status, trade, price and gas updates with
+bounded per-subscriber queues and topic filters.
+"""
+
+import time
+import threading
+import itertools
+from collections import deque
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+# Topics published by the core modules
+BOT_STATUS = "bot.status"
+BOT_TRADE = "bot.trade"
+BOT_LOG = "bot.log"
+PRICE = "market.price"
+GAS = "market.gas"
+DCA_EXECUTION = "dca.execution"
+PORTFOLIO = "portfolio.value"
+
+@dataclass(frozen=True)
+class Event:
+    """A published event; ``data`` must not be mutated by consumers"""
+    seq: int
+    topic: str
+    timestamp: float
+    data: Dict[str, Any]
+
+class Subscription:
+    """Bounded queue of events matching a set of topic patterns.
+
+    When the queue is full the oldest event is dropped, so a slow consumer
+    never holds back publishers; ``dropped`` counts what it missed.
+    """
+
+    def __init__(self, bus: "EventBus", patterns: Tuple[str, ...], maxsize: int):
+        self.bus = bus
+        self.patterns = patterns
+        self.dropped = 0
+        self.closed = False
+        self._queue = deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+
+    def matches(self, topic: str) -> bool:
+        return any(fnmatchcase(topic, pattern) for pattern in self.patterns)
+
+    def _put(self, event: Event):
+        with self._cond:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append(event)
+            self._cond.notify()
+
+    def get(self, timeout: float = None) -> Optional[Event]:
+        """Wait for the next event; returns None on timeout or close"""
+        with self._cond:
+            if not self._queue and not self.closed:
+                self._cond.wait(timeout)
+            return self._queue.popleft() if self._queue else None
+
+    def drain(self, max_items: int = None) -> List[Event]:
+        """Return every queued event (up to ``max_items``) without blocking"""
+        with self._cond:
+            if max_items is None or max_items >= len(self._queue):
+                events = list(self._queue)
+                self._queue.clear()
+            else:
+                events = [self._queue.popleft() for _ in range(max_items)]
+            return events
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def peek(self, after_seq: int = 0) -> List[Event]:
+        """Queued events newer than ``after_seq``, left in the queue"""
+        with self._cond:
+            return [event for event in self._queue if event.seq > after_seq]
+
+    def close(self):
+        """Unsubscribe and wake any waiting consumer"""
+        self.bus.unsubscribe(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def __iter__(self):
+        while not self.closed:
+            event = self.get()
+            if event is not None:
+                yield event
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class EventBus:
+    """Thread-safe publish/subscribe hub"""
+
+    def __init__(self, default_maxsize: int = 1000):
+        self.default_maxsize = default_maxsize
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._routes: Dict[str, Tuple[Subscription, ...]] = {}
+        self._lock = threading.Lock()  # serializes subscribe/unsubscribe only
+        self._seq = itertools.count(1)
+
+    def subscribe(self, topics: Iterable[str] = ("*",), maxsize: int = None) -> Subscription:
+        """Subscribe to topics; glob patterns such as ``bot.*`` are allowed"""
+        if isinstance(topics, str):
+            topics = (topics,)
+        subscription = Subscription(self, tuple(topics), maxsize or self.default_maxsize)
+        with self._lock:
+            self._subscriptions = self._subscriptions + (subscription,)
+            self._routes = {}
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+            self._routes = {}
+
+    def _route(self, topic: str) -> Tuple[Subscription, ...]:
+        """Subscribers for a topic, cached until the subscriber set changes"""
+        routes = self._routes
+        subscribers = routes.get(topic)
+        if subscribers is None:
+            subscribers = tuple(s for s in self._subscriptions if s.matches(topic))
+            routes[topic] = subscribers
+        return subscribers
+
+    def publish(self, topic: str, **data) -> Optional[Event]:
+        """Deliver an event to every matching subscriber without blocking"""
+        subscribers = self._route(topic)
+        if not subscribers:
+            return None
+
+        event = Event(seq=next(self._seq), topic=topic, timestamp=time.time(), data=data)
+        for subscription in subscribers:
+            subscription._put(event)
+        return event
+
+# Global event bus instance
+event_bus = EventBus()
@@ -0,0 +1,167 @@
+"""
+Virtualized Fleet View for Mountain Gorilla
+Scrollable, sortable and filterable bot status table that only builds the
+rows visible in its panel, backed by incrementally maintained sort indexes.
+"""
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.table import Table
+from rich.text import Text
+from mountain_gorilla.bot_manager import BotStatus, FleetSnapshot
+
+# Sort orders; each key ends with the bot name so entries are unique and ties are stable
+SORT_KEYS: Dict[str, Callable[[BotStatus], Tuple]] = {
+    "name": lambda status: (status.name,),
+    "pnl": lambda status: (-status.pnl, status.name),
+    "trades": lambda status: (-status.total_trades, status.name),
+}
+STATUS_FILTERS = (None, "running", "paused", "stopped", "error")
+
+STATUS_COLORS = {
+    "running": "green",
+    "paused": "yellow",
+    "stopped": "red",
+    "error": "red"
+}
+
+# Table border, header and header rule plus the position caption
+CHROME_LINES = 5
+
+class FleetView:
+    """Viewport over a fleet snapshot.
+
+    Keeps one sorted list of keys for the whole fleet and one per status,
+    so filtering is a list lookup and a page of rows is a slice. ``sync``
+    diffs snapshots by identity (unchanged bots keep the same BotStatus
+    object) and re-inserts only the bots that changed.
+    """
+
+    def __init__(self, sort: str = "name", status: Optional[str] = None):
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort order: {sort}")
+        self.sort = sort
+        self.status = status
+        self.offset = 0
+        self.page_size = 20  # rows that fit, updated on every render
+        self.version = 0  # bumped when sort, filter or scroll position change
+        self._synced_version: Optional[int] = None
+        self._statuses: Mapping[str, BotStatus] = {}
+        self._keys: Dict[str, Tuple] = {}
+        self._index: Dict[Optional[str], List[Tuple]] = defaultdict(list)
+
+    def count(self) -> int:
+        """Bots matching the current filter"""
+        return len(self._index[self.status])
+
+    def _insert(self, status: BotStatus):
+        key = SORT_KEYS[self.sort](status)
+        self._keys[status.name] = key
+        insort(self._index[None], key)
+        insort(self._index[status.status], key)
+
+    def _remove(self, status: BotStatus):
+        key = self._keys.pop(status.name)
+        for entries in (self._index[None], self._index[status.status]):
+            del entries[bisect_left(entries, key)]
+
+    def sync(self, snapshot: FleetSnapshot):
+        """Bring the indexes up to date with ``snapshot``"""
+        if snapshot.version == self._synced_version:
+            return
+        current = snapshot.statuses
+        previous = self._statuses
+        added = 0
+        for name, status in current.items():
+            old = previous.get(name)
+            if old is status:
+                continue
+            if old is None:
+                added += 1
+            else:
+                self._remove(old)
+            self._insert(status)
+
+        if len(previous) + added != len(current):
+            for name in previous.keys() - current.keys():
+                self._remove(previous[name])
+        self._statuses = current  # snapshots are immutable, so keep a reference
+        self._synced_version = snapshot.version
+
+    def _rebuild(self):
+        self._index = defaultdict(list)
+        self._keys = {}
+        key_of = SORT_KEYS[self.sort]
+        for name, status in self._statuses.items():
+            key = self._keys[name] = key_of(status)
+            self._index[None].append(key)
+            self._index[status.status].append(key)
+        for entries in self._index.values():
+            entries.sort()
+
+    def set_sort(self, sort: str):
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort order: {sort}")
+        if sort != self.sort:
+            self.sort = sort
+            self._rebuild()
+            self.offset = 0
+            self.version += 1
+
+    def set_filter(self, status: Optional[str]):
+        if status != self.status:
+            self.status = status
+            self.offset = 0
+            self.version += 1
+
+    def cycle_sort(self):
+        orders = list(SORT_KEYS)
+        self.set_sort(orders[(orders.index(self.sort) + 1) % len(orders)])
+
+    def cycle_filter(self):
+        self.set_filter(STATUS_FILTERS[(STATUS_FILTERS.index(self.status) + 1) % len(STATUS_FILTERS)])
+
+    def scroll(self, rows: int):
+        offset = max(0, min(self.offset + rows, self.count() - self.page_size))
+        if offset != self.offset:
+            self.offset = offset
+            self.version += 1
+
+    def page(self, pages: int):
+        self.scroll(pages * self.page_size)
+
+    def rows(self, count: int) -> List[BotStatus]:
+        """Statuses for the ``count`` rows starting at the scroll offset"""
+        entries = self._index[self.status]
+        self.offset = max(0, min(self.offset, len(entries) - count))
+        return [self._statuses[key[-1]] for key in entries[self.offset:self.offset + count]]
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        self.page_size = max(1, (options.height or self.page_size + CHROME_LINES) - CHROME_LINES)
+        table = Table(show_header=True, header_style="bold blue", expand=True)
+        table.add_column("Bot", style="cyan", no_wrap=True)
+        table.add_column("Status", style="green")
+        table.add_column("Trades", style="white", justify="right")
+        table.add_column("PnL", style="yellow", justify="right")
+
+        visible = self.rows(self.page_size)
+        for status in visible:
+            color = STATUS_COLORS.get(status.status, "white")
+            table.add_row(
+                status.name,
+                f"[{color}]{status.status}[/{color}]",
+                str(status.total_trades),
+                f"${status.pnl:.2f}"
+            )
+        if not self._statuses:
+            table.add_row("No bots", "deployed", "", "")
+        yield table
+
+        total = self.count()
+        shown = f"{self.offset + 1}-{self.offset + len(visible)}" if visible else "0"
+        yield Text(
+            f"{shown} of {total} | sort: {self.sort} | filter: {self.status or 'all'}",
+            style="dim", no_wrap=True, overflow="ellipsis"
+        )
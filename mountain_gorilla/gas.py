@@ -0,0 +1,272 @@
+"""
+Gas Fee Analytics for Mountain Gorilla
+Streaming statistics over gas price history: EWMA trend, a log-bucket
+percentile sketch, hour-of-day seasonality and a cheapest-window forecast
+that callers can query in constant time to defer non-urgent transactions.
+"""
+
+import os
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+import numpy as np
+
+# Relative accuracy of the percentile sketch (1%) and the gwei range it covers
+SKETCH_ACCURACY = 0.01
+SKETCH_MIN_GWEI = 0.01
+SKETCH_MAX_GWEI = 10000.0
+# Observations needed before percentiles replace the fixed status thresholds
+MIN_SAMPLES_FOR_PERCENTILES = 30
+# Longest horizon forecast and cheapest_window() can look ahead, in hours
+MAX_HORIZON_HOURS = 24
+# Where the tracker persists history, so processes without a feed (the CLI) can use it
+GAS_STATE_PATH = os.environ.get("MGCC_GAS_STATE", "gas_analytics.npz")
+# A reading older than this is not a basis for deferring a transaction
+MAX_READING_AGE = timedelta(minutes=15)
+
+@dataclass(frozen=True)
+class GasWindow:
+    """Forecast cheapest time to transact within a horizon"""
+    hours_ahead: int  # 0 means now
+    starts_at: datetime
+    expected_gwei: float
+
+class PercentileSketch:
+    """Log-bucketed histogram with bounded relative error (DDSketch style).
+
+    Values fall into buckets whose bounds grow geometrically, so any
+    quantile is reported within ``accuracy`` of the true value while
+    memory stays a few hundred counters regardless of history length.
+    """
+
+    def __init__(self, accuracy: float = SKETCH_ACCURACY,
+                 min_value: float = SKETCH_MIN_GWEI, max_value: float = SKETCH_MAX_GWEI):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self._offset = math.ceil(math.log(min_value) / self._log_gamma)
+        size = math.ceil(math.log(max_value) / self._log_gamma) - self._offset + 1
+        self.counts = np.zeros(size, dtype=np.int64)
+        self.total = 0
+        self._cumulative: Optional[np.ndarray] = None  # cached running totals, reset on add
+
+    def _bucket(self, value: float) -> int:
+        value = max(value, self.min_value)
+        index = math.ceil(math.log(value) / self._log_gamma) - self._offset
+        return min(max(index, 0), len(self.counts) - 1)
+
+    def _bucket_value(self, index: int) -> float:
+        """Midpoint (in relative terms) of a bucket"""
+        return 2 * self.gamma ** (index + self._offset) / (1 + self.gamma)
+
+    def add(self, value: float):
+        self.counts[self._bucket(value)] += 1
+        self.total += 1
+        self._cumulative = None
+
+    def _running(self) -> np.ndarray:
+        if self._cumulative is None:
+            self._cumulative = np.cumsum(self.counts)
+        return self._cumulative
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.total:
+            return None
+        rank = min(max(q, 0.0), 1.0) * (self.total - 1)
+        index = int(np.searchsorted(self._running(), rank, side="right"))
+        return self._bucket_value(index)
+
+    def rank(self, value: float) -> float:
+        """Fraction of observations at or below ``value``"""
+        if not self.total:
+            return 0.0
+        return float(self._running()[self._bucket(value)]) / self.total
+
+class GasAnalytics:
+    """Streaming gas model fed one reading at a time via ``observe``.
+
+    Every observation updates the EWMAs, the sketch and the hour-of-day
+    profile, then recomputes the 24-hour forecast and the cheapest window
+    for every horizon. That is a fixed amount of work per reading, and it
+    leaves ``cheapest_window`` and ``should_defer`` as table lookups.
+    """
+
+    def __init__(self, fast_alpha: float = 0.3, slow_alpha: float = 0.02, hourly_alpha: float = 0.1):
+        self.fast_alpha = fast_alpha
+        self.slow_alpha = slow_alpha
+        self.hourly_alpha = hourly_alpha
+        self.latest: Optional[float] = None
+        self.observed_at: Optional[datetime] = None
+        self.ewma: Optional[float] = None
+        self.ewma_slow: Optional[float] = None
+        self.variance = 0.0  # exponentially weighted, around the fast EWMA
+        self.samples = 0
+        self.sketch = PercentileSketch()
+        self.hourly = np.full(24, np.nan)  # per-hour EWMA of gwei
+        self.hourly_counts = np.zeros(24, dtype=np.int64)
+        self._forecast = np.zeros(MAX_HORIZON_HOURS + 1)
+        # _best[n] = offset of the cheapest hour among offsets 0..n
+        self._best = np.zeros(MAX_HORIZON_HOURS + 1, dtype=np.int64)
+        self._lock = threading.Lock()
+
+    def observe(self, gwei: float, when: datetime = None):
+        """Record one gas price reading"""
+        when = when or datetime.now()
+        with self._lock:
+            self.latest = gwei
+            self.observed_at = when
+            self.samples += 1
+            if self.ewma is None:
+                self.ewma = self.ewma_slow = gwei
+            else:
+                delta = gwei - self.ewma
+                self.ewma += self.fast_alpha * delta
+                self.variance = (1 - self.fast_alpha) * (self.variance + self.fast_alpha * delta * delta)
+                self.ewma_slow += self.slow_alpha * (gwei - self.ewma_slow)
+            self.sketch.add(gwei)
+
+            hour = when.hour
+            if self.hourly_counts[hour]:
+                self.hourly[hour] += self.hourly_alpha * (gwei - self.hourly[hour])
+            else:
+                self.hourly[hour] = gwei
+            self.hourly_counts[hour] += 1
+            self._refresh_forecast(hour)
+
+    def save(self, path: str):
+        """Write the model to ``path`` (npz), atomically"""
+        with self._lock:
+            state = dict(
+                latest=np.nan if self.latest is None else self.latest,
+                observed_at=self.observed_at.isoformat() if self.observed_at else "",
+                ewma=np.nan if self.ewma is None else self.ewma,
+                ewma_slow=np.nan if self.ewma_slow is None else self.ewma_slow,
+                variance=self.variance,
+                samples=self.samples,
+                sketch_counts=self.sketch.counts,
+                hourly=self.hourly,
+                hourly_counts=self.hourly_counts,
+            )
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, **state)
+        os.replace(tmp, path)
+
+    def restore(self, path: str) -> bool:
+        """Load a model saved by ``save`` into this instance; False if there is none"""
+        try:
+            with np.load(path) as data:
+                state = {name: data[name] for name in data.files}
+        except (OSError, ValueError, KeyError):
+            return False
+        if not state["observed_at"].item() or len(state["sketch_counts"]) != len(self.sketch.counts):
+            return False
+        with self._lock:
+            self.latest = float(state["latest"])
+            self.observed_at = datetime.fromisoformat(str(state["observed_at"]))
+            self.ewma = float(state["ewma"])
+            self.ewma_slow = float(state["ewma_slow"])
+            self.variance = float(state["variance"])
+            self.samples = int(state["samples"])
+            self.sketch.counts = state["sketch_counts"].astype(np.int64)
+            self.sketch.total = int(self.sketch.counts.sum())
+            self.sketch._cumulative = None
+            self.hourly = state["hourly"].astype(np.float64)
+            self.hourly_counts = state["hourly_counts"].astype(np.int64)
+            self._refresh_forecast(self.observed_at.hour)
+        return True
+
+    def _seasonal_factors(self) -> np.ndarray:
+        """Each hour's typical gas relative to the all-day mean (1.0 if unseen)"""
+        seen = self.hourly_counts > 0
+        factors = np.ones(24)
+        if seen.sum() > 1:
+            factors[seen] = self.hourly[seen] / self.hourly[seen].mean()
+        return factors
+
+    def _refresh_forecast(self, hour: int):
+        factors = self._seasonal_factors()
+        level = self.ewma / factors[hour]  # deseasonalized current level
+        offsets = np.arange(MAX_HORIZON_HOURS + 1)
+        self._forecast = level * factors[(hour + offsets) % 24]
+        self._forecast[0] = self.latest
+        best = 0
+        for n in range(MAX_HORIZON_HOURS + 1):
+            if self._forecast[n] < self._forecast[best]:
+                best = n
+            self._best[n] = best
+
+    @property
+    def volatility(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def trend(self) -> str:
+        """Short-term direction of the fast EWMA against the slow one"""
+        if self.ewma is None or not self.ewma_slow:
+            return "flat"
+        ratio = self.ewma / self.ewma_slow
+        return "rising" if ratio > 1.05 else "falling" if ratio < 0.95 else "flat"
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Approximate ``q`` quantile (0-1) of every reading seen"""
+        return self.sketch.quantile(q)
+
+    def rank(self, gwei: float = None) -> float:
+        """Share of past readings at or below ``gwei`` (default: the latest)"""
+        return self.sketch.rank(self.latest if gwei is None else gwei)
+
+    def hourly_profile(self) -> List[Optional[float]]:
+        """Typical gas for each hour of the day; None for hours not yet seen"""
+        return [None if count == 0 else float(value) for value, count in zip(self.hourly, self.hourly_counts)]
+
+    def forecast(self, hours: int = 6) -> List[float]:
+        """Expected gas for now and each of the next ``hours`` hours"""
+        hours = min(max(hours, 0), MAX_HORIZON_HOURS)
+        return self._forecast[:hours + 1].tolist()
+
+    def cheapest_window(self, hours: int = 6) -> Optional[GasWindow]:
+        """Cheapest expected hour within the next ``hours`` hours (O(1))"""
+        if self.latest is None:
+            return None
+        hours = min(max(hours, 0), MAX_HORIZON_HOURS)
+        offset = int(self._best[hours])
+        starts_at = self.observed_at if offset == 0 else (
+            self.observed_at.replace(minute=0, second=0, microsecond=0) + timedelta(hours=offset)
+        )
+        return GasWindow(hours_ahead=offset, starts_at=starts_at, expected_gwei=float(self._forecast[offset]))
+
+    def is_fresh(self, now: datetime = None) -> bool:
+        """Whether the latest reading is recent enough to act on"""
+        return self.observed_at is not None and (now or datetime.now()) - self.observed_at <= MAX_READING_AGE
+
+    def should_defer(self, max_wait_hours: int = 6, min_savings: float = 0.1, urgent: bool = False) -> bool:
+        """Whether waiting up to ``max_wait_hours`` is expected to save ``min_savings`` of the gas.
+
+        Never defers on a stale or missing reading.
+        """
+        if urgent or not self.is_fresh():
+            return False
+        window = self.cheapest_window(max_wait_hours)
+        if window is None or window.hours_ahead == 0:
+            return False
+        return window.expected_gwei <= self.latest * (1 - min_savings)
+
+    def status(self, gwei: float = None) -> str:
+        """Classify a reading as low, medium or high.
+
+        Uses the reading's rank in history once there is enough of it, and
+        fixed gwei thresholds before that.
+        """
+        gwei = self.latest if gwei is None else gwei
+        if gwei is None:
+            return "unknown"
+        if self.samples >= MIN_SAMPLES_FOR_PERCENTILES:
+            rank = self.sketch.rank(gwei)
+            return "low" if rank <= 0.25 else "medium" if rank <= 0.75 else "high"
+        return "low" if gwei < 15 else "medium" if gwei < 40 else "high"
+
+# Global gas analytics instance, fed by the gas tracker
+gas_analytics = GasAnalytics()
@@ -0,0 +1,291 @@
+"""
+Bulk Ingest for Mountain Gorilla
+Incremental JSON-array and NDJSON parsing of request bodies, one-pass
+validation and spooling of the valid items for a single storage write.
+"""
+
+import io
+import json
+import re
+import codecs
+import pickle
+import tempfile
+from decimal import Decimal, InvalidOperation
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Bytes read from the request body at a time
+CHUNK_SIZE = 64 * 1024
+# Most items accepted in one bulk request
+MAX_BULK_ITEMS = 100_000
+# Validated items kept in memory before the spool moves to a temp file
+SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+# Longest NDJSON line read; longer lines are skipped and reported as item errors
+MAX_LINE_BYTES = 1024 * 1024
+# Largest JSON array element read; a longer one rejects the whole body
+MAX_ELEMENT_BYTES = MAX_LINE_BYTES
+
+NDJSON_TYPES = ("application/x-ndjson", "application/jsonl")
+
+# Floats parse as Decimal so amounts stay exact
+_decoder = json.JSONDecoder(parse_float=Decimal)
+
+# Characters that can end a JSON array element, by scanner state
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[\s,\]]')
+
+class BulkError(ValueError):
+    """The body as a whole cannot be ingested (malformed or too large)"""
+
+class ItemError(ValueError):
+    """One item failed validation"""
+
+def iter_json_array(stream: BinaryIO, chunk_size: int = CHUNK_SIZE,
+                    max_element: int = MAX_ELEMENT_BYTES) -> Iterator[Tuple[Any, str]]:
+    """Yield the elements of a JSON array body one at a time.
+
+    Reads ``chunk_size`` bytes at a time and scans each element for its end
+    as the chunks arrive, resuming where the last chunk stopped, then
+    decodes it once. Only one element is held at once, read in chunks that
+    grow with it; an element longer than ``max_element`` bytes is a
+    ``BulkError`` as soon as that much of it is buffered. Yields ``(value, None)`` pairs to match
+    ``iter_ndjson``. Anything but whitespace after the closing bracket is a
+    ``BulkError``.
+    """
+    buffer, pos, eof, started = "", 0, False, False
+    scan, depth, in_string, scalar = 0, 0, False, False
+    utf8 = codecs.getincrementaldecoder("utf-8")()  # characters may straddle chunks
+
+    def fill() -> int:
+        """Read a chunk, dropping the consumed text; returns the bytes read"""
+        nonlocal buffer, pos, scan, eof
+        # Read as much as is already held so a long element is copied O(n) times overall
+        chunk = stream.read(max(chunk_size, len(buffer) - pos))
+        if not chunk:
+            eof = True
+            return 0
+        try:
+            buffer = buffer[pos:] + utf8.decode(chunk)
+        except UnicodeDecodeError:
+            raise BulkError("Body is not valid UTF-8")
+        scan -= pos
+        pos = 0
+        return len(chunk)
+
+    def skip_space():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return
+
+    def element_end() -> Optional[int]:
+        """Index just past the element at ``pos``, or None if it runs past the buffer"""
+        nonlocal scan, depth, in_string
+        if scalar:
+            match = _SCALAR_END.search(buffer, scan)
+            if match:
+                return match.start()
+            scan = len(buffer)
+            return None
+        while True:
+            match = (_STRING_SPECIAL if in_string else _STRUCTURE).search(buffer, scan)
+            if not match:
+                scan = max(scan, len(buffer))  # an escape may point past the end
+                return None
+            char, scan = match.group(), match.end()
+            if in_string:
+                if char == "\\":
+                    scan += 1
+                    continue
+                in_string = False
+            elif char == '"':
+                in_string = True
+                continue
+            elif char in "[{":
+                depth += 1
+                continue
+            else:
+                depth -= 1
+            if depth <= 0:
+                return scan
+
+    skip_space()
+    if pos >= len(buffer) or buffer[pos] != "[":
+        raise BulkError("Body must be a JSON array")
+    pos += 1
+    while True:
+        skip_space()
+        if pos >= len(buffer):
+            raise BulkError("Unterminated JSON array")
+        if buffer[pos] == "]":
+            pos += 1
+            skip_space()
+            if pos < len(buffer):
+                raise BulkError(f"Unexpected content after the JSON array near offset {pos}")
+            return
+        if started:
+            if buffer[pos] != ",":
+                raise BulkError(f"Expected ',' in JSON array near offset {pos}")
+            pos += 1
+            skip_space()
+            if pos >= len(buffer):
+                raise BulkError("Unterminated JSON array")
+        started = True
+
+        try:
+            value, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if eof:
+                raise BulkError(f"Invalid JSON: {e.msg}")
+            end = len(buffer)
+        # A number cut off at a chunk boundary decodes short ("1." as 1)
+        if not eof and (end == len(buffer) or buffer[end] in ".eE"):
+            # Incomplete (or malformed): find its end, then decode it once
+            scan, depth, in_string, scalar = pos, 0, False, buffer[pos] not in '"[{'
+            size = None  # bytes of the element buffered so far, once it spans chunks
+            end = element_end()
+            while end is None and not eof:
+                if size is None:
+                    size = len(buffer[pos:].encode("utf-8"))
+                if size > max_element:
+                    raise BulkError(f"Array element longer than {max_element} bytes")
+                size += fill()
+                end = element_end()
+            try:
+                value, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                raise BulkError(f"Invalid JSON: {e.msg}")
+        if (end - pos) * 4 > max_element and len(buffer[pos:end].encode("utf-8")) > max_element:
+            raise BulkError(f"Array element longer than {max_element} bytes")
+        pos = end
+        yield value, None
+
+def iter_ndjson(stream: BinaryIO, max_line: int = MAX_LINE_BYTES) -> Iterator[Tuple[Any, str]]:
+    """Yield ``(value, error)`` for each non-blank line of an NDJSON body.
+
+    A line longer than ``max_line`` bytes is skipped without being held in
+    memory and reported as that item's error.
+    """
+    # Raw request streams read lines a byte at a time; buffer them
+    reader = io.BufferedReader(stream, CHUNK_SIZE)
+    while True:
+        line = reader.readline(max_line + 1)
+        if not line:
+            return
+        if len(line) > max_line and not line.endswith(b"\n"):
+            while line and not line.endswith(b"\n"):
+                line = reader.readline(CHUNK_SIZE)
+            yield None, f"Line longer than {max_line} bytes"
+            continue
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield _decoder.decode(line.decode("utf-8")), None
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            yield None, f"Invalid JSON: {getattr(e, 'msg', e)}"
+
+def iter_body(stream: BinaryIO, content_type: str) -> Iterator[Tuple[Any, str]]:
+    """Items of a bulk body: NDJSON for the NDJSON media types, else a JSON array"""
+    if content_type in NDJSON_TYPES:
+        return iter_ndjson(stream)
+    return iter_json_array(stream)
+
+def _text(item: Dict[str, Any], field: str, required: bool = False, default: str = None) -> str:
+    value = item.get(field, default)
+    if value is None:
+        if required:
+            raise ItemError(f"'{field}' is required")
+        return default
+    if not isinstance(value, str):
+        raise ItemError(f"'{field}' must be a string")
+    return value
+
+def validate_memory(item: Dict[str, Any]) -> Dict[str, Any]:
+    tags = item.get("tags") or []
+    if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+        raise ItemError("'tags' must be a list of strings")
+    return {"content": _text(item, "content", required=True), "tags": tags}
+
+def validate_transaction(item: Dict[str, Any]) -> Dict[str, Any]:
+    amount = item.get("amount")
+    if amount is None or isinstance(amount, bool):
+        raise ItemError("'amount' is required")
+    try:
+        amount = Decimal(str(amount))
+    except InvalidOperation:
+        raise ItemError("'amount' must be a number")
+    if not amount.is_finite():
+        raise ItemError("'amount' must be finite")
+    return {
+        "currency": _text(item, "currency", required=True),
+        "amount": amount,
+        "transaction_type": _text(item, "type", required=True),
+        "description": _text(item, "description", default=""),
+    }
+
+def validate_task(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "title": _text(item, "title", required=True),
+        "description": _text(item, "description", default=""),
+        "priority": _text(item, "priority", default="medium"),
+        "due_date": _text(item, "due_date"),
+    }
+
+class Spool:
+    """Validated items in arrival order, kept in memory up to a limit then on disk"""
+
+    def __init__(self, max_memory: int = SPOOL_MEMORY_BYTES):
+        self._file = tempfile.SpooledTemporaryFile(max_size=max_memory)
+        self.count = 0
+
+    def append(self, item: Dict[str, Any]):
+        pickle.dump(item, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.count += 1
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self._file.seek(0)
+        for _ in range(self.count):
+            yield pickle.load(self._file)
+
+    def close(self):
+        self._file.close()
+
+def ingest(items: Iterator[Tuple[Any, str]], validate: Callable[[Dict[str, Any]], Dict[str, Any]],
+           apply: Callable[[Iterator[Dict[str, Any]]], List[int]],
+           max_items: int = MAX_BULK_ITEMS) -> Dict[str, Any]:
+    """Validate every item in one pass, then hand the valid ones to ``apply`` at once.
+
+    ``apply`` receives an iterator of validated items and must write them in
+    one storage transaction, returning their ids in order. Reading and
+    validating finish before it runs, so a slow upload never holds the
+    database write lock. Invalid items are reported and skipped; a malformed
+    body or too many items raise ``BulkError`` before anything is written.
+    """
+    results: List[Dict[str, Any]] = []
+    spool = Spool()
+    try:
+        for index, (item, error) in enumerate(items):
+            if index >= max_items:
+                raise BulkError(f"At most {max_items} items per request")
+            if error is None:
+                try:
+                    if not isinstance(item, dict):
+                        raise ItemError("Item must be a JSON object")
+                    spool.append(validate(item))
+                except ItemError as e:
+                    error = str(e)
+            results.append({"index": index, "status": "error", "error": error} if error
+                           else {"index": index, "status": "created"})
+
+        ids = iter(apply(iter(spool)) if spool.count else [])
+        for result in results:
+            if result["status"] == "created":
+                result["id"] = next(ids)
+    finally:
+        spool.close()
+
+    created = spool.count
+    return {"created": created, "failed": len(results) - created, "results": results}
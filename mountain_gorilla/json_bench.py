@@ -0,0 +1,89 @@
+"""
+JSON Encoding Benchmark for Mountain Gorilla
+Times Flask's standard JSON provider against the fast provider on payloads
+shaped like the web API's balance, transaction, trade and bot responses.
+"""
+
+import time
+import random
+from decimal import Decimal
+from typing import Any, Callable, Dict
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from rich.table import Table
+from mountain_gorilla.json_provider import FastJSONProvider
+
+def typical_payloads(size: int = 1000, seed: int = 0) -> Dict[str, Any]:
+    """Payloads mirroring the API's responses; ``size`` rows for the list ones"""
+    rng = random.Random(seed)
+    amount = lambda: Decimal(f"{rng.uniform(-5, 5):.8f}")
+    timestamp = "2024-03-21T12:00:00.000000"
+    return {
+        "balance": {currency: amount() for currency in ("ETH", "BTC", "USDC", "LINK", "UNI", "AAVE")},
+        "transactions": [
+            {"id": i, "currency": rng.choice(("ETH", "BTC")), "amount": amount(),
+             "type": rng.choice(("deposit", "withdrawal", "fee")), "description": f"tx {i}",
+             "timestamp": timestamp}
+            for i in range(size)
+        ],
+        "trades": [
+            {"id": i, "symbol": rng.choice(("ETH", "BTC", "LINK")), "amount": amount(),
+             "price": Decimal(f"{rng.uniform(1, 4000):.2f}"), "type": rng.choice(("buy", "sell")),
+             "timestamp": timestamp}
+            for i in range(size)
+        ],
+        "memories": [
+            {"id": i, "content": f"memory {i} " * 8, "tags": ["work", f"tag{i % 10}"], "timestamp": timestamp}
+            for i in range(50)
+        ],
+        "bots": {
+            name: {"level": rng.randint(1, 20), "abilities": ["A", "B", "C"],
+                   "ascii_art": "\n      ____\n     (o  o)\n      |  |\n      ||||\n    "}
+            for name in ("MemoriBot", "FinanBot", "TradeBot", "TaskBot", "CoachBot")
+        },
+    }
+
+def _time(encode: Callable[[Any], Any], payload: Any, min_time: float) -> float:
+    """Seconds per call, repeating until ``min_time`` has elapsed"""
+    encode(payload)
+    calls, started = 0, time.perf_counter()
+    while True:
+        encode(payload)
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            return elapsed / calls
+
+def run_benchmark(size: int = 1000, min_time: float = 0.2) -> Dict[str, Any]:
+    """Encode each payload into a response body with both providers"""
+    app = Flask(__name__)
+    providers = {"stdlib": DefaultJSONProvider(app), "fast": FastJSONProvider(app)}
+    encoders = {
+        "stdlib": lambda obj: providers["stdlib"].dumps(obj).encode("utf-8"),
+        "fast": providers["fast"].dumpb,
+    }
+    results = {}
+    for name, payload in typical_payloads(size).items():
+        timings = {label: _time(encode, payload, min_time) for label, encode in encoders.items()}
+        results[name] = {
+            "bytes": len(encoders["fast"](payload)),
+            "stdlib_us": timings["stdlib"] * 1e6,
+            "fast_us": timings["fast"] * 1e6,
+            "speedup": timings["stdlib"] / timings["fast"],
+        }
+    return {"fast_encoder": "msgspec" if providers["fast"].fast else "stdlib (msgspec not installed)",
+            "size": size, "payloads": results}
+
+def build_report_table(report: Dict[str, Any]) -> Table:
+    """Rich table of a ``run_benchmark`` report"""
+    table = Table(title=f"🦍 JSON Encoding Benchmark ({report['size']} rows per list)")
+    table.add_column("Payload", style="cyan")
+    table.add_column("Bytes", style="white", justify="right")
+    table.add_column("stdlib µs", style="yellow", justify="right")
+    table.add_column("fast µs", style="green", justify="right")
+    table.add_column("Speedup", style="bold green", justify="right")
+    for name, result in report["payloads"].items():
+        table.add_row(name, f"{result['bytes']:,}", f"{result['stdlib_us']:.1f}",
+                      f"{result['fast_us']:.1f}", f"{result['speedup']:.1f}x")
+    table.caption = f"Fast encoder: {report['fast_encoder']}"
+    return table
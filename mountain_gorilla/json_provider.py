@@ -0,0 +1,76 @@
+"""
+Fast JSON Provider for the Mountain Gorilla web app
+Encodes responses with msgspec when it is installed, falling back to
+Flask's standard-library provider otherwise.
+"""
+
+from typing import Any
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import msgspec
+except ImportError:  # optional: stdlib json is used instead
+    msgspec = None
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by msgspec's C encoder.
+
+    msgspec encodes Decimal, datetime, date, UUID and dataclasses natively,
+    so FinanBot and TradeBot amounts need no per-object Python callback.
+    Decimals are written as exact strings by default (as Flask does) or as
+    JSON numbers with ``decimal_format = "number"``. Keys are sorted, so
+    bodies and ETags are stable. ``response`` encodes straight to bytes,
+    skipping the stdlib path's intermediate str.
+
+    Falls back to the standard provider when msgspec is missing, when extra
+    ``json.dumps`` options are passed, in debug mode (pretty output), and
+    for objects msgspec cannot sort (dicts with non-str keys).
+    Unlike the stdlib provider, datetimes are encoded as ISO 8601.
+    """
+
+    decimal_format = "string"
+
+    def __init__(self, app: Flask):
+        super().__init__(app)
+        self.fast = msgspec is not None
+        if self.fast:
+            # enc_hook only runs for types msgspec does not know (e.g. __html__ objects)
+            self._encoder = msgspec.json.Encoder(enc_hook=self.default, decimal_format=self.decimal_format,
+                                                 order="sorted")
+            self._decoder = msgspec.json.Decoder()
+
+    def _use_fast(self, kwargs: dict) -> bool:
+        return self.fast and not kwargs and not (self.compact is None and self._app.debug) and self.compact is not False
+
+    def _encode(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except TypeError:
+            # Sorted output needs str keys; the stdlib provider sorts the rest
+            return super().dumps(obj).encode("utf-8")
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if not self._use_fast(kwargs):
+            return super().dumps(obj, **kwargs)
+        return self._encode(obj).decode("utf-8")
+
+    def dumpb(self, obj: Any) -> bytes:
+        """Encode ``obj`` to UTF-8 JSON bytes"""
+        if not self._use_fast({}):
+            return self.dumps(obj).encode("utf-8")
+        return self._encode(obj)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if not self.fast or kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return self._decoder.decode(s)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from None
+
+    def response(self, *args: Any, **kwargs: Any):
+        if not self._use_fast({}):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj), mimetype=self.mimetype)
@@ -0,0 +1,427 @@
+"""
+HTTP Load Testing for Mountain Gorilla
+Drives the web API with a weighted mix of reads and writes from an asyncio
+client pool, either closed-loop or at a target request rate, against a
+running server, gunicorn on localhost or the in-process Flask test client.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+from rich.table import Table
+
+@dataclass(frozen=True)
+class Operation:
+    """One kind of API call in a load mix"""
+    method: str
+    path: str
+    body: Optional[Callable[[random.Random], Any]] = None  # JSON payload factory
+
+OPERATIONS: Dict[str, Operation] = {
+    "bots": Operation("GET", "/api/bots"),
+    "bot": Operation("GET", "/api/bots/MemoriBot"),
+    "summary": Operation("GET", "/api/summary"),
+    "dashboard": Operation("GET", "/api/dashboard"),
+    "memories": Operation("GET", "/api/bots/MemoriBot/memories?limit=50"),
+    "store_memory": Operation("POST", "/api/bots/MemoriBot/memories", lambda rng: {
+        "content": f"load test memory {rng.randrange(10 ** 6)}",
+        "tags": rng.sample(["work", "ideas", "eth", "personal"], 2)}),
+    "balance": Operation("GET", "/api/bots/FinanBot/balance"),
+    "record_transaction": Operation("POST", "/api/bots/FinanBot/transactions", lambda rng: {
+        "currency": rng.choice(["ETH", "BTC"]), "amount": f"{rng.uniform(-1, 1):.6f}",
+        "type": rng.choice(["deposit", "withdrawal", "fee"]), "description": "load test"}),
+    "tasks": Operation("GET", "/api/bots/TaskBot/tasks?limit=50"),
+    "add_task": Operation("POST", "/api/bots/TaskBot/tasks", lambda rng: {
+        "title": f"task {rng.randrange(10 ** 6)}", "description": "load test",
+        "priority": rng.choice(["low", "medium", "high"])}),
+    "goals": Operation("GET", "/api/bots/CoachBot/goals?limit=50"),
+    "ai_suggest": Operation("POST", "/api/ai/bots/suggest", lambda rng: {
+        "task": rng.choice(["store memories about trades", "budget tracking", "manage tasks"])}),
+    "collaborations": Operation("GET", "/api/ai/collaborations?limit=50"),
+    "ai_collaborate": Operation("POST", "/api/ai/collaborate", lambda rng: {
+        "task": "load test collaboration", "capabilities": ["Store Memories", "Budget Tracking"]}),
+}
+# Relative weights, roughly what the web UI generates: mostly polling reads
+DEFAULT_MIX = {
+    "bots": 25, "bot": 10, "summary": 8, "dashboard": 8, "memories": 12, "store_memory": 6, "balance": 10,
+    "record_transaction": 4, "tasks": 10, "add_task": 4, "goals": 5, "ai_suggest": 4, "collaborations": 3,
+    "ai_collaborate": 2,
+}
+# Requests slower than this count as errors, so a starved server still finishes the run
+REQUEST_TIMEOUT = 5.0
+# Where app.py and gunicorn.conf.py live
+APP_ROOT = Path(__file__).resolve().parent.parent
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse "bots=5,add_task=1" into operation weights"""
+    mix = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{name}' (choose from {', '.join(OPERATIONS)})")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight for '{name}': {weight}")
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("Mix needs at least one operation with a positive weight")
+    return mix
+
+class HTTPClient:
+    """Minimal HTTP/1.1 keep-alive client for one connection"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def _connect(self):
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def send(self, path: str, method: str = "GET", body: bytes = b"",
+                   content_type: str = "application/json") -> int:
+        """Send one request and read the full response; returns the status code"""
+        await self._connect()
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+        if body or method != "GET":
+            head += f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+        self._writer.write(head.encode() + b"\r\n" + body)
+        await self._writer.drain()
+
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        status = int(status_line.split()[1])
+        length, chunked, keep_alive = None, False, True
+        while True:
+            line = await self._reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding":
+                chunked = value.strip().lower().endswith("chunked")
+            elif name == "connection" and value.strip().lower() == "close":
+                keep_alive = False
+        if chunked:  # takes precedence over Content-Length (RFC 9112 6.3)
+            await self._read_chunked()
+        elif length is None:
+            await self._reader.read()
+            keep_alive = False
+        else:
+            await self._reader.readexactly(length)
+        if not keep_alive:
+            self.close()
+        return status
+
+    async def _read_chunked(self):
+        """Read a chunked body up to its last chunk and trailers"""
+        while True:
+            size_line = await self._reader.readline()
+            if not size_line:
+                raise ConnectionError("connection closed mid-body")
+            try:
+                size = int(size_line.split(b";")[0], 16)
+            except ValueError:
+                raise ConnectionError(f"invalid chunk size line {size_line!r}")
+            if size == 0:
+                break
+            await self._reader.readexactly(size + 2)  # chunk data and its CRLF
+        while await self._reader.readline() not in (b"\r\n", b"\n", b""):
+            pass
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+class TestClientTransport:
+    """Same interface as HTTPClient, backed by the app's Flask test client.
+
+    Requests run on a thread pool so the asyncio pool keeps scheduling
+    while the app works; this measures the app without any HTTP server.
+    """
+
+    def __init__(self, flask_app, executor: ThreadPoolExecutor):
+        self.client = flask_app.test_client()
+        self.executor = executor
+
+    async def send(self, path: str, method: str = "GET", body: bytes = b"",
+                   content_type: str = "application/json") -> int:
+        def call():
+            response = self.client.open(path, method=method, data=body or None,
+                                        content_type=content_type if body else None)
+            response.close()
+            return response.status_code
+        return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+
+    def close(self):
+        pass
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    """Mean/p50/p95/p99/max of latencies in seconds, reported in milliseconds"""
+    if not samples:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": pick(0.50) * 1000,
+        "p95_ms": pick(0.95) * 1000,
+        "p99_ms": pick(0.99) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+async def _hold_stream(host: str, port: int):
+    """Open an SSE stream and read it until cancelled, like an idle browser tab"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(f"GET /api/stream HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+        await writer.drain()
+        while await reader.read(4096):
+            pass
+    finally:
+        writer.close()
+
+async def run_load(transport: Callable[[], Any], mix: Dict[str, float] = None, rps: float = None,
+                   concurrency: int = 50, duration: float = 10.0, seed: int = 0) -> Dict:
+    """Run a load mix for ``duration`` seconds and return throughput and latency stats.
+
+    ``transport()`` makes one client (an HTTPClient or TestClientTransport);
+    each of the ``concurrency`` workers owns one. Without ``rps`` the run is
+    closed-loop: every worker sends its next request as soon as the last
+    one finishes. With ``rps`` requests are issued on a fixed schedule and
+    latency is measured from each request's scheduled time, so queueing
+    behind a slow server is counted rather than hidden; requests still
+    queued at the deadline are not sent and count as ``dropped``.
+
+    ``latency`` covers successful requests only. Failed ones (error
+    statuses, timeouts, broken connections) are timed the same way and
+    reported as ``error_latency``, so a server that fails slowly does not
+    look fast.
+    """
+    mix = mix or DEFAULT_MIX
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    latencies: Dict[str, List[float]] = {name: [] for name in names}
+    error_latencies: Dict[str, List[float]] = {name: [] for name in names}
+    errors: Dict[str, int] = {name: 0 for name in names}
+    statuses: Dict[str, int] = {}
+    queue: Optional[asyncio.Queue] = asyncio.Queue() if rps else None
+
+    async def send(client, name: str, scheduled: float):
+        operation = OPERATIONS[name]
+        body = json.dumps(operation.body(rng)).encode() if operation.body else b""
+        try:
+            status = await asyncio.wait_for(client.send(operation.path, operation.method, body),
+                                            REQUEST_TIMEOUT)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, IndexError):
+            client.close()
+            errors[name] += 1
+            error_latencies[name].append(time.perf_counter() - scheduled)
+            statuses["failed"] = statuses.get("failed", 0) + 1
+            return
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+        if status >= 400:
+            errors[name] += 1
+            error_latencies[name].append(time.perf_counter() - scheduled)
+        else:
+            latencies[name].append(time.perf_counter() - scheduled)
+
+    async def worker():
+        client = transport()
+        try:
+            if queue is None:
+                while time.perf_counter() < deadline:
+                    await send(client, rng.choices(names, weights)[0], time.perf_counter())
+            else:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    await send(client, *item)
+        finally:
+            client.close()
+
+    started = time.perf_counter()
+    deadline = started + duration
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    issued = dropped = 0
+    if queue is not None:
+        interval = 1.0 / rps
+        while True:
+            scheduled = started + issued * interval
+            if scheduled >= deadline:
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            queue.put_nowait((rng.choices(names, weights)[0], scheduled))
+            issued += 1
+        # Stop at the deadline; what no worker picked up by then is never sent
+        await asyncio.sleep(max(0.0, deadline - time.perf_counter()))
+        while not queue.empty():
+            queue.get_nowait()
+            dropped += 1
+        for _ in workers:
+            queue.put_nowait(None)
+    await asyncio.gather(*workers)
+    elapsed = time.perf_counter() - started
+
+    succeeded = sum(len(samples) for samples in latencies.values())
+    failed = sum(errors.values())
+    return {
+        "mode": "open" if rps else "closed",
+        "target_rps": rps,
+        "concurrency": concurrency,
+        "duration_s": elapsed,
+        "requests": succeeded + failed,
+        "errors": failed,
+        "dropped": dropped,
+        "error_rate": failed / (succeeded + failed) if succeeded + failed else 0.0,
+        "throughput_rps": succeeded / elapsed if elapsed else 0.0,
+        "latency": _percentiles([s for samples in latencies.values() for s in samples]),
+        "error_latency": _percentiles([s for samples in error_latencies.values() for s in samples]),
+        "status_codes": dict(sorted(statuses.items())),
+        "operations": {
+            name: {"requests": len(latencies[name]) + errors[name], "errors": errors[name],
+                   "latency": _percentiles(latencies[name]),
+                   "error_latency": _percentiles(error_latencies[name])}
+            for name in names
+        },
+    }
+
+async def drive(base_url: str, mix: Dict[str, float] = None, rps: float = None, concurrency: int = 50,
+                duration: float = 10.0, streams: int = 0, seed: int = 0) -> Dict:
+    """Load a running server over keep-alive HTTP connections.
+
+    ``streams`` SSE connections are held open for the whole run, which is
+    what pins sync workers in production.
+    """
+    url = urlsplit(base_url)
+    host, port = url.hostname or "127.0.0.1", url.port or 80
+    holders = [asyncio.ensure_future(_hold_stream(host, port)) for _ in range(streams)]
+    if holders:
+        await asyncio.sleep(0.5)  # let the streams occupy the server first
+    try:
+        result = await run_load(lambda: HTTPClient(host, port), mix, rps, concurrency, duration, seed)
+    finally:
+        for holder in holders:
+            holder.cancel()
+        await asyncio.gather(*holders, return_exceptions=True)
+    result["streams"] = streams
+    return result
+
+def load_app():
+    """Import app.py's Flask app, with bot state in a throwaway database"""
+    os.environ.setdefault("MGCC_BOT_DB", os.path.join(tempfile.mkdtemp(prefix="mgcc-loadtest-"), "bot_state.db"))
+    if str(APP_ROOT) not in sys.path:
+        sys.path.insert(0, str(APP_ROOT))
+    import app
+    return app.app
+
+def drive_app(mix: Dict[str, float] = None, rps: float = None, concurrency: int = 8,
+              duration: float = 10.0, seed: int = 0, flask_app=None) -> Dict:
+    """Load the app in process through the Flask test client (no HTTP server)"""
+    flask_app = flask_app or load_app()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        result = asyncio.run(run_load(lambda: TestClientTransport(flask_app, executor), mix, rps,
+                                      concurrency, duration, seed))
+    result["streams"] = 0
+    return result
+
+def _wait_for_port(host: str, port: int, timeout: float = 20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"server on {host}:{port} did not start within {timeout:.0f}s")
+
+def serve(worker_class: str = "gevent", workers: int = 2, port: int = 8765,
+          workdir: str = None) -> subprocess.Popen:
+    """Start ``gunicorn app:app`` on localhost with the given worker class.
+
+    The server runs in ``workdir`` with its own bot database, so a load test
+    never touches the real state.
+    """
+    workdir = workdir or tempfile.mkdtemp(prefix="mgcc-loadtest-")
+    env = dict(os.environ, MGCC_WORKER_CLASS=worker_class, MGCC_WORKERS=str(workers),
+               MGCC_BOT_DB=os.path.join(workdir, "bot_state.db"))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", str(APP_ROOT / "gunicorn.conf.py"),
+         "--pythonpath", str(APP_ROOT), "--bind", f"127.0.0.1:{port}", "app:app"],
+        cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _wait_for_port("127.0.0.1", port)
+    except TimeoutError:
+        process.terminate()
+        raise
+    return process
+
+def compare(worker_classes: Sequence[str] = ("sync", "gevent"), workers: int = 2,
+            mix: Dict[str, float] = None, rps: float = None, concurrency: int = 50,
+            duration: float = 10.0, streams: int = 0, port: int = 8765) -> Dict[str, Dict]:
+    """Run the same load against gunicorn with each worker class in turn"""
+    results = {}
+    for worker_class in worker_classes:
+        process = serve(worker_class, workers, port)
+        try:
+            results[worker_class] = asyncio.run(drive(f"http://127.0.0.1:{port}", mix, rps,
+                                                      concurrency, duration, streams))
+            results[worker_class]["workers"] = workers
+        finally:
+            process.terminate()
+            process.wait(timeout=15)
+    return results
+
+def build_report_table(results: Dict[str, Dict]) -> Table:
+    """Rich table of load results keyed by label (server mode, URL or "test-client")"""
+    table = Table(title="🦍 Web API Load Test")
+    table.add_column("Target", style="cyan")
+    table.add_column("Operation", style="white")
+    table.add_column("Req/s", style="green", justify="right")
+    table.add_column("Errors", style="red", justify="right")
+    table.add_column("p50 ms", style="green", justify="right")
+    table.add_column("p95 ms", style="yellow", justify="right")
+    table.add_column("p99 ms", style="yellow", justify="right")
+    table.add_column("Max ms", style="red", justify="right")
+    table.add_column("Error p95 ms", style="red", justify="right")
+    table.add_column("Dropped", style="red", justify="right")
+
+    for label, result in results.items():
+        rows = [("[bold]all[/bold]", result["throughput_rps"], result["errors"], result["requests"],
+                 result["latency"], result["error_latency"], result["dropped"])]
+        rows += [(name, None, op["errors"], op["requests"], op["latency"], op["error_latency"], None)
+                 for name, op in result["operations"].items()]
+        for i, (name, rate, errors, requests, latency, error_latency, dropped) in enumerate(rows):
+            table.add_row(label if i == 0 else "", name, f"{rate:.0f}" if rate is not None else "",
+                          f"{errors}/{requests}", f"{latency['p50_ms']:.1f}", f"{latency['p95_ms']:.1f}",
+                          f"{latency['p99_ms']:.1f}", f"{latency['max_ms']:.1f}",
+                          f"{error_latency['p95_ms']:.1f}" if errors else "",
+                          str(dropped) if dropped is not None else "")
+        table.add_section()
+    first = next(iter(results.values()), None)
+    if first:
+        pace = f"target {first['target_rps']:.0f} req/s" if first["target_rps"] else "closed loop"
+        table.caption = f"{first['concurrency']} clients, {pace}, {first['streams']} open SSE streams"
+    return table
@@ -0,0 +1,160 @@
+"""
+Simulated Market Feeds for Mountain Gorilla
+Price ticker, portfolio tracker and gas tracker shared by the terminal
+dashboard and the web API's market feed.
+"""
+
+import os
+import time
+import random
+from typing import Dict, Optional
+from mountain_gorilla.events import EventBus, event_bus as default_event_bus, PRICE, GAS, PORTFOLIO
+from mountain_gorilla.ringbuffer import RingBuffer
+from mountain_gorilla.portfolio import PortfolioBook
+from mountain_gorilla.gas import GasAnalytics, GAS_STATE_PATH, gas_analytics as default_gas_analytics
+
+# Points of history kept per series; at one update per second this is 4 hours
+PRICE_HISTORY_POINTS = 4 * 60 * 60
+GAS_HISTORY_POINTS = 4 * 60 * 60
+PORTFOLIO_HISTORY_POINTS = 4 * 60 * 60
+# Where the default portfolio (positions and prior close) is kept between runs
+PORTFOLIO_STATE_PATH = os.environ.get("MGCC_PORTFOLIO_STATE", "portfolio.npz")
+PORTFOLIO_SAVE_INTERVAL = 60.0
+# The default gas model is saved to GAS_STATE_PATH (MGCC_GAS_STATE) this often
+GAS_SAVE_INTERVAL = 60.0
+
+class LivePriceTicker:
+    """Simulates live price data for cryptocurrencies"""
+    
+    def __init__(self, event_bus: EventBus = None, prices: Dict[str, float] = None):
+        self.event_bus = event_bus or default_event_bus
+        self.prices = dict(prices) if prices else {
+            "ETH": 3200.0,
+            "BTC": 65000.0,
+            "USDC": 1.0,
+            "WETH": 3200.0,
+            "UNI": 12.5,
+            "LINK": 18.2
+        }
+        self.price_history = {token: RingBuffer(PRICE_HISTORY_POINTS) for token in self.prices.keys()}
+        self.version = 0  # bumped on every update so renderers can detect changes
+    
+    def update_prices(self):
+        """Simulate price movements"""
+        for token in self.prices:
+            # Simulate realistic price movements
+            change = random.uniform(-0.02, 0.02)  # ±2% change
+            self.prices[token] *= (1 + change)
+            
+            # Keep price history for charts
+            self.price_history[token].append(self.prices[token])
+        self.version += 1
+        
+        self.event_bus.publish(PRICE, prices=dict(self.prices))
+    
+    def get_price_change(self, token: str) -> tuple:
+        """Get current price and 24h change"""
+        if len(self.price_history[token]) < 2:
+            return self.prices[token], 0.0
+        
+        current = self.prices[token]
+        previous = self.price_history[token][-2] if len(self.price_history[token]) > 1 else current
+        change_pct = ((current - previous) / previous) * 100
+        return current, change_pct
+
+class PortfolioTracker:
+    """Tracks portfolio positions and performance across wallets.
+    
+    The default book is kept in ``state_path`` (MGCC_PORTFOLIO_STATE), so
+    daily PnL keeps its prior close across restarts. It is saved at most
+    every PORTFOLIO_SAVE_INTERVAL seconds and whenever the close rolls over.
+    """
+    
+    def __init__(self, book: PortfolioBook = None, event_bus: EventBus = None, state_path: str = None):
+        self.event_bus = event_bus or default_event_bus
+        if book is None:
+            state_path = state_path or PORTFOLIO_STATE_PATH
+            if os.path.exists(state_path):
+                book = PortfolioBook.load(state_path)
+            else:
+                book = PortfolioBook()
+                book.add_position("main", "ETH", 2.5, 3000.0)
+                book.add_position("main", "USDC", 5000.0, 1.0)
+                book.add_position("main", "WETH", 1.0, 3100.0)
+        self.book = book
+        self.state_path = state_path
+        self._saved_at: Optional[float] = None
+        self._saved_date = None
+        self.total_value = 0.0
+        self.unrealized_pnl = 0.0
+        self.daily_pnl = 0.0
+        self.positions: Dict[str, Dict[str, float]] = {}
+        self.value_history = RingBuffer(PORTFOLIO_HISTORY_POINTS)
+    
+    def update_portfolio(self, price_ticker: LivePriceTicker):
+        """Revalue every position at current prices in one vectorized pass"""
+        totals = self.book.revalue(self.book.price_vector(price_ticker.prices))
+        self.total_value = totals["total_value"]
+        self.unrealized_pnl = totals["unrealized_pnl"]
+        self.daily_pnl = totals["daily_pnl"]
+        self.positions = self.book.by_token()
+        self.value_history.append(self.total_value)
+        self._save_state()
+        
+        self.event_bus.publish(PORTFOLIO, **totals)
+    
+    def _save_state(self):
+        if not self.state_path:
+            return
+        now = time.monotonic()
+        rolled = self.book.close_date != self._saved_date
+        if self._saved_at is None or rolled or now - self._saved_at >= PORTFOLIO_SAVE_INTERVAL:
+            self.book.save(self.state_path)
+            self._saved_at = now
+            self._saved_date = self.book.close_date
+
+class GasTracker:
+    """Tracks gas fees and optimal transaction windows.
+    
+    The default analytics model is kept in ``state_path`` (MGCC_GAS_STATE)
+    so that processes with no gas feed of their own, like ``mgcc sign``,
+    can restore it before deciding whether to defer a transaction.
+    """
+    
+    def __init__(self, event_bus: EventBus = None, analytics: GasAnalytics = None, state_path: str = None):
+        self.event_bus = event_bus or default_event_bus
+        if analytics is None:
+            analytics = default_gas_analytics
+            state_path = state_path or GAS_STATE_PATH
+            if analytics.latest is None:
+                analytics.restore(state_path)
+        self.analytics = analytics
+        self.state_path = state_path
+        self._saved_at: Optional[float] = None
+        self.current_gas = 25  # gwei
+        self.gas_history = RingBuffer(GAS_HISTORY_POINTS)
+        self.version = 0
+    
+    def update_gas(self):
+        """Simulate gas fee changes"""
+        # Simulate realistic gas fee patterns
+        change = random.uniform(-5, 10)
+        self.current_gas = max(5, min(100, self.current_gas + change))
+        self.gas_history.append(self.current_gas)
+        self.analytics.observe(self.current_gas)
+        self.version += 1
+        self._save_state()
+        
+        self.event_bus.publish(GAS, gwei=self.current_gas, status=self.get_gas_status())
+    
+    def _save_state(self):
+        if not self.state_path:
+            return
+        now = time.monotonic()
+        if self._saved_at is None or now - self._saved_at >= GAS_SAVE_INTERVAL:
+            self.analytics.save(self.state_path)
+            self._saved_at = now
+    
+    def get_gas_status(self) -> str:
+        """Get gas fee status relative to recent history"""
+        return self.analytics.status(self.current_gas)
@@ -0,0 +1,315 @@
+"""
+Metrics for Mountain Gorilla
+Counters, gauges and histograms exposed in the Prometheus text format and
+combined across gunicorn worker processes through per-process snapshot files.
+"""
+
+import os
+import json
+import time
+import bisect
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Seconds between a process's snapshot writes; scrapes see other workers this stale at most
+FLUSH_INTERVAL = 1.0
+# Accumulated counts of every exited worker, in the shared directory
+DEAD_SNAPSHOT = "dead.json"
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class Metric:
+    """Named metric with optional labels; values are kept per label tuple"""
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: "Registry" = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        self.registry = registry or default_registry
+        self.registry.register(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Dict[Tuple[str, ...], object]:
+        with self._lock:
+            return {key: (list(value) if isinstance(value, list) else value) for key, value in self._values.items()}
+
+    @staticmethod
+    def merge(values: List[object]) -> object:
+        return sum(values)
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        self.registry.changed()
+
+class Gauge(Metric):
+    """Gauge; ``multiprocess_mode`` is "livesum" (summed over live workers)
+    or "local" (only the scraped process, for values every worker can compute)"""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: "Registry" = None, multiprocess_mode: str = "livesum"):
+        self.multiprocess_mode = multiprocess_mode
+        super().__init__(name, documentation, labelnames, registry)
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = float(value)
+        self._changed()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        self._changed()
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+        self._changed()
+
+    def _changed(self):
+        if self.multiprocess_mode != "local":  # local gauges are never written out
+            self.registry.changed()
+
+class Histogram(Metric):
+    """Histogram; per label tuple holds per-bucket counts, then sum and count"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: "Registry" = None, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)  # == len(buckets) means +Inf only
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            counts[index] += 1
+            counts[-2] += value
+            counts[-1] += 1
+        self.registry.changed()
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    @staticmethod
+    def merge(values: List[object]) -> object:
+        return [sum(column) for column in zip(*values)]
+
+class Registry:
+    """Metrics of one process, optionally shared through ``directory``.
+
+    With a directory, each process writes its counters, histograms and
+    livesum gauges to ``<pid>.json`` and a scrape merges every file. A
+    background thread writes the file at most every ``FLUSH_INTERVAL``
+    seconds while there are unwritten changes, so an idle worker's last
+    requests still show up. Counts of exited workers are folded into
+    ``dead.json`` (see ``mark_process_dead``), which keeps them but drops
+    their gauges.
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = directory
+        self.metrics: Dict[str, Metric] = {}
+        self.collectors: List[Callable[[], None]] = []
+        self._last_flush = 0.0
+        self._flush_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            atexit.register(self.flush)
+
+    def register(self, metric: Metric):
+        self.metrics[metric.name] = metric
+
+    def add_collector(self, collect: Callable[[], None]):
+        """Run ``collect`` before each render, e.g. to set scrape-time gauges"""
+        self.collectors.append(collect)
+
+    def changed(self):
+        """Note an unwritten change; the flusher thread writes it out shortly"""
+        if self.directory and not self._dirty.is_set():
+            self._dirty.set()
+            if self._flusher is None or not self._flusher.is_alive():
+                with self._flusher_lock:
+                    if self._flusher is None or not self._flusher.is_alive():
+                        self._flusher = threading.Thread(target=self._flush_loop, name="metrics-flusher",
+                                                         daemon=True)
+                        self._flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            self._dirty.wait()
+            delay = FLUSH_INTERVAL - (time.monotonic() - self._last_flush)
+            if delay > 0:
+                time.sleep(delay)  # coalesce a burst into one write
+            self._dirty.clear()  # before snapshotting, so later changes flush again
+            try:
+                self.flush()
+            except OSError:
+                pass  # directory gone (e.g. cleaned up at exit); the next change retries
+
+    def _shared(self) -> Iterator[Metric]:
+        for metric in self.metrics.values():
+            if getattr(metric, "multiprocess_mode", None) != "local":
+                yield metric
+
+    def flush(self, force: bool = True):
+        """Write this process's snapshot (atomically) if due or forced"""
+        if not self.directory:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_flush < FLUSH_INTERVAL:
+            return
+        with self._flush_lock:
+            self._last_flush = now
+            snapshot = {metric.name: [[list(key), value] for key, value in metric.samples().items()]
+                        for metric in self._shared()}
+            path = os.path.join(self.directory, f"{os.getpid()}.json")
+            with open(path + ".tmp", "w") as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+            os.replace(path + ".tmp", path)
+
+    def _merged(self) -> Dict[str, Dict[Tuple[str, ...], object]]:
+        """Samples of every metric, combined across processes"""
+        merged = {name: {key: [value] for key, value in metric.samples().items()}
+                  for name, metric in self.metrics.items()}
+        if not self.directory:
+            return {name: {key: values[0] for key, values in samples.items()} for name, samples in merged.items()}
+
+        own = f"{os.getpid()}.json"
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(".json") or filename == own:
+                continue
+            dead = filename == DEAD_SNAPSHOT
+            try:
+                with open(os.path.join(self.directory, filename)) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue  # removed or being replaced mid-scrape
+            for name, samples in snapshot.items():
+                metric = self.metrics.get(name)
+                if metric is None or (dead and metric.kind == "gauge"):
+                    continue
+                for key, value in samples:
+                    merged[name].setdefault(tuple(key), []).append(value)
+        return {name: {key: self.metrics[name].merge(values) for key, values in samples.items()}
+                for name, samples in merged.items()}
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)"""
+        for collect in self.collectors:
+            collect()
+        lines = []
+        for name, samples in sorted(self._merged().items()):
+            metric = self.metrics[name]
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for key, value in sorted(samples.items()):
+                if metric.kind != "histogram":
+                    lines.append(f"{name}{_format_labels(metric.labelnames, key)} {_format_value(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(metric.buckets + (float("inf"),), value):
+                    cumulative += count
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(f"{name}_bucket{_format_labels(metric.labelnames, key, le)} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(metric.labelnames, key)} {_format_value(value[-2])}")
+                lines.append(f"{name}_count{_format_labels(metric.labelnames, key)} {value[-1]}")
+        return "\n".join(lines) + "\n"
+
+def _add_samples(total: list, samples: list) -> list:
+    """Sum two snapshot sample lists key by key (histograms column by column)"""
+    merged = {tuple(key): value for key, value in total}
+    for key, value in samples:
+        key = tuple(key)
+        if key not in merged:
+            merged[key] = value
+        elif isinstance(value, list):
+            merged[key] = [a + b for a, b in zip(merged[key], value)]
+        else:
+            merged[key] += value
+    return [[list(key), value] for key, value in merged.items()]
+
+def mark_process_dead(pid: int, directory: str = None):
+    """Keep an exited worker's counts but stop counting its gauges (gunicorn child_exit).
+
+    Its snapshot is added into ``dead.json``, so a recycled pid never
+    overwrites an earlier worker's counts and the directory stays small.
+    """
+    directory = directory or os.environ.get("MGCC_METRICS_DIR")
+    if not directory:
+        return
+    path = os.path.join(directory, f"{pid}.json")
+    try:
+        with open(path) as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return
+    dead_path = os.path.join(directory, DEAD_SNAPSHOT)
+    try:
+        with open(dead_path) as f:
+            dead = json.load(f)
+    except (OSError, ValueError):
+        dead = {}
+    for name, samples in snapshot.items():
+        dead[name] = _add_samples(dead.get(name, []), samples)
+    with open(dead_path + ".tmp", "w") as f:
+        json.dump(dead, f, separators=(",", ":"))
+    os.replace(dead_path + ".tmp", dead_path)
+    os.remove(path)
+
+# Process-wide registry; shared across workers when MGCC_METRICS_DIR is set
+default_registry = Registry(os.environ.get("MGCC_METRICS_DIR"))
+
+http_requests = Counter("mgcc_http_requests_total", "HTTP requests handled.",
+                        ("method", "route", "status"))
+http_latency = Histogram("mgcc_http_request_duration_seconds",
+                         "Time from request start to response headers.", ("method", "route"))
+http_in_flight = Gauge("mgcc_http_requests_in_flight",
+                       "Requests being handled, including open streams.")
+db_latency = Histogram("mgcc_db_operation_duration_seconds",
+                       "Bot storage operation time (uncached reads, pages, write transactions).",
+                       ("operation",))
+fleet_bots = Gauge("mgcc_fleet_bots", "Deployed trading bots by status.", ("status",),
+                   multiprocess_mode="local")
@@ -0,0 +1,223 @@
+"""
+Columnar Portfolio Book for Mountain Gorilla
+Positions across many wallets stored as NumPy arrays so valuation, PnL and
+allocation weights are each computed in one vectorized pass.
+"""
+
+import os
+from datetime import date
+from typing import Dict, List, Mapping, Optional
+import numpy as np
+
+class PortfolioBook:
+    """Positions held as parallel arrays of wallet, token, amount and average price.
+
+    Tokens and wallets are interned to small integer ids. ``revalue`` takes
+    a price per token id and fills preallocated buffers, so a tick costs a
+    handful of NumPy passes regardless of how many positions are held.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.tokens: List[str] = []
+        self.token_index: Dict[str, int] = {}
+        self.wallets: List[str] = []
+        self.wallet_index: Dict[str, int] = {}
+        self.size = 0
+        self._wallet_ids = np.zeros(capacity, dtype=np.int32)
+        self._token_ids = np.zeros(capacity, dtype=np.int32)
+        self._amounts = np.zeros(capacity, dtype=np.float64)
+        self._avg_prices = np.zeros(capacity, dtype=np.float64)
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._unrealized = np.zeros(capacity, dtype=np.float64)
+        self._position_index: Dict[tuple, int] = {}
+        # Per-token reference price for daily PnL, and the prices last revalued at
+        self.prior_close = np.zeros(0, dtype=np.float64)
+        self.last_prices = np.zeros(0, dtype=np.float64)
+        self.close_date: Optional[date] = None
+
+    # Column views over the live part of the book
+    @property
+    def wallet_ids(self) -> np.ndarray:
+        return self._wallet_ids[:self.size]
+
+    @property
+    def token_ids(self) -> np.ndarray:
+        return self._token_ids[:self.size]
+
+    @property
+    def amounts(self) -> np.ndarray:
+        return self._amounts[:self.size]
+
+    @property
+    def avg_prices(self) -> np.ndarray:
+        return self._avg_prices[:self.size]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[:self.size]
+
+    @property
+    def unrealized_pnl(self) -> np.ndarray:
+        return self._unrealized[:self.size]
+
+    def _intern_token(self, token: str) -> int:
+        token_id = self.token_index.get(token)
+        if token_id is None:
+            token_id = self.token_index[token] = len(self.tokens)
+            self.tokens.append(token)
+            self.prior_close = np.append(self.prior_close, np.nan)
+            self.last_prices = np.append(self.last_prices, 0.0)
+        return token_id
+
+    def _intern_wallet(self, wallet: str) -> int:
+        wallet_id = self.wallet_index.get(wallet)
+        if wallet_id is None:
+            wallet_id = self.wallet_index[wallet] = len(self.wallets)
+            self.wallets.append(wallet)
+        return wallet_id
+
+    def _grow(self):
+        capacity = max(2 * len(self._amounts), 1)
+        for attr in ("_wallet_ids", "_token_ids", "_amounts", "_avg_prices", "_values", "_unrealized"):
+            old = getattr(self, attr)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, attr, new)
+
+    def add_position(self, wallet: str, token: str, amount: float, price: float) -> int:
+        """Buy ``amount`` of ``token`` at ``price`` into ``wallet``, averaging the cost"""
+        wallet_id = self._intern_wallet(wallet)
+        token_id = self._intern_token(token)
+        row = self._position_index.get((wallet_id, token_id))
+
+        if row is None:
+            if self.size == len(self._amounts):
+                self._grow()
+            row = self.size
+            self.size += 1
+            self._position_index[(wallet_id, token_id)] = row
+            self._wallet_ids[row] = wallet_id
+            self._token_ids[row] = token_id
+            self._amounts[row] = amount
+            self._avg_prices[row] = price
+        else:
+            held = self._amounts[row]
+            total = held + amount
+            if total:
+                self._avg_prices[row] = (held * self._avg_prices[row] + amount * price) / total
+            self._amounts[row] = total
+        return row
+
+    def price_vector(self, prices: Mapping[str, float]) -> np.ndarray:
+        """Prices aligned to token ids; unknown tokens are worth 0"""
+        return np.fromiter((prices.get(token, 0.0) for token in self.tokens),
+                           dtype=np.float64, count=len(self.tokens))
+
+    def revalue(self, prices: np.ndarray, today: date = None) -> Dict[str, float]:
+        """Value every position at ``prices`` (indexed by token id).
+
+        Rolls the prior close forward when the day changes: the last prices
+        seen on the previous day become the reference for daily PnL.
+        """
+        today = today or date.today()
+        if self.close_date is None:
+            self.close_date = today
+        elif today != self.close_date:
+            self.prior_close = self.last_prices.copy()
+            self.close_date = today
+        # Tokens seen for the first time close at their first observed price
+        unset = np.isnan(self.prior_close)
+        self.prior_close[unset] = prices[unset]
+        self.last_prices = prices.copy()
+
+        n = self.size
+        token_ids = self._token_ids[:n]
+        amounts = self._amounts[:n]
+        position_prices = prices[token_ids]
+
+        values = self._values[:n]
+        np.multiply(amounts, position_prices, out=values)
+        unrealized = self._unrealized[:n]
+        np.subtract(position_prices, self._avg_prices[:n], out=unrealized)
+        unrealized *= amounts
+
+        # Daily PnL aggregates amounts per token first, so it costs O(tokens) after one bincount
+        token_amounts = np.bincount(token_ids, weights=amounts, minlength=len(self.tokens))
+        daily_pnl = float(token_amounts @ (prices - self.prior_close))
+
+        return {
+            "total_value": float(values.sum()),
+            "unrealized_pnl": float(unrealized.sum()),
+            "daily_pnl": daily_pnl,
+        }
+
+    def by_token(self) -> Dict[str, Dict[str, float]]:
+        """Amount, average price, value, unrealized PnL and allocation weight per token"""
+        n = self.size
+        minlength = len(self.tokens)
+        token_ids = self._token_ids[:n]
+        amounts = np.bincount(token_ids, weights=self._amounts[:n], minlength=minlength)
+        costs = np.bincount(token_ids, weights=self._amounts[:n] * self._avg_prices[:n], minlength=minlength)
+        values = np.bincount(token_ids, weights=self._values[:n], minlength=minlength)
+        pnl = np.bincount(token_ids, weights=self._unrealized[:n], minlength=minlength)
+        total = values.sum()
+        weights = values / total if total else np.zeros(minlength)
+
+        return {
+            token: {
+                "amount": float(amounts[i]),
+                "avg_price": float(costs[i] / amounts[i]) if amounts[i] else 0.0,
+                "value": float(values[i]),
+                "unrealized_pnl": float(pnl[i]),
+                "weight": float(weights[i]),
+            }
+            for i, token in enumerate(self.tokens)
+        }
+
+    def save(self, path: str):
+        """Write positions, prior close and last prices to ``path`` (.npz), atomically"""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                tokens=np.array(self.tokens, dtype=str),
+                wallets=np.array(self.wallets, dtype=str),
+                wallet_ids=self.wallet_ids,
+                token_ids=self.token_ids,
+                amounts=self.amounts,
+                avg_prices=self.avg_prices,
+                prior_close=self.prior_close,
+                last_prices=self.last_prices,
+                close_date=np.array(self.close_date.isoformat() if self.close_date else ""),
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "PortfolioBook":
+        """Rebuild a book saved by ``save``, prior close included"""
+        with np.load(path) as state:
+            size = len(state["amounts"])
+            book = cls(capacity=max(size, 1024))
+            book.tokens = [str(token) for token in state["tokens"]]
+            book.token_index = {token: i for i, token in enumerate(book.tokens)}
+            book.wallets = [str(wallet) for wallet in state["wallets"]]
+            book.wallet_index = {wallet: i for i, wallet in enumerate(book.wallets)}
+            book.size = size
+            book._wallet_ids[:size] = state["wallet_ids"]
+            book._token_ids[:size] = state["token_ids"]
+            book._amounts[:size] = state["amounts"]
+            book._avg_prices[:size] = state["avg_prices"]
+            book._position_index = {
+                (int(wallet_id), int(token_id)): row
+                for row, (wallet_id, token_id) in enumerate(zip(book.wallet_ids, book.token_ids))
+            }
+            book.prior_close = state["prior_close"].copy()
+            book.last_prices = state["last_prices"].copy()
+            close_date = str(state["close_date"])
+            book.close_date = date.fromisoformat(close_date) if close_date else None
+        return book
+
+    def by_wallet(self) -> Dict[str, float]:
+        """Total value per wallet from the last revalue"""
+        values = np.bincount(self.wallet_ids, weights=self.values, minlength=len(self.wallets))
+        return {wallet: float(values[i]) for i, wallet in enumerate(self.wallets)}
@@ -0,0 +1,77 @@
+"""
+Fixed-capacity ring buffers for Mountain Gorilla time series
+Contiguous float64 storage with O(1) append and zero-copy windowed views.
+"""
+
+from array import array
+from typing import Iterable, Iterator, List
+
+class RingBuffer:
+    """Ring buffer of floats backed by a single ``array('d')``.
+
+    Every value is written twice, ``capacity`` slots apart, so the most
+    recent ``n`` values are always one contiguous slice of the array. That
+    lets ``window`` hand out a memoryview instead of copying, and append
+    stays O(1) no matter how long the history is.
+    """
+
+    def __init__(self, capacity: int, values: Iterable[float] = ()):
+        if capacity <= 0:
+            raise ValueError("RingBuffer capacity must be positive")
+        self.capacity = capacity
+        self._data = array("d", bytes(16 * capacity))  # 2 * capacity zeroed doubles
+        self._next = 0  # slot the next append writes to
+        self._count = 0
+        self.appended = 0  # total appends ever; the newest value's absolute index + 1
+        self.extend(values)
+
+    def append(self, value: float) -> None:
+        slot = self._next
+        self._data[slot] = value
+        self._data[slot + self.capacity] = value
+        self._next = slot + 1 if slot + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+        self.appended += 1
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.append(value)
+
+    def clear(self) -> None:
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> float:
+        """Index oldest-first like a list; negative indexes count from the newest"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("RingBuffer index out of range")
+        return self._data[self._next + self.capacity - self._count + index]
+
+    def window(self, n: int = None) -> memoryview:
+        """Zero-copy view of the last ``n`` values (all of them by default), oldest first.
+
+        The view aliases live storage: later appends overwrite it, so copy
+        it (``.tolist()``) if it has to outlive the next update.
+        """
+        if n is None or n > self._count:
+            n = self._count
+        end = self._next + self.capacity
+        return memoryview(self._data)[end - n:end]
+
+    def latest(self, default: float = None) -> float:
+        return self[-1] if self._count else default
+
+    def tolist(self) -> List[float]:
+        return self.window().tolist()
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.tolist())
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(capacity={self.capacity}, len={self._count})"
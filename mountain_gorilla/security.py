@@ -5,6 +5,7 @@ Vault, signing, read-only mode, backup, and audit functionality.
 
 import json
 import os
+import time
 import zipfile
 import hashlib
 import base64
@@ -21,6 +22,7 @@ from rich.table import Table
 from rich.text import Text
 from rich.prompt import Prompt, Confirm
 from rich.align import Align
+from mountain_gorilla.gas import GasAnalytics, GAS_STATE_PATH, gas_analytics as default_gas_analytics
 
 console = Console()
 
@@ -156,14 +158,23 @@ class VaultManager:
 class TransactionSigner:
     """Handles explicit transaction signing and approval"""
     
-    def __init__(self, vault_manager: VaultManager):
+    def __init__(self, vault_manager: VaultManager, gas: GasAnalytics = None, gas_state_path: str = GAS_STATE_PATH):
         self.vault = vault_manager
+        self.gas = gas or default_gas_analytics
+        self.gas_state_path = gas_state_path
         self.pending_transactions = {}
         self.transaction_history = []
     
     def create_transaction(self, wallet_name: str, to_address: str, value: float, 
-                          gas_limit: int, data: str = "") -> str:
-        """Create a new transaction for approval"""
+                          gas_limit: int, data: str = "", urgent: bool = True,
+                          max_wait_hours: int = 6) -> str:
+        """Create a new transaction for approval.
+        
+        Non-urgent transactions are marked deferred, with the forecast
+        cheapest window as ``not_before``, when waiting is expected to save gas.
+        Without a live gas feed in this process, the history the gas tracker
+        persisted is restored first; a stale one never defers.
+        """
         tx_id = hashlib.sha256(f"{wallet_name}{to_address}{value}{datetime.now()}".encode()).hexdigest()[:8]
         
         transaction = {
@@ -177,8 +188,22 @@ class TransactionSigner:
             "status": "pending"
         }
         
+        if not urgent and self.gas.latest is None and self.gas_state_path:
+            self.gas.restore(self.gas_state_path)
+        if self.gas.should_defer(max_wait_hours, urgent=urgent):
+            window = self.gas.cheapest_window(max_wait_hours)
+            transaction["status"] = "deferred"
+            transaction["not_before"] = window.starts_at.isoformat()
+            transaction["expected_gwei"] = window.expected_gwei
+        
         self.pending_transactions[tx_id] = transaction
-        console.print(f"[yellow]📝 Transaction {tx_id} created and pending approval[/yellow]")
+        if transaction["status"] == "deferred":
+            console.print(
+                f"[yellow]⏳ Transaction {tx_id} deferred until {transaction['not_before'][11:16]} "
+                f"(expected ~{transaction['expected_gwei']:.1f} gwei)[/yellow]"
+            )
+        else:
+            console.print(f"[yellow]📝 Transaction {tx_id} created and pending approval[/yellow]")
         
         return tx_id
     
@@ -195,6 +220,7 @@ class TransactionSigner:
         table.add_column("Value (ETH)", style="green")
         table.add_column("Gas", style="yellow")
         table.add_column("Created", style="white")
+        table.add_column("Not Before", style="yellow")
         
         for tx in self.pending_transactions.values():
             table.add_row(
@@ -203,18 +229,31 @@ class TransactionSigner:
                 tx["to_address"][:10] + "...",
                 f"{tx['value']:.4f}",
                 str(tx["gas_limit"]),
-                tx["created_at"][:19]
+                tx["created_at"][:19],
+                tx.get("not_before", "")[:16]
             )
         
         console.print(table)
     
-    def approve_transaction(self, tx_id: str) -> bool:
-        """Approve and sign a transaction"""
+    def approve_transaction(self, tx_id: str, force: bool = False) -> bool:
+        """Approve and sign a transaction.
+        
+        A deferred transaction is refused before its ``not_before`` time
+        unless ``force`` is set.
+        """
         if tx_id not in self.pending_transactions:
             console.print(f"[red]❌ Transaction {tx_id} not found[/red]")
             return False
         
         tx = self.pending_transactions[tx_id]
+        if tx["status"] == "deferred" and datetime.now() < datetime.fromisoformat(tx["not_before"]):
+            if not force:
+                console.print(
+                    f"[yellow]⏳ Transaction {tx_id} is deferred until {tx['not_before'][11:16]} "
+                    f"for cheaper gas; approve with --force to sign it now[/yellow]"
+                )
+                return False
+            console.print(f"[yellow]⚠️ Signing deferred transaction {tx_id} before its gas window[/yellow]")
         
         # Show transaction details
         console.print(f"\n[bold]Transaction Details:[/bold]")
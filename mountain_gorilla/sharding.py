@@ -0,0 +1,367 @@
+"""
+Sharded fleet mode for Mountain Gorilla
+Spreads bots over several worker processes, each running its own BotManager
+on a hash-partition of bot names, behind a local coordinator.
+"""
+
+import os
+import json
+import time
+import signal
+import sqlite3
+import hashlib
+import threading
+import multiprocessing
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Any
+from rich.console import Console
+from mountain_gorilla.bot_manager import (
+    BotManager, BotConfig, BotStatus, FleetSnapshot, SHUTDOWN_TIMEOUT, build_bot_table, build_log_table
+)
+
+console = Console()
+
+# Commands a worker will run against its BotManager
+WORKER_COMMANDS = {
+    "deploy": "deploy_bot",
+    "start": "start_bot",
+    "stop": "stop_bot",
+    "pause": "pause_bot",
+    "resume": "resume_bot",
+    "configure": "configure_bot",
+    "logs": "get_bot_logs",
+    "release": "release_bot",
+    "adopt": "adopt_bot",
+}
+
+def shard_for(name: str, worker_ids: List[int]) -> int:
+    """Pick the worker that owns a bot using rendezvous hashing.
+
+    When a worker joins or leaves only the bots it wins or loses move;
+    everything else keeps its owner.
+    """
+    def score(worker_id: int) -> int:
+        digest = hashlib.md5(f"{worker_id}:{name}".encode()).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    return max(worker_ids, key=score)
+
+def shard_db_path(db_path: str, worker_id: int) -> str:
+    """Database file owned by one worker, e.g. ``bots.shard0.db``"""
+    path = Path(db_path)
+    return str(path.with_name(f"{path.stem}.shard{worker_id}{path.suffix or '.db'}"))
+
+def _worker_main(worker_id: int, conn, db_path: str):
+    """Serve coordinator commands against this worker's BotManager"""
+    # A forked worker inherits the coordinator's handlers, which would shut
+    # down the coordinator's copy of its state; the coordinator owns Ctrl-C
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    manager = BotManager(shard_db_path(db_path, worker_id))
+    manager.install_shutdown_hooks()
+    # Versions restart with the process; the epoch tells the coordinator so
+    epoch = f"{os.getpid():x}.{int(time.time() * 1000):x}"
+
+    while True:
+        try:
+            op, args, kwargs = conn.recv()
+        except EOFError:
+            op, args, kwargs = "shutdown", (), {}
+
+        try:
+            if op == "statuses":
+                snapshot = manager.snapshot()
+                result = {
+                    "epoch": epoch,
+                    "version": snapshot.version,
+                    "bots": {
+                        name: {"config": asdict(config), "status": asdict(snapshot.statuses[name])}
+                        for name, config in list(manager.bots.items())
+                        if name in snapshot.statuses
+                    }
+                }
+            elif op == "names":
+                result = list(manager.bots)
+            elif op == "shutdown":
+                result = manager.shutdown(*args, **kwargs)
+                conn.send(("ok", result))
+                break
+            elif op in WORKER_COMMANDS:
+                result = getattr(manager, WORKER_COMMANDS[op])(*args, **kwargs)
+            else:
+                raise ValueError(f"Unknown command '{op}'")
+            conn.send(("ok", result))
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+    conn.close()
+
+class ShardWorker:
+    """Coordinator-side handle on one worker process"""
+
+    def __init__(self, worker_id: int, db_path: str, context):
+        self.worker_id = worker_id
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(worker_id, child_conn, db_path),
+            name=f"mgcc-shard-{worker_id}",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.lock = threading.Lock()
+
+    def send(self, op: str, *args, **kwargs):
+        """Send a command without waiting for the reply (caller holds ``lock``)"""
+        self.conn.send((op, args, kwargs))
+
+    def receive(self) -> Any:
+        """Wait for the reply to the last command (caller holds ``lock``)"""
+        state, result = self.conn.recv()
+        if state == "error":
+            raise RuntimeError(f"Shard {self.worker_id}: {result}")
+        return result
+
+    def call(self, op: str, *args, **kwargs) -> Any:
+        with self.lock:
+            self.send(op, *args, **kwargs)
+            return self.receive()
+
+class ShardedBotManager:
+    """Routes bot commands to worker processes that each own a shard of the fleet"""
+
+    def __init__(self, workers: int = 2, db_path: str = "bots.db", start_method: str = None):
+        self.db_path = db_path
+        self._context = multiprocessing.get_context(start_method)
+        self.workers: Dict[int, ShardWorker] = {}
+        self._next_worker_id = 0
+        self._lock = threading.RLock()
+        self._version = 0
+        self._versions_seen = None
+
+        for _ in range(workers):
+            self._spawn_worker()
+        self._adopt_unsharded()
+        # Shard files from a run with a different worker count may hold bots
+        # that now belong elsewhere
+        self.rebalance()
+
+    def _spawn_worker(self) -> int:
+        worker_id = self._next_worker_id
+        self._next_worker_id += 1
+        self.workers[worker_id] = ShardWorker(worker_id, self.db_path, self._context)
+        return worker_id
+
+    def _revive_dead_workers(self):
+        """Restart crashed workers on their own shard database.
+
+        Their bots are reloaded from disk (stopped, as after any restart), so
+        losing a worker process never loses the bots it owned.
+        """
+        for worker_id, worker in list(self.workers.items()):
+            if worker.process.is_alive():
+                continue
+            console.print(f"[yellow]Shard worker {worker_id} exited (code {worker.process.exitcode}); "
+                          f"restarting it[/yellow]")
+            worker.conn.close()
+            self.workers[worker_id] = ShardWorker(worker_id, self.db_path, self._context)
+
+    def _adopt_unsharded(self) -> int:
+        """Move bots deployed before sharding from ``db_path`` onto their shards.
+
+        PersistedFleet reads that file too, so bots left in it would show up
+        in the fleet without any worker able to manage them. They arrive
+        stopped; their execution logs stay behind, as on any move. A bot a
+        shard already holds (e.g. after an interrupted migration) keeps the
+        shard's copy. Returns how many moved.
+        """
+        if not os.path.exists(self.db_path):
+            return 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            try:
+                rows = conn.execute('''
+                    SELECT b.name, b.config, s.last_execution, s.total_trades, s.pnl, s.error_message
+                    FROM bots b LEFT JOIN bot_status s ON s.name = b.name
+                ''').fetchall()
+            except sqlite3.OperationalError:
+                return 0  # not a fleet database
+            moved = 0
+            for name, config, last_execution, total_trades, pnl, error_message in rows:
+                status = BotStatus(name, "stopped", last_execution or "", total_trades or 0, pnl or 0.0,
+                                   error_message=error_message)
+                owner = self._owner(name)
+                if owner.call("adopt", {"config": json.loads(config), "status": asdict(status)}):
+                    moved += 1
+                else:
+                    console.print(f"[yellow]Shard {owner.worker_id} already has bot '{name}'; "
+                                  f"dropping its unsharded copy[/yellow]")
+                with conn:
+                    conn.execute("DELETE FROM bot_status WHERE name = ?", (name,))
+                    conn.execute("DELETE FROM bots WHERE name = ?", (name,))
+        finally:
+            conn.close()
+        if moved:
+            console.print(f"[green]Moved {moved} bot(s) from {self.db_path} onto their shards[/green]")
+        return moved
+
+    def _owner(self, name: str) -> ShardWorker:
+        if not self.workers:
+            raise RuntimeError("No shard workers available")
+        self._revive_dead_workers()
+        return self.workers[shard_for(name, sorted(self.workers))]
+
+    def _move(self, name: str, source: ShardWorker, target: ShardWorker) -> bool:
+        """Hand a bot from ``source`` to ``target``; if that fails it goes back to ``source``"""
+        record = source.call("release", name)
+        if not record:
+            return False
+        try:
+            if target.call("adopt", record):
+                return True
+            reason = "it already has a bot with that name"
+        except (RuntimeError, OSError, EOFError) as e:
+            reason = str(e)
+        console.print(f"[red]Could not move bot '{name}' to shard {target.worker_id} ({reason}); "
+                      f"keeping it on shard {source.worker_id}[/red]")
+        source.call("adopt", record)
+        return False
+
+    def _broadcast(self, op: str, *args, **kwargs) -> Dict[int, Any]:
+        """Send a command to every worker at once, then gather the replies"""
+        workers = list(self.workers.values())
+        for worker in workers:
+            worker.lock.acquire()
+        try:
+            for worker in workers:
+                worker.send(op, *args, **kwargs)
+            return {worker.worker_id: worker.receive() for worker in workers}
+        finally:
+            for worker in workers:
+                worker.lock.release()
+
+    def add_worker(self) -> int:
+        """Start another worker and move the bots it now owns onto it"""
+        with self._lock:
+            worker_id = self._spawn_worker()
+            self.rebalance()
+        return worker_id
+
+    def remove_worker(self, worker_id: int, timeout: float = SHUTDOWN_TIMEOUT) -> bool:
+        """Hand a worker's bots to the remaining workers, then stop it"""
+        with self._lock:
+            if worker_id not in self.workers:
+                return False
+            if len(self.workers) == 1:
+                console.print("[red]Cannot remove the last shard worker![/red]")
+                return False
+
+            leaving = self.workers.pop(worker_id)
+            stranded = [name for name in leaving.call("names")
+                        if not self._move(name, leaving, self._owner(name))]
+            if stranded:
+                # Keep the worker, and the bots it could not hand off, in the fleet
+                self.workers[worker_id] = leaving
+                console.print(f"[red]Shard worker {worker_id} still owns {len(stranded)} bot(s); not removed[/red]")
+                return False
+
+            leaving.call("shutdown", timeout)
+            leaving.process.join(timeout)
+            return True
+
+    def rebalance(self) -> int:
+        """Move every bot to the worker that owns it; returns how many moved"""
+        moved = 0
+        with self._lock:
+            self._revive_dead_workers()
+            for worker_id, names in self._broadcast("names").items():
+                for name in names:
+                    owner = self._owner(name)
+                    if owner.worker_id != worker_id and self._move(name, self.workers[worker_id], owner):
+                        moved += 1
+        return moved
+
+    def deploy_bot(self, name: str, strategy: str, **kwargs) -> bool:
+        with self._lock:
+            return self._owner(name).call("deploy", name, strategy, **kwargs)
+
+    def start_bot(self, name: str) -> bool:
+        with self._lock:
+            return self._owner(name).call("start", name)
+
+    def stop_bot(self, name: str) -> bool:
+        with self._lock:
+            return self._owner(name).call("stop", name)
+
+    def pause_bot(self, name: str) -> bool:
+        with self._lock:
+            return self._owner(name).call("pause", name)
+
+    def resume_bot(self, name: str) -> bool:
+        with self._lock:
+            return self._owner(name).call("resume", name)
+
+    def configure_bot(self, name: str, **kwargs) -> bool:
+        with self._lock:
+            return self._owner(name).call("configure", name, **kwargs)
+
+    def get_bot_logs(self, name: str, limit: int = 50) -> List[Dict]:
+        with self._lock:
+            return self._owner(name).call("logs", name, limit)
+
+    def show_bot_logs(self, name: str, limit: int = 20) -> None:
+        """Display a bot's logs from the shard that owns it"""
+        logs = self.get_bot_logs(name, limit)
+        if not logs:
+            console.print(f"[yellow]No logs found for bot '{name}'[/yellow]")
+            return
+        console.print(build_log_table(name, logs))
+
+    def _collect(self) -> tuple:
+        """Gather (fleet version, bot records) from every worker.
+
+        The fleet version moves whenever any worker's (epoch, version) does,
+        so it never repeats, even when a restarted worker counts from 1.
+        """
+        records = {}
+        with self._lock:
+            self._revive_dead_workers()
+            shards = self._broadcast("statuses")
+            for shard in shards.values():
+                records.update(shard["bots"])
+            seen = {worker_id: (shard["epoch"], shard["version"]) for worker_id, shard in shards.items()}
+            if seen != self._versions_seen:
+                self._versions_seen = seen
+                self._version += 1
+            return self._version, records
+
+    def snapshot(self) -> FleetSnapshot:
+        """Aggregate every worker's statuses into one fleet snapshot"""
+        version, records = self._collect()
+        statuses = {name: BotStatus(**record["status"]) for name, record in records.items()}
+        return FleetSnapshot.build(version, statuses)
+
+    def list_bots(self) -> None:
+        """Display all bots across every shard"""
+        _, records = self._collect()
+        if not records:
+            console.print("[yellow]No bots deployed yet![/yellow]")
+            return
+
+        bots = {name: BotConfig(**record["config"]) for name, record in sorted(records.items())}
+        statuses = {name: BotStatus(**record["status"]) for name, record in records.items()}
+        console.print(build_bot_table(bots, statuses))
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> bool:
+        """Shut every worker down in parallel, each bounded by ``timeout``"""
+        with self._lock:
+            if not self.workers:
+                return True
+            drained = all(self._broadcast("shutdown", timeout).values())
+            for worker in self.workers.values():
+                worker.process.join(timeout)
+                worker.conn.close()
+            self.workers.clear()
+        return drained
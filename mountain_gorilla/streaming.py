@@ -0,0 +1,345 @@
+"""
+Server-Sent Event Streaming for Mountain Gorilla
+Bridges the in-process event bus to HTTP clients as batched SSE frames with
+Last-Event-ID resume and bounded per-client queues.
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import threading
+import dataclasses
+from datetime import datetime, date
+from decimal import Decimal
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+from mountain_gorilla.events import (
+    EventBus, Event, event_bus as default_event_bus, Subscription, PRICE, GAS, PORTFOLIO, BOT_STATUS, BOT_TRADE, BOT_LOG
+)
+
+# Topics a stream carries unless the client narrows them
+STREAM_TOPICS = ("market.*", "bot.*", "portfolio.*", "dca.*")
+# Events kept for clients resuming with Last-Event-ID
+REPLAY_SIZE = 2000
+# Events queued per client before the oldest are dropped
+CLIENT_QUEUE_SIZE = 256
+# Most events sent in one frame, and how long to wait for a batch to fill
+MAX_BATCH = 100
+BATCH_WINDOW = 0.05
+# Comment sent on an idle stream so proxies keep the connection open
+HEARTBEAT_INTERVAL = 15.0
+# Latest market state, written by the one process running the feed
+MARKET_STATE_PATH = os.environ.get("MGCC_MARKET_STATE", "market.json")
+# How often a FeedFollower checks that state for a new tick
+FOLLOW_INTERVAL = 1.0
+
+def json_default(value: Any) -> Any:
+    """JSON fallback for event payloads (dataclasses, Decimals, datetimes)"""
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def encode_event(event: Event, epoch: str) -> dict:
+    return {"id": f"{epoch}-{event.seq}", "topic": event.topic, "timestamp": event.timestamp, "data": event.data}
+
+def sse_frame(event: str, data: Any, event_id: str = None) -> str:
+    """Format one SSE frame"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(data, default=json_default, separators=(",", ":")))
+    return "\n".join(lines) + "\n\n"
+
+class EventStreamer:
+    """Serves the event bus to any number of SSE clients.
+
+    A never-drained subscription of ``replay_size`` events acts as the
+    replay log for reconnecting clients. Each client gets its own bounded
+    subscription, so a slow reader loses its oldest events (and is told how
+    many) instead of growing memory or holding back publishers.
+
+    Event ids are ``<epoch>-<seq>``. Bus sequence numbers restart with the
+    process and differ between workers, so the epoch (pid and start time)
+    tells a resumable id from one issued by another process or an earlier
+    run. Those, and ids newer than anything logged here, get a ``reset``
+    frame and the stream continues from live events.
+    """
+
+    def __init__(self, event_bus: EventBus = None, replay_size: int = REPLAY_SIZE,
+                 client_queue_size: int = CLIENT_QUEUE_SIZE):
+        self.event_bus = event_bus or default_event_bus
+        self.client_queue_size = client_queue_size
+        self.replay_log = self.event_bus.subscribe(STREAM_TOPICS, maxsize=replay_size)
+        self.epoch = f"{os.getpid():x}.{int(time.time() * 1000):x}"
+        self.clients = 0
+        self._lock = threading.Lock()
+
+    def _replay(self, subscription: Subscription, last_event_id: str) -> Tuple[Optional[List[Event]], int]:
+        """Logged events after ``last_event_id`` and its seq; None if it cannot be resumed here"""
+        epoch, _, seq = last_event_id.rpartition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None, 0
+        last_seq = int(seq)
+        logged = self.replay_log.peek()
+        if not logged or last_seq > logged[-1].seq:
+            return None, 0
+        if logged[0].seq > last_seq + 1 and self.replay_log.dropped:
+            return None, 0  # some of what the client missed was already evicted
+        return [event for event in logged if event.seq > last_seq and subscription.matches(event.topic)], last_seq
+
+    def stream(self, topics: Sequence[str] = STREAM_TOPICS, last_event_id: str = None,
+               max_batch: int = MAX_BATCH, batch_window: float = BATCH_WINDOW,
+               heartbeat: float = HEARTBEAT_INTERVAL) -> Iterator[str]:
+        """Subscribe now and return a generator of SSE frames.
+
+        Subscribing before the first frame is pulled means nothing published
+        between the request and the response starting is missed.
+        """
+        subscription = self.event_bus.subscribe(topics, maxsize=self.client_queue_size)
+        with self._lock:
+            self.clients += 1
+        return self._frames(subscription, last_event_id, max_batch, batch_window, heartbeat)
+
+    def _frames(self, subscription: Subscription, last_event_id: Optional[str], max_batch: int,
+                batch_window: float, heartbeat: float) -> Iterator[str]:
+        try:
+            yield "retry: 3000\n\n"
+            sent = 0
+            if last_event_id is not None:
+                replay, sent = self._replay(subscription, last_event_id)
+                if replay is None:
+                    # Everything queued since subscribing is live, so sent = 0 passes it all
+                    yield sse_frame("reset", {"reason": "history unavailable", "epoch": self.epoch})
+                    replay = []
+                for start in range(0, len(replay), max_batch):
+                    batch = replay[start:start + max_batch]
+                    sent = batch[-1].seq
+                    yield sse_frame("batch", [encode_event(e, self.epoch) for e in batch], f"{self.epoch}-{sent}")
+
+            dropped = 0
+            while True:
+                first = subscription.get(timeout=heartbeat)
+                if first is None:
+                    if subscription.closed:
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                if batch_window:
+                    time.sleep(batch_window)  # let a burst coalesce into one frame
+                batch = [first] + subscription.drain(max_batch - 1)
+                if subscription.dropped != dropped:
+                    yield sse_frame("dropped", {"count": subscription.dropped - dropped})
+                    dropped = subscription.dropped
+                batch = [event for event in batch if event.seq > sent]  # already replayed
+                if batch:
+                    sent = batch[-1].seq
+                    yield sse_frame("batch", [encode_event(e, self.epoch) for e in batch], f"{self.epoch}-{sent}")
+        finally:
+            subscription.close()
+            with self._lock:
+                self.clients -= 1
+
+class MarketFeed:
+    """Background price, gas and portfolio simulation publishing to the event bus.
+
+    The web process has no terminal dashboard driving the simulated feed, so
+    one of these runs the market for it. ``start`` publishes a first tick
+    before returning, so nothing reads an empty market. With ``state_path``
+    every tick is also written there (atomically) for FeedFollowers in
+    other processes.
+    """
+
+    def __init__(self, interval: float = 2.0, event_bus: EventBus = None, state_path: str = None):
+        self.interval = interval
+        self.event_bus = event_bus or default_event_bus
+        self.state_path = state_path
+        self.epoch = f"{os.getpid():x}.{int(time.time() * 1000):x}"
+        self.ticks = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the feed thread (idempotent and cheap once running)"""
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            from mountain_gorilla.market import LivePriceTicker, PortfolioTracker, GasTracker
+            self.price_ticker = LivePriceTicker(event_bus=self.event_bus)
+            self.portfolio = PortfolioTracker(event_bus=self.event_bus)
+            self.gas_tracker = GasTracker(event_bus=self.event_bus)
+            self._stop.clear()
+            self._tick()
+            self._thread = threading.Thread(target=self._run, name="mgcc-market-feed", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _tick(self):
+        self.price_ticker.update_prices()
+        self.gas_tracker.update_gas()
+        self.portfolio.update_portfolio(self.price_ticker)
+        self.ticks += 1
+        if self.state_path:
+            self._save_state()
+
+    def _save_state(self):
+        state = {
+            "id": f"{self.epoch}-{self.ticks}",
+            "prices": self.price_ticker.prices,
+            "gas": {"gwei": self.gas_tracker.current_gas, "status": self.gas_tracker.get_gas_status()},
+            "portfolio": {
+                "total_value": self.portfolio.total_value,
+                "unrealized_pnl": self.portfolio.unrealized_pnl,
+                "daily_pnl": self.portfolio.daily_pnl,
+            },
+        }
+        tmp = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp, self.state_path)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._tick()
+            except OSError as e:
+                print(f"Market feed could not save its state (will retry): {e}", file=sys.stderr)
+
+class _Poller:
+    """Calls ``poll`` once on ``start`` and then every ``interval`` seconds in a thread"""
+
+    name = "mgcc-poller"
+
+    def __init__(self, interval: float, event_bus: EventBus = None):
+        self.interval = interval
+        self.event_bus = event_bus or default_event_bus
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Poll now and keep polling in the background (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self.poll()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def poll(self) -> bool:
+        raise NotImplementedError
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+class FeedFollower(_Poller):
+    """Republishes the market state a MarketFeed in another process persists.
+
+    Under gunicorn no worker simulates the market: one feed process does
+    (see gunicorn.conf.py) and every worker follows its ``state_path``,
+    publishing each new tick as PRICE, GAS and PORTFOLIO events on its own
+    bus. Summaries, /api/dashboard and SSE streams therefore agree whichever
+    worker answers, and only the feed process writes portfolio and gas
+    state. Has the same ``start``/``stop`` interface as MarketFeed.
+    """
+
+    name = "mgcc-feed-follower"
+
+    def __init__(self, state_path: str = MARKET_STATE_PATH, interval: float = FOLLOW_INTERVAL,
+                 event_bus: EventBus = None):
+        super().__init__(interval, event_bus)
+        self.state_path = state_path
+        self._last_id: Optional[str] = None
+
+    def poll(self) -> bool:
+        """Publish the persisted state if it changed; returns whether it did"""
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False  # no feed yet; the next poll picks it up
+        if state["id"] == self._last_id:
+            return False
+        self._last_id = state["id"]
+        self.event_bus.publish(PRICE, prices=state["prices"])
+        self.event_bus.publish(GAS, **state["gas"])
+        self.event_bus.publish(PORTFOLIO, **state["portfolio"])
+        return True
+
+class FleetBridge(_Poller):
+    """Publishes changes to the persisted fleet as bot events.
+
+    The web process runs no bots, so nothing in it publishes BOT_STATUS,
+    BOT_TRADE or BOT_LOG. This diffs successive snapshots of ``fleet`` (a
+    ``PersistedFleet``), publishing a status event for every bot whose
+    status changed and a trade event (``trades``, ``pnl``) when its trade
+    count rose, and republishes the log rows the bot processes write.
+    The fleet as first seen is the baseline, not a burst of events.
+    """
+
+    name = "mgcc-fleet-bridge"
+
+    def __init__(self, fleet, interval: float = FOLLOW_INTERVAL, event_bus: EventBus = None):
+        super().__init__(interval, event_bus)
+        self.fleet = fleet
+        self._version: Optional[int] = None
+        self._statuses = {}
+
+    def poll(self) -> bool:
+        """Publish what changed since the last poll; returns whether anything did"""
+        published = False
+        snapshot = self.fleet.snapshot()
+        if snapshot.version != self._version:
+            if self._version is not None:
+                for name, status in snapshot.statuses.items():
+                    previous = self._statuses.get(name)
+                    if previous == status:
+                        continue
+                    self.event_bus.publish(BOT_STATUS, bot=name, status=status)
+                    if previous is not None and status.total_trades > previous.total_trades:
+                        self.event_bus.publish(BOT_TRADE, bot=name, trades=status.total_trades - previous.total_trades,
+                                               pnl=status.pnl)
+                    published = True
+            self._statuses = snapshot.statuses
+            self._version = snapshot.version
+        for bot, timestamp, action, details in self.fleet.new_logs():
+            self.event_bus.publish(BOT_LOG, bot=bot, timestamp=timestamp, action=action, details=details)
+            published = True
+        return published
+
+def main():
+    """Run the market feed on its own (``python -m mountain_gorilla.streaming``)"""
+    feed = MarketFeed(state_path=MARKET_STATE_PATH)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    feed.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        feed.stop(feed.interval)
+
+if __name__ == "__main__":
+    main()
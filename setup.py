@@ -13,6 +13,12 @@ setup(
     },
     install_requires=[
         "click>=8.0.0",
+        "numpy>=1.24",
+        "gevent>=23.9",
+        "msgspec>=0.18",
     ],
-    python_requires=">=3.7",
+    extras_require={
+        "fast": ["Brotli>=1.1"],
+    },
+    python_requires=">=3.8",
 )
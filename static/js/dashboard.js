@@ -0,0 +1,1298 @@
+// Web3 Integration
+let web3;
+let userAccount;
+let contract;
+
+async function connectWallet() {
+    if (typeof window.ethereum !== 'undefined') {
+        try {
+            web3 = new Web3(window.ethereum);
+            const accounts = await window.ethereum.request({ method: 'eth_requestAccounts' });
+            userAccount = accounts[0];
+            updateWalletUI();
+            loadStreams();
+        } catch (error) {
+            console.error('User denied account access');
+        }
+    } else {
+        alert('Please install MetaMask!');
+    }
+}
+
+function updateWalletUI() {
+    document.getElementById('connectWallet').classList.add('hidden');
+    document.getElementById('walletInfo').classList.remove('hidden');
+    document.getElementById('walletAddress').textContent = 
+        userAccount.substring(0, 6) + '...' + userAccount.substring(38);
+    updateWalletBalance();
+}
+
+async function updateWalletBalance() {
+    if (web3 && userAccount) {
+        const balance = await web3.eth.getBalance(userAccount);
+        document.getElementById('walletBalance').textContent = 
+            web3.utils.fromWei(balance, 'ether').substring(0, 4) + ' ETH';
+    }
+}
+
+// Stream Management
+function showCreateStreamModal() {
+    document.getElementById('createStreamModal').classList.remove('hidden');
+}
+
+function closeCreateStreamModal() {
+    document.getElementById('createStreamModal').classList.add('hidden');
+}
+
+async function createStream() {
+    const bot = document.getElementById('streamBotSelect').value;
+    const amount = document.getElementById('streamAmount').value;
+    const duration = document.getElementById('streamDuration').value;
+
+    if (!amount || amount <= 0) {
+        alert('Please enter a valid amount');
+        return;
+    }
+
+    try {
+        const weiAmount = web3.utils.toWei(amount.toString(), 'ether');
+        // Here you would interact with your smart contract
+        // For now, we'll just simulate it
+        const stream = {
+            id: Date.now(),
+            bot: bot,
+            amount: amount,
+            duration: duration,
+            startDate: new Date(),
+            status: 'active'
+        };
+
+        addStreamToUI(stream);
+        closeCreateStreamModal();
+        updateStreamStats();
+    } catch (error) {
+        console.error('Error creating stream:', error);
+        alert('Failed to create stream');
+    }
+}
+
+function addStreamToUI(stream) {
+    const streamsContainer = document.getElementById('activeStreams');
+    const streamElement = document.createElement('div');
+    streamElement.className = 'stream-card rounded-lg p-6';
+    streamElement.innerHTML = `
+        <div class="flex justify-between items-start mb-4">
+            <h3 class="text-lg font-semibold text-purple-400">${stream.bot}</h3>
+            <span class="text-green-400">Active</span>
+        </div>
+        <div class="space-y-2">
+            <div class="flex justify-between">
+                <span class="text-gray-400">Amount:</span>
+                <span class="text-white">${stream.amount} ETH</span>
+            </div>
+            <div class="flex justify-between">
+                <span class="text-gray-400">Duration:</span>
+                <span class="text-white">${stream.duration} days</span>
+            </div>
+            <div class="flex justify-between">
+                <span class="text-gray-400">Started:</span>
+                <span class="text-white">${new Date(stream.startDate).toLocaleDateString()}</span>
+            </div>
+        </div>
+        <div class="mt-4">
+            <div class="w-full bg-gray-700 rounded-full h-2">
+                <div class="bg-purple-400 h-2 rounded-full" style="width: 0%"></div>
+            </div>
+        </div>
+    `;
+    streamsContainer.appendChild(streamElement);
+}
+
+function updateStreamStats() {
+    const streams = document.querySelectorAll('.stream-card');
+    document.getElementById('activeStreamsCount').textContent = streams.length;
+
+    let totalValue = 0;
+    streams.forEach(stream => {
+        const amount = parseFloat(stream.querySelector('.text-white').textContent);
+        totalValue += amount;
+    });
+
+    document.getElementById('totalStreamValue').textContent = totalValue.toFixed(2) + ' ETH';
+}
+
+// Analytics
+function showAnalytics() {
+    document.getElementById('dashboardView').classList.add('hidden');
+    document.getElementById('streamsView').classList.add('hidden');
+    document.getElementById('analyticsView').classList.remove('hidden');
+    initializeCharts();
+}
+
+function showStreams() {
+    document.getElementById('dashboardView').classList.add('hidden');
+    document.getElementById('analyticsView').classList.add('hidden');
+    document.getElementById('streamsView').classList.remove('hidden');
+}
+
+function initializeCharts() {
+    // Bot Performance Chart
+    new Chart(document.getElementById('botPerformanceChart'), {
+        type: 'line',
+        data: {
+            labels: ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'],
+            datasets: [{
+                label: 'Performance Score',
+                data: [65, 72, 78, 85, 82, 90],
+                borderColor: '#8B5CF6',
+                tension: 0.4
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    labels: {
+                        color: '#E5E7EB'
+                    }
+                }
+            },
+            scales: {
+                y: {
+                    grid: {
+                        color: 'rgba(75, 85, 99, 0.2)'
+                    },
+                    ticks: {
+                        color: '#E5E7EB'
+                    }
+                },
+                x: {
+                    grid: {
+                        color: 'rgba(75, 85, 99, 0.2)'
+                    },
+                    ticks: {
+                        color: '#E5E7EB'
+                    }
+                }
+            }
+        }
+    });
+
+    // Resource Usage Chart
+    new Chart(document.getElementById('resourceUsageChart'), {
+        type: 'doughnut',
+        data: {
+            labels: ['CPU', 'Memory', 'Network'],
+            datasets: [{
+                data: [45, 30, 25],
+                backgroundColor: ['#8B5CF6', '#3B82F6', '#10B981']
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    labels: {
+                        color: '#E5E7EB'
+                    }
+                }
+            }
+        }
+    });
+
+    // Stream Analytics Chart
+    new Chart(document.getElementById('streamAnalyticsChart'), {
+        type: 'bar',
+        data: {
+            labels: ['MemoriBot', 'FinanBot', 'TradeBot', 'TaskBot', 'CoachBot'],
+            datasets: [{
+                label: 'Active Streams',
+                data: [2, 3, 1, 0, 1],
+                backgroundColor: '#8B5CF6'
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    labels: {
+                        color: '#E5E7EB'
+                    }
+                }
+            },
+            scales: {
+                y: {
+                    grid: {
+                        color: 'rgba(75, 85, 99, 0.2)'
+                    },
+                    ticks: {
+                        color: '#E5E7EB'
+                    }
+                },
+                x: {
+                    grid: {
+                        color: 'rgba(75, 85, 99, 0.2)'
+                    },
+                    ticks: {
+                        color: '#E5E7EB'
+                    }
+                }
+            }
+        }
+    });
+}
+
+// Event Listeners
+document.getElementById('connectWallet').addEventListener('click', connectWallet);
+
+// Existing terminal functionality
+const terminalInput = document.getElementById('terminal-input');
+const terminalOutput = document.getElementById('terminal-output');
+
+terminalInput.addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        const command = this.value;
+        this.value = '';
+
+        terminalOutput.innerHTML += `<div class="text-green-400">$ ${command}</div>`;
+        processCommand(command);
+        terminalOutput.scrollTop = terminalOutput.scrollHeight;
+    }
+});
+
+function processCommand(command) {
+    const cmd = command.toLowerCase();
+    let response = '';
+
+    switch(cmd) {
+        case 'help':
+            response = `Available commands:
+- help: Show this help message
+- status: Show system status
+- clear: Clear terminal
+- bots: List all bots
+- train <bot>: Train a specific bot
+- details <bot>: Show bot details
+- streams: Show active streams
+- analytics: Show analytics dashboard
+- mybots: Show My Bots dashboard
+- createbot: Open Create Custom Bot modal
+- ai: Show AI Collaboration dashboard
+- newcollab: Open Create Collaboration modal
+- strategies: Show Financial Strategies dashboard
+- newstrategy: Open Create Strategy modal`;
+            break;
+        case 'status':
+            response = `System Status:
+- CPU: 45%
+- Memory: 2.4GB/8GB
+- Network: Active
+- Bots: 5 Active
+- Active Streams: ${document.getElementById('activeStreamsCount').textContent}`;
+            break;
+        case 'clear':
+            terminalOutput.innerHTML = '';
+            return;
+        case 'bots':
+            response = Object.keys(bots).join(', ');
+            break;
+        case 'streams':
+            showStreams();
+            response = 'Showing streams dashboard...';
+            break;
+        case 'analytics':
+            showAnalytics();
+            response = 'Showing analytics dashboard...';
+            break;
+        case 'mybots':
+            showMyBots();
+            response = 'Showing My Bots dashboard...';
+            break;
+        case 'createbot':
+            showCreateBotModal();
+            response = 'Opening Create Custom Bot modal...';
+            break;
+        case 'ai':
+            showAICollaboration();
+            response = 'Showing AI Collaboration dashboard...';
+            break;
+        case 'newcollab':
+            showCreateCollaborationModal();
+            response = 'Opening Create Collaboration modal...';
+            break;
+        case 'strategies':
+            showStrategies();
+            response = 'Showing Financial Strategies dashboard...';
+            break;
+        case 'newstrategy':
+            showCreateStrategyModal();
+            response = 'Opening Create Strategy modal...';
+            break;
+        default:
+            if (cmd.startsWith('train ')) {
+                const botName = cmd.split(' ')[1];
+                trainBot(botName);
+                response = `Training ${botName}...`;
+            } else if (cmd.startsWith('details ')) {
+                const botName = cmd.split(' ')[1];
+                showBotDetails(botName);
+                response = `Showing details for ${botName}...`;
+            } else {
+                response = `Command not found: ${command}`;
+            }
+    }
+
+    terminalOutput.innerHTML += `<div class="text-gray-300">${response}</div>`;
+}
+
+// Existing bot functions
+async function trainBot(botName) {
+    try {
+        const response = await fetch(`/api/bots/${botName}/train`, {
+            method: 'POST'
+        });
+        const data = await response.json();
+        if (response.ok) {
+            location.reload();
+        } else {
+            alert('Failed to train bot');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('Failed to train bot');
+    }
+}
+
+// Dashboard sections each bot's details view shows besides the bot itself
+const BOT_DETAIL_FIELDS = {
+    MemoriBot: ['memories'],
+    FinanBot: ['balance'],
+    CoachBot: ['quote']
+};
+
+async function showBotDetails(botName) {
+    try {
+        // One round trip for the bot and its extra sections
+        const fields = ['bots', ...(BOT_DETAIL_FIELDS[botName] || [])];
+        const dashboard = await fetch(`/api/dashboard?fields=${fields.join(',')}`).then(r => r.json());
+        const data = dashboard.bots[botName];
+
+        document.getElementById('modalTitle').textContent = data.name;
+        const modalContent = document.getElementById('modalContent');
+
+        let content = `
+            <div class="ascii-art text-center mb-4 text-green-400">${data.ascii_art}</div>
+            <div class="mb-4">
+                <h3 class="text-lg font-semibold text-blue-400 mb-2">Stats:</h3>
+                <pre class="text-gray-300">${JSON.stringify(data.stats, null, 2)}</pre>
+            </div>
+        `;
+
+        // Add bot-specific content
+        switch(botName) {
+            case 'MemoriBot':
+                const memories = dashboard.memories;
+                content += `
+                    <div class="mb-4">
+                        <h3 class="text-lg font-semibold text-blue-400 mb-2">Memories:</h3>
+                        <pre class="text-gray-300">${JSON.stringify(memories, null, 2)}</pre>
+                    </div>
+                `;
+                break;
+            case 'FinanBot':
+                const balance = dashboard.balance;
+                content += `
+                    <div class="mb-4">
+                        <h3 class="text-lg font-semibold text-blue-400 mb-2">Balance:</h3>
+                        <pre class="text-gray-300">${JSON.stringify(balance, null, 2)}</pre>
+                    </div>
+                `;
+                break;
+            case 'CoachBot':
+                const quote = dashboard.quote;
+                content += `
+                    <div class="mb-4">
+                        <h3 class="text-lg font-semibold text-blue-400 mb-2">Motivational Quote:</h3>
+                        <p class="text-gray-300 italic">${quote.quote}</p>
+                    </div>
+                `;
+                break;
+        }
+
+        modalContent.innerHTML = content;
+        document.getElementById('botModal').classList.remove('hidden');
+    } catch (error) {
+        console.error('Error:', error);
+        alert('Failed to load bot details');
+    }
+}
+
+function closeModal() {
+    document.getElementById('botModal').classList.add('hidden');
+}
+
+// My Bots functionality
+function showMyBots() {
+    document.getElementById('dashboardView').classList.add('hidden');
+    document.getElementById('analyticsView').classList.add('hidden');
+    document.getElementById('streamsView').classList.add('hidden');
+    document.getElementById('myBotsView').classList.remove('hidden');
+    loadCustomBots();
+}
+
+function showCreateBotModal() {
+    document.getElementById('createBotModal').classList.remove('hidden');
+}
+
+function closeCreateBotModal() {
+    document.getElementById('createBotModal').classList.add('hidden');
+}
+
+function loadCustomBots() {
+    // Load custom bots from localStorage or API
+    const customBots = JSON.parse(localStorage.getItem('customBots') || '[]');
+    const grid = document.getElementById('customBotsGrid');
+    grid.innerHTML = '';
+
+    customBots.forEach(bot => {
+        const botElement = document.createElement('div');
+        botElement.className = 'bot-card rounded-lg p-6 shadow-lg';
+        botElement.innerHTML = `
+            <div class="ascii-art text-center mb-4 text-green-400">${bot.ascii_art}</div>
+            <h2 class="text-2xl font-bold text-purple-400 mb-2">${bot.name}</h2>
+            <div class="mb-4">
+                <span class="text-yellow-400">Custom Bot</span>
+            </div>
+            <div class="mb-4">
+                <h3 class="text-lg font-semibold text-blue-400 mb-2">Components:</h3>
+                <ul class="list-disc list-inside text-gray-300">
+                    ${bot.components.map(comp => `<li>${comp}</li>`).join('')}
+                </ul>
+            </div>
+            <div class="flex justify-between">
+                <button onclick="trainCustomBot('${bot.id}')" 
+                        class="bg-purple-600 hover:bg-purple-700 text-white px-4 py-2 rounded">
+                    Train
+                </button>
+                <button onclick="showCustomBotDetails('${bot.id}')" 
+                        class="bg-blue-600 hover:bg-blue-700 text-white px-4 py-2 rounded">
+                    Details
+                </button>
+            </div>
+        `;
+        grid.appendChild(botElement);
+    });
+}
+
+function createCustomBot() {
+    const name = document.getElementById('botName').value;
+    const components = Array.from(document.querySelectorAll('input[type="checkbox"]:checked'))
+        .map(cb => cb.value);
+    const asciiArt = document.getElementById('customAscii').value;
+
+    if (!name || components.length === 0) {
+        alert('Please enter a name and select at least one component');
+        return;
+    }
+
+    const bot = {
+        id: Date.now().toString(),
+        name: name,
+        components: components,
+        ascii_art: asciiArt || bot_ascii[components[0]], // Use first component's ASCII art if none provided
+        level: 1,
+        created_at: new Date().toISOString()
+    };
+
+    // Save to localStorage (or API)
+    const customBots = JSON.parse(localStorage.getItem('customBots') || '[]');
+    customBots.push(bot);
+    localStorage.setItem('customBots', JSON.stringify(customBots));
+
+    loadCustomBots();
+    closeCreateBotModal();
+}
+
+async function trainCustomBot(botId) {
+    try {
+        const response = await fetch(`/api/custom-bots/${botId}/train`, {
+            method: 'POST'
+        });
+        const data = await response.json();
+        if (response.ok) {
+            loadCustomBots();
+        } else {
+            alert('Failed to train bot');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('Failed to train bot');
+    }
+}
+
+async function showCustomBotDetails(botId) {
+    try {
+        const customBots = JSON.parse(localStorage.getItem('customBots') || '[]');
+        const bot = customBots.find(b => b.id === botId);
+
+        if (!bot) {
+            alert('Bot not found');
+            return;
+        }
+
+        document.getElementById('modalTitle').textContent = bot.name;
+        const modalContent = document.getElementById('modalContent');
+
+        let content = `
+            <div class="ascii-art text-center mb-4 text-green-400">${bot.ascii_art}</div>
+            <div class="mb-4">
+                <h3 class="text-lg font-semibold text-blue-400 mb-2">Components:</h3>
+                <ul class="list-disc list-inside text-gray-300">
+                    ${bot.components.map(comp => `<li>${comp}</li>`).join('')}
+                </ul>
+            </div>
+            <div class="mb-4">
+                <h3 class="text-lg font-semibold text-blue-400 mb-2">Created:</h3>
+                <p class="text-gray-300">${new Date(bot.created_at).toLocaleString()}</p>
+            </div>
+        `;
+
+        modalContent.innerHTML = content;
+        document.getElementById('botModal').classList.remove('hidden');
+    } catch (error) {
+        console.error('Error:', error);
+        alert('Failed to load bot details');
+    }
+}
+
+// AI Collaboration functionality
+function showAICollaboration() {
+    document.getElementById('dashboardView').classList.add('hidden');
+    document.getElementById('analyticsView').classList.add('hidden');
+    document.getElementById('streamsView').classList.add('hidden');
+    document.getElementById('myBotsView').classList.add('hidden');
+    document.getElementById('aiCollaborationView').classList.remove('hidden');
+    loadActiveCollaborations();
+}
+
+function showCreateCollaborationModal() {
+    document.getElementById('createCollaborationModal').classList.remove('hidden');
+}
+
+function closeCreateCollaborationModal() {
+    document.getElementById('createCollaborationModal').classList.add('hidden');
+}
+
+async function createCollaboration() {
+    const task = document.getElementById('taskDescription').value;
+    const capabilities = Array.from(document.querySelectorAll('input[type="checkbox"]:checked'))
+        .map(cb => cb.value);
+
+    if (!task || capabilities.length === 0) {
+        alert('Please enter a task and select at least one capability');
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/ai/collaborate', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                task: task,
+                capabilities: capabilities
+            })
+        });
+
+        const data = await response.json();
+        if (response.ok) {
+            loadActiveCollaborations();
+            closeCreateCollaborationModal();
+        } else {
+            alert('Failed to create collaboration');
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('Failed to create collaboration');
+    }
+}
+
+async function loadActiveCollaborations() {
+    try {
+        const response = await fetch('/api/ai/collaborations');
+        const data = await response.json();
+
+        const container = document.getElementById('activeCollaborations');
+        container.innerHTML = '';
+
+        data.forEach(collab => {
+            const element = document.createElement('div');
+            element.className = 'status-item p-4 rounded';
+            element.innerHTML = `
+                <div class="flex justify-between items-start mb-2">
+                    <h4 class="text-lg font-semibold text-purple-400">${collab.task}</h4>
+                    <span class="text-green-400">${collab.status}</span>
+                </div>
+                <div class="text-sm text-gray-300 mb-2">
+                    Bots: ${collab.bots.join(', ')}
+                </div>
+                <div class="w-full bg-gray-700 rounded-full h-2">
+                    <div class="bg-purple-400 h-2 rounded-full" style="width: ${(collab.progress / (collab.bots.length * 2)) * 100}%"></div>
+                </div>
+                <div class="mt-2 flex justify-end space-x-2">
+                    <button onclick="viewCollaborationDetails(${collab.id})" 
+                            class="text-blue-400 hover:text-blue-300 text-sm">
+                        Details
+                    </button>
+                    <button onclick="viewCollaborationInsights(${collab.id})" 
+                            class="text-green-400 hover:text-green-300 text-sm">
+                        Insights
+                    </button>
+                </div>
+            `;
+            container.appendChild(element);
+        });
+    } catch (error) {
+        console.error('Error:', error);
+    }
+}
+
+async function viewCollaborationDetails(collaborationId) {
+    try {
+        const response = await fetch(`/api/ai/collaborations/${collaborationId}`);
+        const data = await response.json();
+
+        const chat = document.getElementById('collaborationChat');
+        chat.innerHTML = '';
+
+        data.conversation.forEach(msg => {
+            const messageElement = document.createElement('div');
+            messageElement.className = 'flex items-start space-x-2';
+            messageElement.innerHTML = `
+                <span class="text-purple-400">${msg.bot}:</span>
+                <span class="text-gray-300">${msg.message}</span>
+            `;
+            chat.appendChild(messageElement);
+        });
+
+        chat.scrollTop = chat.scrollHeight;
+    } catch (error) {
+        console.error('Error:', error);
+    }
+}
+
+async function viewCollaborationInsights(collaborationId) {
+    try {
+        const response = await fetch(`/api/ai/collaborations/${collaborationId}/insights`);
+        const data = await response.json();
+
+        const insights = document.getElementById('aiInsights');
+        insights.innerHTML = `
+            <div class="status-item p-4 rounded">
+                <h4 class="text-lg font-semibold text-purple-400 mb-2">Collaboration Insights</h4>
+                <div class="space-y-2">
+                    <div class="flex justify-between">
+                        <span class="text-gray-300">Total Messages:</span>
+                        <span class="text-white">${data.total_messages}</span>
+                    </div>
+                    <div class="flex justify-between">
+                        <span class="text-gray-300">Duration:</span>
+                        <span class="text-white">${data.collaboration_duration}</span>
+                    </div>
+                    <div class="flex justify-between">
+                        <span class="text-gray-300">Efficiency Score:</span>
+                        <span class="text-white">${(data.efficiency_score * 100).toFixed(1)}%</span>
+                    </div>
+                </div>
+            </div>
+        `;
+    } catch (error) {
+        console.error('Error:', error);
+    }
+}
+
+async function sendChatMessage() {
+    const input = document.getElementById('chatInput');
+    const message = input.value.trim();
+
+    if (!message) return;
+
+    try {
+        const response = await fetch('/api/ai/bots/message', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                bot: 'User',
+                message: message,
+                collaboration_id: currentCollaborationId
+            })
+        });
+
+        if (response.ok) {
+            input.value = '';
+            viewCollaborationDetails(currentCollaborationId);
+        }
+    } catch (error) {
+        console.error('Error:', error);
+    }
+}
+
+// Strategies functionality
+function showStrategies() {
+    document.getElementById('dashboardView').classList.add('hidden');
+    document.getElementById('analyticsView').classList.add('hidden');
+    document.getElementById('streamsView').classList.add('hidden');
+    document.getElementById('myBotsView').classList.add('hidden');
+    document.getElementById('aiCollaborationView').classList.add('hidden');
+    document.getElementById('strategiesView').classList.remove('hidden');
+    loadUserStrategies();
+    loadStrategyExplorer();
+}
+
+function showCreateStrategyModal() {
+    document.getElementById('createStrategyModal').classList.remove('hidden');
+    updateStrategyParams();
+}
+
+function closeCreateStrategyModal() {
+    document.getElementById('createStrategyModal').classList.add('hidden');
+}
+
+function updateStrategyParams() {
+    const strategyType = document.getElementById('strategyType').value;
+    const paramsContainer = document.getElementById('strategyParams');
+    paramsContainer.innerHTML = '';
+
+    switch(strategyType) {
+        case 'yield':
+            paramsContainer.innerHTML = `
+                <div>
+                    <label class="block text-gray-300 mb-1">Protocol</label>
+                    <input type="text" class="w-full bg-gray-700 text-white rounded p-2" placeholder="e.g., Aave, Compound">
+                </div>
+                <div>
+                    <label class="block text-gray-300 mb-1">Token</label>
+                    <input type="text" class="w-full bg-gray-700 text-white rounded p-2" placeholder="e.g., USDC, ETH">
+                </div>
+                <div>
+                    <label class="block text-gray-300 mb-1">Min APY</label>
+                    <input type="number" class="w-full bg-gray-700 text-white rounded p-2" placeholder="e.g., 5">
+                </div>
+            `;
+            break;
+        case 'trading':
+            paramsContainer.innerHTML = `
+                <div>
+                    <label class="block text-gray-300 mb-1">Trading Pair</label>
+                    <input type="text" class="w-full bg-gray-700 text-white rounded p-2" placeholder="e.g., ETH/USDT">
+                </div>
+                <div>
+                    <label class="block text-gray-300 mb-1">Strategy Type</label>
+                    <select class="w-full bg-gray-700 text-white rounded p-2">
+                        <option value="grid">Grid Trading</option>
+                        <option value="dca">Dollar Cost Average</option>
+                        <option value="momentum">Momentum Trading</option>
+                    </select>
+                </div>
+                <div>
+                    <label class="block text-gray-300 mb-1">Investment Amount</label>
+                    <input type="number" class="w-full bg-gray-700 text-white rounded p-2" placeholder="e.g., 1000">
+                </div>
+            `;
+            break;
+        case 'lending':
+            paramsContainer.innerHTML = `
+                <div>
+                    <label class="block text-gray-300 mb-1">Platform</label>
+                    <input type="text" class="w-full bg-gray-700 text-white rounded p-2" placeholder="e.g., Aave, Compound">
+                </div>
+                <div>
+                    <label class="block text-gray-300 mb-1">Asset</label>
+                    <input type="text" class="w-full bg-gray-700 text-white rounded p-2" placeholder="e.g., ETH, USDC">
+                </div>
+                <div>
+                    <label class="block text-gray-300 mb-1">Interest Rate</label>
+                    <input type="number" class="w-full bg-gray-700 text-white rounded p-2" placeholder="e.g., 3.5">
+                </div>
+            `;
+            break;
+        case 'staking':
+            paramsContainer.innerHTML = `
+                <div>
+                    <label class="block text-gray-300 mb-1">Token</label>
+                    <input type="text" class="w-full bg-gray-700 text-white rounded p-2" placeholder="e.g., ETH, SOL">
+                </div>
+                <div>
+                    <label class="block text-gray-300 mb-1">Lock Period</label>
+                    <select class="w-full bg-gray-700 text-white rounded p-2">
+                        <option value="7">7 days</option>
+                        <option value="30">30 days</option>
+                        <option value="90">90 days</option>
+                        <option value="180">180 days</option>
+                        <option value="365">365 days</option>
+                    </select>
+                </div>
+                <div>
+                    <label class="block text-gray-300 mb-1">Reward Rate</label>
+                    <input type="number" class="w-full bg-gray-700 text-white rounded p-2" placeholder="e.g., 5">
+                </div>
+            `;
+            break;
+        case 'custom':
+            paramsContainer.innerHTML = `
+                <div>
+                    <label class="block text-gray-300 mb-1">Custom Parameters</label>
+                    <textarea class="w-full bg-gray-700 text-white rounded p-2 h-32" placeholder="Enter custom parameters in JSON format"></textarea>
+                </div>
+            `;
+            break;
+    }
+}
+
+function createStrategy() {
+    const name = document.getElementById('strategyName').value;
+    const type = document.getElementById('strategyType').value;
+    const risk = document.getElementById('riskLevel').value;
+    const description = document.getElementById('strategyDescription').value;
+
+    if (!name || !description) {
+        alert('Please fill in all required fields');
+        return;
+    }
+
+    const strategy = {
+        id: Date.now().toString(),
+        name: name,
+        type: type,
+        risk: risk,
+        description: description,
+        created_at: new Date().toISOString(),
+        status: 'active'
+    };
+
+    // Save to localStorage (or API)
+    const strategies = JSON.parse(localStorage.getItem('userStrategies') || '[]');
+    strategies.push(strategy);
+    localStorage.setItem('userStrategies', JSON.stringify(strategies));
+
+    loadUserStrategies();
+    closeCreateStrategyModal();
+}
+
+function loadUserStrategies() {
+    const strategies = JSON.parse(localStorage.getItem('userStrategies') || '[]');
+    const container = document.getElementById('userStrategies');
+    container.innerHTML = '';
+
+    strategies.forEach(strategy => {
+        const element = document.createElement('div');
+        element.className = 'status-item p-4 rounded';
+        element.innerHTML = `
+            <div class="flex items-center justify-between mb-2">
+                <h4 class="text-lg font-semibold text-purple-400">${strategy.name}</h4>
+                <span class="text-green-400">${strategy.status}</span>
+            </div>
+            <div class="space-y-2">
+                <div class="flex justify-between">
+                    <span class="text-gray-400">Type:</span>
+                    <span class="text-white">${strategy.type}</span>
+                </div>
+                <div class="flex justify-between">
+                    <span class="text-gray-400">Risk:</span>
+                    <span class="text-${getRiskColor(strategy.risk)}">${strategy.risk}</span>
+                </div>
+            </div>
+            <div class="mt-4">
+                <div class="w-full bg-gray-700 rounded-full h-2">
+                    <div class="bg-green-400 h-2 rounded-full" style="width: 0%"></div>
+                </div>
+            </div>
+            <div class="mt-4 flex justify-end space-x-2">
+                <button onclick="editStrategy('${strategy.id}')" 
+                        class="text-blue-400 hover:text-blue-300 text-sm">
+                    Edit
+                </button>
+                <button onclick="deleteStrategy('${strategy.id}')" 
+                        class="text-red-400 hover:text-red-300 text-sm">
+                    Delete
+                </button>
+            </div>
+        `;
+        container.appendChild(element);
+    });
+}
+
+function getRiskColor(risk) {
+    switch(risk) {
+        case 'low': return 'green';
+        case 'medium': return 'yellow';
+        case 'high': return 'red';
+        default: return 'gray';
+    }
+}
+
+function loadStrategyExplorer() {
+    const strategies = [
+        {
+            name: 'Yield Farming Optimizer',
+            type: 'yield',
+            description: 'Automatically finds and invests in the highest yielding protocols',
+            risk: 'medium',
+            apy: '15-25%'
+        },
+        {
+            name: 'Grid Trading Bot',
+            type: 'trading',
+            description: 'Implements grid trading strategy with customizable parameters',
+            risk: 'high',
+            apy: '8-12%'
+        },
+        {
+            name: 'Lending Protocol Manager',
+            type: 'lending',
+            description: 'Manages lending positions across multiple protocols',
+            risk: 'low',
+            apy: '3-5%'
+        }
+    ];
+
+    const container = document.getElementById('strategyList');
+    container.innerHTML = '';
+
+    strategies.forEach(strategy => {
+        const element = document.createElement('div');
+        element.className = 'status-item p-4 rounded cursor-pointer hover:bg-gray-700';
+        element.onclick = () => showStrategyDetails(strategy);
+        element.innerHTML = `
+            <h4 class="text-lg font-semibold text-purple-400">${strategy.name}</h4>
+            <div class="mt-2 text-sm text-gray-300">${strategy.description}</div>
+            <div class="mt-2 flex justify-between items-center">
+                <span class="text-${getRiskColor(strategy.risk)}">${strategy.risk} Risk</span>
+                <span class="text-green-400">${strategy.apy} APY</span>
+            </div>
+        `;
+        container.appendChild(element);
+    });
+}
+
+function showStrategyDetails(strategy) {
+    const container = document.getElementById('strategyDetails');
+    container.innerHTML = `
+        <div class="space-y-4">
+            <div>
+                <h4 class="text-lg font-semibold text-purple-400">${strategy.name}</h4>
+                <p class="text-gray-300 mt-2">${strategy.description}</p>
+            </div>
+            <div class="grid grid-cols-2 gap-4">
+                <div>
+                    <span class="text-gray-400">Type:</span>
+                    <span class="text-white ml-2">${strategy.type}</span>
+                </div>
+                <div>
+                    <span class="text-gray-400">Risk Level:</span>
+                    <span class="text-${getRiskColor(strategy.risk)} ml-2">${strategy.risk}</span>
+                </div>
+                <div>
+                    <span class="text-gray-400">Expected APY:</span>
+                    <span class="text-green-400 ml-2">${strategy.apy}</span>
+                </div>
+            </div>
+            <button onclick="applyStrategy('${strategy.name}')" 
+                    class="w-full bg-purple-600 hover:bg-purple-700 text-white px-4 py-2 rounded">
+                Apply Strategy
+            </button>
+        </div>
+    `;
+}
+
+function applyStrategy(strategyName) {
+    // Here you would implement the logic to apply the strategy
+    alert(`Applying strategy: ${strategyName}`);
+}
+
+function searchStrategies() {
+    const searchTerm = document.getElementById('strategySearch').value.toLowerCase();
+    const strategies = document.querySelectorAll('#strategyList > div');
+
+    strategies.forEach(strategy => {
+        const name = strategy.querySelector('h4').textContent.toLowerCase();
+        const description = strategy.querySelector('.text-gray-300').textContent.toLowerCase();
+
+        if (name.includes(searchTerm) || description.includes(searchTerm)) {
+            strategy.style.display = 'block';
+        } else {
+            strategy.style.display = 'none';
+        }
+    });
+}
+
+// Market Scanner functionality
+let marketStream = null;
+let charts = {};
+
+function showMarketScanner() {
+    document.getElementById('dashboardView').classList.add('hidden');
+    document.getElementById('analyticsView').classList.add('hidden');
+    document.getElementById('streamsView').classList.add('hidden');
+    document.getElementById('myBotsView').classList.add('hidden');
+    document.getElementById('aiCollaborationView').classList.add('hidden');
+    document.getElementById('strategiesView').classList.add('hidden');
+    document.getElementById('marketScannerView').classList.remove('hidden');
+    loadMarketData();
+    initializeCharts();
+}
+
+function initializeCharts() {
+    // Initialize mini charts for market overview
+    const chartConfigs = {
+        ethPriceChart: {
+            type: 'line',
+            data: generateChartData(20, 2400, 2500),
+            options: getMiniChartOptions('ETH Price')
+        },
+        gasPriceChart: {
+            type: 'line',
+            data: generateChartData(20, 20, 40),
+            options: getMiniChartOptions('Gas Price')
+        },
+        tpsChart: {
+            type: 'line',
+            data: generateChartData(20, 40, 50),
+            options: getMiniChartOptions('TPS')
+        },
+        validatorChart: {
+            type: 'line',
+            data: generateChartData(20, 520000, 525000),
+            options: getMiniChartOptions('Validators')
+        }
+    };
+
+    Object.entries(chartConfigs).forEach(([id, config]) => {
+        const ctx = document.getElementById(id).getContext('2d');
+        charts[id] = new Chart(ctx, config);
+    });
+}
+
+function generateChartData(count, min, max) {
+    const labels = Array.from({length: count}, (_, i) => '');
+    const data = Array.from({length: count}, () => 
+        Math.random() * (max - min) + min
+    );
+    return {
+        labels,
+        datasets: [{
+            data,
+            borderColor: '#8B5CF6',
+            borderWidth: 2,
+            pointRadius: 0,
+            tension: 0.4
+        }]
+    };
+}
+
+function getMiniChartOptions(label) {
+    return {
+        responsive: true,
+        maintainAspectRatio: false,
+        plugins: {
+            legend: {
+                display: false
+            }
+        },
+        scales: {
+            x: {
+                display: false
+            },
+            y: {
+                display: false
+            }
+        }
+    };
+}
+
+function toggleStream() {
+    const button = document.getElementById('streamToggle');
+    const status = document.getElementById('streamStatus');
+    const buttonText = document.getElementById('streamButtonText');
+
+    if (marketStream) {
+        // Stop stream
+        marketStream.close();
+        marketStream = null;
+        status.className = 'text-red-400';
+        buttonText.textContent = 'Start Stream';
+    } else {
+        // Start stream
+        startMarketStream();
+        status.className = 'text-green-400';
+        buttonText.textContent = 'Stop Stream';
+    }
+}
+
+function startMarketStream() {
+    // Server-Sent Events; the browser resumes with Last-Event-ID on reconnect
+    marketStream = new EventSource('/api/stream?topics=market.*,bot.*');
+    marketStream.addEventListener('batch', (message) => {
+        JSON.parse(message.data).forEach(handleServerEvent);
+        updateCharts();
+    });
+    marketStream.addEventListener('dropped', (message) => {
+        const { count } = JSON.parse(message.data);
+        addStreamEvent({ type: 'notice', text: `Skipped ${count} events (slow connection)`, time: new Date().toLocaleTimeString() });
+    });
+    marketStream.addEventListener('reset', () => {
+        // The server could not resume (restart or another worker); what follows is live
+        lastPrices = {};
+        addStreamEvent({ type: 'notice', text: 'Stream restarted; showing live events', time: new Date().toLocaleTimeString() });
+    });
+}
+
+let lastPrices = {};
+const chartHistory = { ethPriceChart: [], gasPriceChart: [] };
+
+function pushChartPoint(id, value) {
+    const points = chartHistory[id];
+    points.push(value);
+    if (points.length > 20) points.shift();
+}
+
+function handleServerEvent(event) {
+    const time = new Date(event.timestamp * 1000).toLocaleTimeString();
+    const data = event.data;
+    switch (event.topic) {
+        case 'market.price':
+            ['ETH', 'BTC'].forEach(token => {
+                const price = data.prices[token];
+                const previous = lastPrices[token] || price;
+                addStreamEvent({
+                    type: 'price',
+                    token,
+                    price: price.toFixed(2),
+                    change: ((price - previous) / previous * 100).toFixed(2),
+                    time
+                });
+            });
+            document.getElementById('ethPrice').textContent = `$${data.prices.ETH.toLocaleString(undefined, { maximumFractionDigits: 2 })}`;
+            pushChartPoint('ethPriceChart', data.prices.ETH);
+            lastPrices = data.prices;
+            break;
+        case 'market.gas':
+            addStreamEvent({ type: 'gas', price: data.gwei.toFixed(1), time });
+            document.getElementById('gasPrice').textContent = `${data.gwei.toFixed(1)} Gwei`;
+            document.getElementById('gasStatus').textContent = data.status.charAt(0).toUpperCase() + data.status.slice(1);
+            pushChartPoint('gasPriceChart', data.gwei);
+            break;
+        case 'bot.trade':
+            if (data.price === undefined) {
+                // Bridged from the persisted fleet: how many trades, not their fills
+                addStreamEvent({ type: 'notice', text: `${data.bot} made ${data.trades} trade(s), PnL $${data.pnl.toFixed(2)}`, time });
+            } else {
+                addStreamEvent({ type: 'trade', token: data.bot, price: data.price, amount: data.amount || '', time });
+            }
+            break;
+        case 'bot.status':
+            addStreamEvent({ type: 'notice', text: `${data.bot} is ${data.status.status}`, time });
+            break;
+        case 'bot.log':
+            addStreamEvent({ type: 'notice', text: `${data.bot}: ${data.action}`, time });
+            break;
+    }
+}
+
+function addStreamEvent(event) {
+    const container = document.getElementById('marketStream');
+    const eventElement = document.createElement('div');
+    eventElement.className = 'flex items-center justify-between p-2 rounded bg-gray-700/50';
+
+    let content = '';
+    switch (event.type) {
+        case 'trade':
+            content = `
+                <span class="text-gray-400">${event.time}</span>
+                <span class="text-white">${event.token} Trade</span>
+                <span class="text-purple-400">$${event.price}</span>
+                <span class="text-gray-400">${event.amount} ETH</span>
+            `;
+            break;
+        case 'price':
+            content = `
+                <span class="text-gray-400">${event.time}</span>
+                <span class="text-white">${event.token}</span>
+                <span class="text-purple-400">$${event.price}</span>
+                <span class="${event.change >= 0 ? 'text-green-400' : 'text-red-400'}">
+                    ${event.change >= 0 ? '+' : ''}${event.change}%
+                </span>
+            `;
+            break;
+        case 'gas':
+            content = `
+                <span class="text-gray-400">${event.time}</span>
+                <span class="text-white">Gas Price</span>
+                <span class="text-yellow-400">${event.price} Gwei</span>
+            `;
+            break;
+        case 'notice':
+            content = `
+                <span class="text-gray-400">${event.time}</span>
+                <span class="text-white">${event.text}</span>
+            `;
+            break;
+    }
+
+    eventElement.innerHTML = content;
+    container.insertBefore(eventElement, container.firstChild);
+
+    // Keep only last 50 events
+    if (container.children.length > 50) {
+        container.removeChild(container.lastChild);
+    }
+}
+
+function updateCharts() {
+    Object.entries(chartHistory).forEach(([id, points]) => {
+        const chart = charts[id];
+        if (!chart || !points.length) return;
+        chart.data.labels = points.map(() => '');
+        chart.data.datasets[0].data = points.slice();
+        chart.update('none');
+    });
+}
+
+function updateTrends() {
+    const timeframe = document.getElementById('trendTimeframe').value;
+    const gainers = [
+        { token: 'ETH', change: '+5.2%', price: '$2,450.32' },
+        { token: 'BTC', change: '+3.8%', price: '$42,150.00' },
+        { token: 'SOL', change: '+2.9%', price: '$98.45' }
+    ];
+    const losers = [
+        { token: 'DOGE', change: '-2.1%', price: '$0.085' },
+        { token: 'ADA', change: '-1.8%', price: '$0.45' },
+        { token: 'DOT', change: '-1.2%', price: '$6.80' }
+    ];
+
+    const gainersContainer = document.getElementById('topGainers');
+    const losersContainer = document.getElementById('topLosers');
+
+    gainersContainer.innerHTML = gainers.map(token => `
+        <div class="flex items-center justify-between p-2 rounded bg-gray-700/50">
+            <span class="text-white">${token.token}</span>
+            <span class="text-green-400">${token.change}</span>
+            <span class="text-purple-400">${token.price}</span>
+        </div>
+    `).join('');
+
+    losersContainer.innerHTML = losers.map(token => `
+        <div class="flex items-center justify-between p-2 rounded bg-gray-700/50">
+            <span class="text-white">${token.token}</span>
+            <span class="text-red-400">${token.change}</span>
+            <span class="text-purple-400">${token.price}</span>
+        </div>
+    `).join('');
+}
@@ -0,0 +1,63 @@
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import textwrap
+
+from mountain_gorilla.bot_manager import BotManager
+from mountain_gorilla.events import EventBus
+
+# Holds the writer lock in the main thread when SIGTERM arrives
+SIGTERM_WHILE_WRITING = textwrap.dedent("""
+    import os, signal, time
+    from mountain_gorilla.bot_manager import BotManager
+    manager = BotManager("bots.db")
+    manager.install_shutdown_hooks()
+    manager.deploy_bot("alpha", "momentum")
+    with manager._write_lock:
+        os.kill(os.getpid(), signal.SIGTERM)
+        time.sleep(30)
+""")
+
+
+def test_sigterm_while_the_main_thread_writes_still_shuts_down(tmp_path):
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    result = subprocess.run([sys.executable, "-c", SIGTERM_WHILE_WRITING], cwd=tmp_path, env=env,
+                            capture_output=True, timeout=20)
+
+    assert result.returncode == 128 + signal.SIGTERM
+    conn = sqlite3.connect(str(tmp_path / "bots.db"))
+    assert conn.execute("SELECT action FROM bot_logs").fetchall() == [("deployed",)]
+    conn.close()
+
+
+def test_run_draining_during_shutdown_does_not_restart_the_dca_engine(tmp_path):
+    manager = BotManager(str(tmp_path / "bots.db"), event_bus=EventBus())
+    manager.deploy_bot("alpha", "eth-dca")
+    manager._shutting_down.set()
+
+    manager._execute_dca_strategy("alpha", manager.bots["alpha"])
+
+    assert manager.dca_engine._thread is None
+    assert list(manager.dca_engine.pending_by_bot()) == ["alpha"]  # left for the final flush
+
+
+def test_failed_final_dca_flush_still_stops_and_persists_the_fleet(tmp_path):
+    db_path = str(tmp_path / "bots.db")
+    manager = BotManager(db_path, event_bus=EventBus())
+    manager.deploy_bot("alpha", "eth-dca")
+    manager._update_status("alpha", status="running")
+    manager.dca_engine.submit("alpha", "ETH", "0.01")
+
+    def node_down(token, amount):
+        raise RuntimeError("node down")
+
+    manager.dca_engine.executor = node_down
+    assert manager.shutdown(timeout=1)
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT status FROM bot_status WHERE name = 'alpha'").fetchone() == ("stopped",)
+    actions = [row[0] for row in conn.execute("SELECT action FROM bot_logs ORDER BY id")]
+    conn.close()
+    assert actions[-2:] == ["dca_unfilled", "shutdown"]
@@ -0,0 +1,40 @@
+import io
+
+from rich.console import Console
+
+from mountain_gorilla.charts import RangeChart, Sparkline
+from mountain_gorilla.ringbuffer import RingBuffer
+
+DAY = 24 * 60 * 60
+
+
+def draw(chart, width=80):
+    console = Console(width=width, file=io.StringIO(), color_system=None)
+    console.print(chart)
+    return console.file.getvalue()
+
+
+def test_capture_keeps_only_the_columns_of_a_long_history():
+    series = RingBuffer(DAY, (float(i % 100) for i in range(DAY)))
+    chart = Sparkline(series, label="ETH")
+    draw(chart)  # the first draw sets the width to capture for
+
+    chart.capture()
+    series.append(1000.0)  # lands after the capture
+
+    assert chart.frame.max_width == 80
+    assert 0 < len(chart.frame.highs) <= 80
+    assert chart.frame.latest == float((DAY - 1) % 100)
+    assert "1,000.00" not in draw(chart)
+
+
+def test_uncaptured_and_resized_charts_draw_the_live_series():
+    series = RingBuffer(100, (float(i) for i in range(50)))
+    chart = RangeChart(series, height=4)
+    chart.capture()  # nothing drawn yet, so nothing to capture for
+    assert chart.frame is None
+
+    assert "49.00" in draw(chart, width=40)
+    chart.capture()
+    series.append(500.0)
+    assert "500.00" in draw(chart, width=60)  # a new width reduces the live series
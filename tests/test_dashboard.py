@@ -0,0 +1,13 @@
+from mountain_gorilla import dashboard
+from mountain_gorilla.aggregates import AggregateMetrics
+from mountain_gorilla.bot_manager import PersistedFleet
+from mountain_gorilla.events import EventBus
+
+
+def test_quick_summary_renders_before_any_aggregate_arrives(tmp_path, monkeypatch, capsys):
+    # Its own bus, so no feed event ever reaches these aggregates
+    empty = AggregateMetrics(fleet=PersistedFleet(str(tmp_path / "bots.db")), event_bus=EventBus())
+    monkeypatch.setattr(dashboard, "default_aggregates", empty)
+    dashboard.create_simple_dashboard()
+    out = capsys.readouterr().out
+    assert "Total Portfolio Value" in out and "—" in out
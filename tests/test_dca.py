@@ -0,0 +1,21 @@
+import time
+
+from mountain_gorilla.dca import DCAEngine
+from mountain_gorilla.events import EventBus
+
+
+def test_background_executor_failures_are_counted_and_requeued(capsys):
+    def broken(token, amount):
+        raise RuntimeError("exchange down")
+
+    engine = DCAEngine(bucket_seconds=0.05, executor=broken, event_bus=EventBus())
+    engine.submit("alpha", "ETH", "10")
+    engine.start()
+    deadline = time.monotonic() + 2
+    while engine.execution_errors < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    engine.stop(1)
+
+    assert engine.execution_errors >= 2
+    assert engine.pending_by_bot() == {"alpha": 10}
+    assert "exchange down" in capsys.readouterr().out
@@ -0,0 +1,68 @@
+import io
+from decimal import Decimal
+
+import pytest
+
+from mountain_gorilla.ingest import BulkError, iter_json_array, iter_ndjson
+
+
+def test_json_array_allows_trailing_whitespace():
+    items = list(iter_json_array(io.BytesIO(b' [1, {"a": 2}] \n\t'), chunk_size=3))
+    assert [value for value, _ in items] == [1, {"a": 2}]
+
+
+@pytest.mark.parametrize("body", [b"[1] trailing garbage", b"[1]]", b"[1] [2]"])
+def test_json_array_rejects_content_after_the_closing_bracket(body):
+    with pytest.raises(BulkError):
+        list(iter_json_array(io.BytesIO(body), chunk_size=2))
+
+
+def test_ndjson_reports_an_overlong_line_and_keeps_going():
+    body = b'{"a": 1}\n{"b": "' + b"x" * 100 + b'"}\n{"c": 3}'
+    items = list(iter_ndjson(io.BytesIO(body), max_line=32))
+    assert items[0] == ({"a": 1}, None)
+    assert items[1][0] is None and "longer than 32 bytes" in items[1][1]
+    assert items[2] == ({"c": 3}, None)
+
+
+def test_ndjson_line_at_the_limit_is_accepted():
+    line = b'{"k": "' + b"y" * 24 + b'"}'
+    assert len(line) == 33
+    assert list(iter_ndjson(io.BytesIO(line + b"\n"), max_line=33)) == [({"k": "y" * 24}, None)]
+
+
+def test_json_array_elements_split_across_chunks():
+    body = '[{"a": "x\\\\\\"]}", "b": [1, {"c": null}]}, "é", 12.50, -3, true, [[]]]'.encode()
+    items = [value for value, _ in iter_json_array(io.BytesIO(body), chunk_size=1)]
+    assert items == [{"a": 'x\\"]}', "b": [1, {"c": None}]}, "é", Decimal("12.50"), -3, True, [[]]]
+
+
+def test_json_array_rejects_an_oversized_element_before_reading_it_all():
+    body = io.BytesIO(b'[{"a": 1}, "' + b"x" * 10_000 + b'"]')
+    items = iter_json_array(body, chunk_size=64, max_element=256)
+    assert next(items) == ({"a": 1}, None)
+    with pytest.raises(BulkError, match="longer than 256 bytes"):
+        next(items)
+    assert body.tell() < 1024
+
+
+def test_json_array_element_at_the_limit_is_accepted():
+    element = b'"' + b"y" * 30 + b'"'
+    assert list(iter_json_array(io.BytesIO(b"[" + element + b"]"), chunk_size=4, max_element=32)) == [("y" * 30, None)]
+    with pytest.raises(BulkError):
+        list(iter_json_array(io.BytesIO(b"[" + element[:-1] + b'y"]'), chunk_size=4, max_element=32))
+
+
+def test_json_array_rejects_a_malformed_element_without_reading_the_rest():
+    body = io.BytesIO(b'[{"a": nope}, ' + b", ".join([b'{"b": 2}'] * 10_000) + b"]")
+    with pytest.raises(BulkError, match="Invalid JSON"):
+        list(iter_json_array(body, chunk_size=64))
+    assert body.tell() == 64
+    with pytest.raises(BulkError, match="Invalid JSON"):
+        list(iter_json_array(io.BytesIO(b'[{"a": nope}]')))
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 9))
+def test_json_array_numbers_cut_at_a_chunk_boundary(chunk_size):
+    items = iter_json_array(io.BytesIO(b"[12.50, 1e3, -0.5E-2, 7]"), chunk_size=chunk_size)
+    assert [value for value, _ in items] == [Decimal("12.50"), Decimal("1e3"), Decimal("-0.5E-2"), 7]
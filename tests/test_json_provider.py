@@ -0,0 +1,24 @@
+from decimal import Decimal
+
+from flask import Flask
+
+from mountain_gorilla.json_provider import FastJSONProvider
+
+
+def make_app():
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    return app
+
+
+def test_dicts_with_non_str_keys_fall_back_to_the_stdlib_encoder():
+    app = make_app()
+    with app.app_context():
+        response = app.json.response({2: "b", 1: "a"})
+        assert app.json.loads(response.get_data()) == {"1": "a", "2": "b"}
+        assert app.json.dumps({3: Decimal("1.10"), 1: None}) == '{"1": null, "3": "1.10"}'
+
+
+def test_str_keys_are_sorted_and_decimals_exact():
+    app = make_app()
+    assert app.json.dumpb({"b": Decimal("0.1"), "a": 1}) == b'{"a":1,"b":"0.1"}'
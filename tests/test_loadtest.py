@@ -0,0 +1,32 @@
+import asyncio
+
+from mountain_gorilla.loadtest import HTTPClient
+
+CHUNKED = (b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+           b"5;ext=1\r\nhello\r\n6\r\n world\r\n0\r\nX-Trailer: 1\r\n\r\n")
+PLAIN = b"HTTP/1.1 201 Created\r\nContent-Length: 2\r\n\r\nok"
+
+
+def test_chunked_responses_are_read_to_the_last_chunk_and_keep_the_connection():
+    async def run():
+        responses = iter([CHUNKED, PLAIN])
+
+        async def handle(reader, writer):
+            # Keep the connection open, as a keep-alive server would
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(next(responses))
+                await writer.drain()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        client = HTTPClient("127.0.0.1", server.sockets[0].getsockname()[1])
+        try:
+            first = await asyncio.wait_for(client.send("/"), 2)
+            reader = client._reader
+            second = await asyncio.wait_for(client.send("/"), 2)
+            assert client._reader is reader  # no reconnect between the two
+        finally:
+            client.close()
+            server.close()
+        return first, second
+
+    assert asyncio.run(run()) == (200, 201)
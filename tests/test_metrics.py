@@ -0,0 +1,58 @@
+import json
+import os
+import time
+
+from mountain_gorilla import metrics
+from mountain_gorilla.metrics import Counter, Gauge, Histogram, Registry, mark_process_dead
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def own_snapshot(directory):
+    try:
+        with open(os.path.join(directory, f"{os.getpid()}.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def test_changes_are_flushed_without_another_request(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics, "FLUSH_INTERVAL", 0.05)
+    registry = Registry(str(tmp_path))
+    requests = Counter("requests_total", "Requests.", ("route",), registry=registry)
+
+    requests.inc(route="/a")
+    assert wait_for(lambda: (own_snapshot(tmp_path) or {}).get("requests_total") == [[["/a"], 1.0]])
+
+    requests.inc(2, route="/a")
+    assert wait_for(lambda: own_snapshot(tmp_path)["requests_total"] == [[["/a"], 3.0]])
+
+
+def test_dead_workers_with_a_reused_pid_keep_both_counts(tmp_path):
+    registry = Registry(str(tmp_path))
+    Counter("requests_total", "Requests.", ("route",), registry=registry)
+    Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0), registry=registry)
+    Gauge("in_flight", "In flight.", registry=registry)
+    pid = os.getpid() + 100_000  # not this process
+
+    for count in (3, 4):
+        snapshot = {
+            "requests_total": [[["/a"], float(count)]],
+            "latency_seconds": [[[], [count, 0, 0, 0.05 * count, count]]],
+            "in_flight": [[[], 1.0]],
+        }
+        (tmp_path / f"{pid}.json").write_text(json.dumps(snapshot))
+        mark_process_dead(pid, str(tmp_path))
+
+    assert not (tmp_path / f"{pid}.json").exists()
+    text = registry.render()
+    assert 'requests_total{route="/a"} 7' in text
+    assert "latency_seconds_count 7" in text
+    assert "in_flight 0" not in text and "in_flight 1" not in text
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from mountain_gorilla.gas import GasAnalytics
+
+
+def peaky_history(now):
+    """Three days of readings where the current hour is expensive and the rest cheap"""
+    analytics = GasAnalytics()
+    for hours_ago in range(72, -1, -1):
+        when = now - timedelta(hours=hours_ago)
+        analytics.observe(50.0 if when.hour == now.hour else 20.0, when)
+    return analytics
+
+
+@pytest.fixture
+def security(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # the module builds its vault in the working directory
+    from mountain_gorilla import security
+    monkeypatch.setattr(security.Confirm, "ask", lambda *args, **kwargs: True)
+    monkeypatch.setattr(security.time, "sleep", lambda seconds: None)
+    return security
+
+
+def signer_for(security, tmp_path, gas):
+    vault = security.VaultManager(str(tmp_path / "vault"))
+    vault.store_private_key("main", "0x" + "11" * 32)
+    return security.TransactionSigner(vault, gas=gas, gas_state_path=str(tmp_path / "gas.npz"))
+
+
+def test_signer_restores_persisted_history_and_defers(security, tmp_path):
+    peaky_history(datetime.now()).save(str(tmp_path / "gas.npz"))
+    signer = signer_for(security, tmp_path, GasAnalytics())
+
+    tx_id = signer.create_transaction("main", "0xabc", 1.0, 21000, urgent=False)
+
+    tx = signer.pending_transactions[tx_id]
+    assert tx["status"] == "deferred"
+    assert datetime.fromisoformat(tx["not_before"]) > datetime.now()
+
+
+def test_signer_without_history_or_with_stale_history_does_not_defer(security, tmp_path):
+    signer = signer_for(security, tmp_path, GasAnalytics())
+    tx_id = signer.create_transaction("main", "0xabc", 1.0, 21000, urgent=False)
+    assert signer.pending_transactions[tx_id]["status"] == "pending"
+
+    peaky_history(datetime.now() - timedelta(days=1)).save(str(tmp_path / "gas.npz"))
+    signer = signer_for(security, tmp_path, GasAnalytics())
+    tx_id = signer.create_transaction("main", "0xabc", 1.0, 21000, urgent=False)
+    assert signer.pending_transactions[tx_id]["status"] == "pending"
+
+
+def test_approve_refuses_a_deferred_transaction_before_its_window(security, tmp_path):
+    signer = signer_for(security, tmp_path, peaky_history(datetime.now()))
+    tx_id = signer.create_transaction("main", "0xabc", 1.0, 21000, urgent=False)
+
+    assert not signer.approve_transaction(tx_id)
+    assert tx_id in signer.pending_transactions
+
+    assert signer.approve_transaction(tx_id, force=True)
+    assert signer.transaction_history[-1]["status"] == "signed"
+
+
+def test_approve_signs_a_deferred_transaction_once_its_window_opens(security, tmp_path):
+    signer = signer_for(security, tmp_path, peaky_history(datetime.now()))
+    tx_id = signer.create_transaction("main", "0xabc", 1.0, 21000, urgent=False)
+    signer.pending_transactions[tx_id]["not_before"] = (datetime.now() - timedelta(minutes=1)).isoformat()
+
+    assert signer.approve_transaction(tx_id)
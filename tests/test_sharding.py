@@ -0,0 +1,112 @@
+import pytest
+
+from mountain_gorilla.bot_manager import BotManager
+from mountain_gorilla.events import EventBus
+from mountain_gorilla.sharding import ShardedBotManager, shard_for
+
+NAMES = [f"bot{i}" for i in range(40)]
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    manager = ShardedBotManager(workers=2, db_path=str(tmp_path / "bots.db"))
+    yield manager
+    manager.shutdown(timeout=5)
+
+
+def owners(manager):
+    """Bot name -> id of the worker that actually holds it"""
+    return {name: worker_id
+            for worker_id, names in manager._broadcast("names").items()
+            for name in names}
+
+
+def test_shard_for_is_deterministic_and_covers_every_worker():
+    assignment = {name: shard_for(name, [0, 1, 2]) for name in NAMES}
+    assert assignment == {name: shard_for(name, [2, 0, 1]) for name in NAMES}
+    assert set(assignment.values()) == {0, 1, 2}
+
+
+def test_shard_for_only_moves_bots_of_a_removed_worker():
+    before = {name: shard_for(name, [0, 1, 2]) for name in NAMES}
+    after = {name: shard_for(name, [0, 2]) for name in NAMES}
+    moved = {name for name in NAMES if before[name] != after[name]}
+    assert moved == {name for name in NAMES if before[name] == 1}
+
+
+def test_add_worker_rebalances_to_the_hashed_owner(fleet):
+    for name in NAMES[:12]:
+        assert fleet.deploy_bot(name, "momentum")
+
+    worker_id = fleet.add_worker()
+
+    placement = owners(fleet)
+    assert set(placement) == set(NAMES[:12])
+    assert worker_id in placement.values()
+    for name, holder in placement.items():
+        assert holder == shard_for(name, sorted(fleet.workers))
+
+
+def test_remove_worker_hands_every_bot_to_the_survivors(fleet):
+    for name in NAMES[:12]:
+        fleet.deploy_bot(name, "momentum")
+
+    assert fleet.remove_worker(0)
+
+    assert sorted(fleet.workers) == [1]
+    assert set(owners(fleet)) == set(NAMES[:12])
+    assert set(fleet.snapshot().statuses) == set(NAMES[:12])
+
+
+def test_failed_adopt_keeps_the_bot_on_its_source(fleet):
+    name = next(n for n in NAMES if shard_for(n, [0, 1]) == 0)
+    # The same name on both shards: the owner refuses to adopt the stray copy
+    fleet.workers[0].call("deploy", name, "momentum")
+    fleet.workers[1].call("deploy", name, "eth-dca")
+
+    assert fleet.rebalance() == 0
+
+    assert name in fleet.workers[0].call("names")
+    assert name in fleet.workers[1].call("names")
+
+
+def test_crashed_worker_is_restarted_with_its_bots(fleet):
+    for name in NAMES[:12]:
+        fleet.deploy_bot(name, "momentum")
+    lost = [name for name, holder in owners(fleet).items() if holder == 1]
+
+    fleet.workers[1].process.kill()
+    fleet.workers[1].process.join(5)
+
+    statuses = fleet.snapshot().statuses
+    assert set(statuses) == set(NAMES[:12])
+    assert all(statuses[name].status == "stopped" for name in lost)
+
+
+def test_crashed_worker_never_moves_the_fleet_version_backwards(fleet):
+    for name in NAMES[:6]:
+        fleet.deploy_bot(name, "momentum")
+    before = fleet.snapshot().version
+
+    fleet.workers[0].process.kill()
+    fleet.workers[0].process.join(5)
+
+    assert fleet.snapshot().version > before
+
+
+def test_bots_from_the_unsharded_database_move_onto_their_shards(tmp_path):
+    db_path = str(tmp_path / "bots.db")
+    unsharded = BotManager(db_path, event_bus=EventBus())
+    for name in NAMES[:6]:
+        unsharded.deploy_bot(name, "momentum")
+    unsharded.shutdown()
+
+    manager = ShardedBotManager(workers=2, db_path=db_path)
+    try:
+        placement = owners(manager)
+        assert set(placement) == set(NAMES[:6])
+        for name, holder in placement.items():
+            assert holder == shard_for(name, [0, 1])
+    finally:
+        manager.shutdown(timeout=5)
+    assert BotManager(db_path, event_bus=EventBus()).bots == {}
@@ -0,0 +1,63 @@
+import sys
+import types
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mountain_gorilla.bot_manager import BotManager, PersistedFleet
+from mountain_gorilla.bots.storage import BotStorage
+from mountain_gorilla.events import EventBus
+
+# Statements that run inline: the cache check, and those inside a transaction
+# (which already hold the write lock)
+INLINE = ("PRAGMA data_version", "INSERT INTO items", "INSERT OR IGNORE INTO item_tags",
+          "INSERT OR IGNORE INTO bot_state (name) ", "UPDATE bot_state SET version")
+
+
+@pytest.fixture
+def pool_thread(monkeypatch):
+    """Pretend to run under a patched gevent worker whose hub pool is one thread"""
+    executor = ThreadPoolExecutor(1)
+    hub = types.SimpleNamespace(threadpool=types.SimpleNamespace(
+        apply=lambda fn, args=(): executor.submit(fn, *args).result()))
+    gevent = types.ModuleType("gevent")
+    gevent.get_hub = lambda: hub
+    monkey = types.ModuleType("gevent.monkey")
+    monkey.is_module_patched = lambda name: name == "threading"
+    monkeypatch.setitem(sys.modules, "gevent", gevent)
+    monkeypatch.setitem(sys.modules, "gevent.monkey", monkey)
+    yield executor.submit(threading.get_ident).result()
+    executor.shutdown()
+
+
+def test_storage_reads_and_commits_run_on_the_gevent_pool(tmp_path, pool_thread):
+    storage = BotStorage(str(tmp_path / "state.db"))
+    statements = []
+    storage._connection().set_trace_callback(lambda sql: statements.append((sql, threading.get_ident())))
+
+    storage.ensure_bot("MemoriBot")
+    item_id = storage.add_item("MemoriBot", "memory", {"content": "a"}, tags=["x"])
+    assert storage.get_item("MemoriBot", "memory", item_id)["content"] == "a"
+    assert [item["id"] for item in storage.list_items("MemoriBot", "memory")] == [item_id]
+    assert storage.page_items("MemoriBot", "memory", limit=1)[0][0]["id"] == item_id
+    assert storage.versions()["MemoriBot"] == 1
+
+    outside = [(sql, thread) for sql, thread in statements if not sql.startswith(INLINE)]
+    assert {sql.split()[0] for sql, _ in outside} >= {"SELECT", "BEGIN", "COMMIT", "INSERT"}
+    assert all(thread == pool_thread for _, thread in outside), outside
+
+
+def test_persisted_fleet_reads_on_the_gevent_pool(tmp_path, monkeypatch, pool_thread):
+    manager = BotManager(str(tmp_path / "bots.db"), event_bus=EventBus())
+    manager.deploy_bot("alpha", "momentum")
+    assert manager.shutdown(timeout=5)
+
+    threads = []
+    connect = PersistedFleet._connect
+    monkeypatch.setattr(PersistedFleet, "_connect",
+                        staticmethod(lambda path: threads.append(threading.get_ident()) or connect(path)))
+    fleet = PersistedFleet(str(tmp_path / "bots.db"), refresh_interval=0)
+    assert "alpha" in fleet.snapshot().statuses
+    assert fleet.new_logs() == []
+    assert threads and set(threads) == {pool_thread}
@@ -0,0 +1,108 @@
+import json
+
+from mountain_gorilla.bot_manager import BotManager, PersistedFleet
+from mountain_gorilla.events import EventBus, PRICE, GAS, PORTFOLIO, BOT_STATUS, BOT_TRADE, BOT_LOG
+from mountain_gorilla.streaming import EventStreamer, FeedFollower, FleetBridge, MarketFeed
+
+
+def frames_after_publish(streamer, bus, last_event_id, prices):
+    """Open a stream, publish one price per value, and return the frames up to the live batch"""
+    frames = streamer.stream((PRICE,), last_event_id, batch_window=0, heartbeat=0.1)
+    for price in prices:
+        bus.publish(PRICE, prices={"ETH": price})
+    received = []
+    for frame in frames:
+        received.append(frame)
+        if frame.startswith(": keepalive") or ("event: batch" in frame and len(received) > 1):
+            break
+    frames.close()
+    return received
+
+
+def parse(frame):
+    fields = dict(line.split(": ", 1) for line in frame.strip().splitlines())
+    return fields.get("id"), fields["event"], json.loads(fields["data"])
+
+
+def test_resume_replays_events_after_the_last_id():
+    bus = EventBus()
+    streamer = EventStreamer(event_bus=bus)
+    first = bus.publish(PRICE, prices={"ETH": 1})
+    bus.publish(PRICE, prices={"ETH": 2})
+
+    frames = frames_after_publish(streamer, bus, f"{streamer.epoch}-{first.seq}", [3])
+
+    event_id, name, data = parse(frames[1])
+    assert name == "batch"
+    assert [e["data"]["prices"]["ETH"] for e in data] == [2, 3]
+    assert event_id == f"{streamer.epoch}-{first.seq + 2}"
+
+
+def test_id_from_another_process_resets_and_streams_live():
+    bus = EventBus()
+    streamer = EventStreamer(event_bus=bus)
+    for price in range(5):
+        bus.publish(PRICE, prices={"ETH": price})
+
+    # Another worker (or this one before a restart) issued seq 1000
+    frames = frames_after_publish(streamer, bus, "1.abc-1000", [42])
+
+    assert parse(frames[1])[1] == "reset"
+    event_id, name, data = parse(frames[2])
+    assert name == "batch"
+    assert [e["data"]["prices"]["ETH"] for e in data] == [42]
+    assert event_id.startswith(streamer.epoch + "-")
+
+
+def test_id_newer_than_anything_logged_resets():
+    bus = EventBus()
+    streamer = EventStreamer(event_bus=bus)
+    bus.publish(PRICE, prices={"ETH": 1})
+
+    frames = frames_after_publish(streamer, bus, f"{streamer.epoch}-999", [7])
+
+    assert parse(frames[1])[1] == "reset"
+    assert [e["data"]["prices"]["ETH"] for e in parse(frames[2])[2]] == [7]
+
+
+def test_follower_republishes_each_tick_the_feed_persists(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # the feed's trackers keep their state in the cwd
+    state_path = str(tmp_path / "market.json")
+    feed = MarketFeed(interval=60, event_bus=EventBus(), state_path=state_path)
+    feed.start()
+    feed.stop()
+    bus = EventBus()
+    follower = FeedFollower(state_path, event_bus=bus)
+    subscription = bus.subscribe(("market.*", "portfolio.*"), maxsize=10)
+
+    assert follower.poll()
+    assert not follower.poll()  # nothing new since
+    events = subscription.drain()
+    assert [e.topic for e in events] == [PRICE, GAS, PORTFOLIO]
+    assert events[0].data["prices"] == feed.price_ticker.prices
+    assert events[2].data["total_value"] == feed.portfolio.total_value
+
+    feed._tick()
+    assert follower.poll()
+
+
+def test_fleet_bridge_publishes_what_bot_processes_persist(tmp_path):
+    db_path = str(tmp_path / "bots.db")
+    manager = BotManager(db_path, event_bus=EventBus())
+    manager.deploy_bot("alpha", "momentum")
+    manager.flush()
+    bus = EventBus()
+    bridge = FleetBridge(PersistedFleet(db_path, refresh_interval=0), event_bus=bus)
+    subscription = bus.subscribe(("bot.*",), maxsize=100)
+
+    assert not bridge.poll()  # the fleet as first seen is the baseline
+    manager._update_status("alpha", status="running")
+    manager._record_trade("alpha", "strategy_execution", "Executing momentum")
+    manager.flush()
+    assert bridge.poll()
+    manager.shutdown()
+
+    events = {e.topic: e.data for e in subscription.drain()}
+    assert events[BOT_STATUS]["status"].status == "running"
+    assert events[BOT_TRADE] == {"bot": "alpha", "trades": 1, "pnl": 0.0}
+    assert events[BOT_LOG]["action"] == "strategy_execution"